@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -5,25 +6,26 @@ import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 def create_access_token(data: dict, expires_delta: int = 30):
     try:
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(minutes=expires_delta)
         to_encode.update({"exp": expire})
         encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-        print(f"Token created with secret: {settings.JWT_SECRET[:10]}...")
+        logger.debug("Access token created for %s", data.get("sub"))
         return encoded_jwt
     except Exception as e:
-        print(f"Token creation error: {str(e)}")
+        logger.error("Token creation error: %s", e)
         raise
 
 def verify_token(token: str):
     try:
-        print(f"Verifying token with secret: {settings.JWT_SECRET[:10]}...")
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
         return payload
     except JWTError as e:
-        print(f"Token verification error: {str(e)}")
+        logger.info("Token verification error: %s", e)
         raise
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
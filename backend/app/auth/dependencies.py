@@ -1,16 +1,23 @@
+import logging
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from app.auth.auth import verify_token
+from app.auth.user_cache import UserSnapshot, auth_user_cache
 from app.db.database import get_db
 from app.db.models import User
 
+logger = logging.getLogger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> UserSnapshot:
+    # Aynı token ile gelen istekler JWT çözme ve DB sorgusu yapmadan önbellekten döner
+    cached = auth_user_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
-        print("Raw token:", token)
-        
         payload = verify_token(token)
         username: str = payload.get("sub")
         if username is None:
@@ -20,7 +27,9 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         if user is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
             
-        return user
+        snapshot = UserSnapshot.from_user(user)
+        auth_user_cache.set(token, snapshot, token_exp=payload.get("exp"))
+        return snapshot
     except Exception as e:
-        print("Authentication error:", str(e))
+        logger.info("Authentication error: %s", e)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
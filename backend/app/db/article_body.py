@@ -0,0 +1,134 @@
+# db/article_body.py
+"""Compressed storage for large article bodies.
+
+Bodies of at least ARTICLE_BODY_COMPRESS_THRESHOLD bytes (UTF-8) live
+zlib-compressed in ``article_bodies``; ``articles.content`` is then left
+empty so the hot table keeps small rows. ``Article.content`` hides the
+difference. Existing rows are packed by migration 0003 or by running
+
+    python -m app.db.article_body [--vacuum]
+"""
+import zlib
+from sqlalchemy import text
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+CODEC_ZLIB = "zlib"
+REPACK_BATCH_SIZE = 100
+
+def should_compress(content: str) -> bool:
+    return len(content.encode("utf-8")) >= settings.ARTICLE_BODY_COMPRESS_THRESHOLD
+
+def compress(content: str):
+    """Return ``(codec, data)`` for ``content``."""
+    return CODEC_ZLIB, zlib.compress(content.encode("utf-8"), settings.ARTICLE_BODY_COMPRESS_LEVEL)
+
+def decompress(codec: str, data: bytes) -> str:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    raise ValueError(f"Unknown article body codec: {codec}")
+
+def read_text_prefix(codec: str, data: bytes, max_chars: int) -> str:
+    """Return about the first ``max_chars`` characters of a packed body without decompressing the rest."""
+    if codec != CODEC_ZLIB:
+        raise ValueError(f"Unknown article body codec: {codec}")
+    # UTF-8 karakter başına en fazla 4 bayt; sonda yarım kalan karakter atılır
+    raw = zlib.decompressobj().decompress(data, max_chars * 4)
+    return raw.decode("utf-8", errors="ignore")[:max_chars]
+
+def set_article_content(article, content: str):
+    """Store ``content`` inline or in the compressed side table, whichever fits its size."""
+    from app.db.models import ArticleBody
+
+    content = content or ""
+    if not should_compress(content):
+        # delete-orphan: eski sıkıştırılmış gövde silinir
+        article.body = None
+        article._content = content
+        return
+    codec, data = compress(content)
+    if article.body is None:
+        article.body = ArticleBody(codec=codec, data=data, length=len(content))
+    else:
+        article.body.codec = codec
+        article.body.data = data
+        article.body.length = len(content)
+    article._content = ""
+
+def repack_article_bodies(conn, batch_size: int = REPACK_BATCH_SIZE, commit_each_batch: bool = False) -> int:
+    """Move inline bodies over the threshold into ``article_bodies``; returns the number moved.
+
+    Core-only, like the frozen copy in migration 0003; ``updated_at`` is
+    left untouched, so cached PDFs and ETags stay valid.
+    """
+    total = 0
+    last_id = 0
+    while True:
+        # Bayt eşiğinin altındaki satırlar karakter uzunluğuyla zaten elenir
+        rows = conn.execute(
+            text(
+                "SELECT id, content FROM articles "
+                "WHERE id > :last_id AND length(content) * 4 >= :threshold ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "threshold": settings.ARTICLE_BODY_COMPRESS_THRESHOLD, "limit": batch_size}
+        ).fetchall()
+        if not rows:
+            return total
+        packed = []
+        for row in rows:
+            if should_compress(row.content):
+                codec, data = compress(row.content)
+                packed.append({"id": row.id, "codec": codec, "data": data, "length": len(row.content)})
+        if packed:
+            conn.execute(
+                text(
+                    "INSERT INTO article_bodies (article_id, codec, data, length) "
+                    "VALUES (:id, :codec, :data, :length)"
+                ),
+                packed
+            )
+            conn.execute(text("UPDATE articles SET content = '' WHERE id = :id"), [{"id": p["id"]} for p in packed])
+        if commit_each_batch:
+            conn.commit()
+        total += len(packed)
+        last_id = rows[-1].id
+
+def iter_article_texts(conn, batch_size: int = REPACK_BATCH_SIZE):
+    """Yield ``(id, title, content)`` for every article, decompressing packed bodies.
+
+    Core-only like ``repack_article_bodies``, for the index rebuild commands.
+    """
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                "SELECT a.id, a.title, a.content, b.codec, b.data FROM articles a "
+                "LEFT JOIN article_bodies b ON b.article_id = a.id "
+                "WHERE a.id > :last_id ORDER BY a.id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size}
+        ).fetchall()
+        if not rows:
+            return
+        for row in rows:
+            content = decompress(row.codec, row.data) if row.codec else row.content
+            yield row.id, row.title, content
+        last_id = rows[-1].id
+
+if __name__ == "__main__":
+    # Eşik değiştirildikten sonra mevcut satırları yeniden paketlemek için
+    import argparse
+    from app.db.database import engine
+
+    parser = argparse.ArgumentParser(description="Move large article bodies into compressed storage")
+    parser.add_argument("--vacuum", action="store_true", help="run VACUUM afterwards to shrink the SQLite file")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        count = repack_article_bodies(conn, commit_each_batch=True)
+    print(f"Article bodies repacked: {count} articles")
+    if args.vacuum and engine.dialect.name == "sqlite":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+        print("VACUUM done")
@@ -0,0 +1,86 @@
+# db/article_metadata.py
+"""Excerpt, word count, reading time, content length and content hash stored on Article.
+
+List queries read these columns instead of scanning ``content``; the PDF and
+GPT caches use ``content_hash`` as the article version. They are set on
+every write path through ``apply_article_metadata``; existing rows are
+filled by migrations 0002 and 0008, or the counts by running
+
+    python -m app.db.article_metadata
+"""
+import hashlib
+import math
+import re
+from sqlalchemy import text
+
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+BACKFILL_BATCH_SIZE = 500
+
+_WORD = re.compile(r"\S+")
+
+def compute_article_metadata(content: str) -> dict:
+    content = content or ""
+    word_count = sum(1 for _ in _WORD.finditer(content))
+    return {
+        "excerpt": content[:EXCERPT_LENGTH],
+        "word_count": word_count,
+        "reading_time": math.ceil(word_count / WORDS_PER_MINUTE),
+        "content_length": len(content)
+    }
+
+def compute_content_hash(title: str, content: str) -> str:
+    digest = hashlib.sha1()
+    digest.update((title or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((content or "").encode("utf-8"))
+    return digest.hexdigest()
+
+def article_content_hash(article) -> str:
+    # Hash'i henüz yazılmamış satırlar için yerinde hesaplanır
+    return article.content_hash or compute_content_hash(article.title, article.content)
+
+def apply_article_metadata(article):
+    """Recompute every stored field; call whenever the title or content changes."""
+    for name, value in compute_article_metadata(article.content).items():
+        setattr(article, name, value)
+    article.content_hash = compute_content_hash(article.title, article.content)
+
+def backfill_article_metadata(conn, batch_size: int = BACKFILL_BATCH_SIZE, commit_each_batch: bool = False) -> int:
+    """Fill the metadata columns of rows that have none, ``batch_size`` rows per statement.
+
+    Works on a Core connection, like the frozen copy in migration 0002;
+    ``updated_at`` is left untouched. With ``commit_each_batch`` every batch
+    is its own transaction, so the write lock is released between batches.
+    """
+    total = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                "SELECT id, content FROM articles "
+                "WHERE content_length IS NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size}
+        ).fetchall()
+        if not rows:
+            return total
+        conn.execute(
+            text(
+                "UPDATE articles SET excerpt = :excerpt, word_count = :word_count, "
+                "reading_time = :reading_time, content_length = :content_length WHERE id = :id"
+            ),
+            [{"id": row.id, **compute_article_metadata(row.content)} for row in rows]
+        )
+        if commit_each_batch:
+            conn.commit()
+        total += len(rows)
+        last_id = rows[-1].id
+
+if __name__ == "__main__":
+    # Migration sonrası eklenen/eksik kalan satırlar için tekrar çalıştırılabilir
+    from app.db.database import engine
+
+    with engine.connect() as conn:
+        count = backfill_article_metadata(conn, commit_each_batch=True)
+    print(f"Article metadata backfilled: {count} articles")
@@ -0,0 +1,261 @@
+# db/chunk_index.py
+# Uzun makaleler yazma anında parçalara bölünür, ama parça metni kopyalanmaz:
+# article_chunks her parçanın gövdedeki [start_offset, end_offset) aralığını ve
+# terim sayısını, article_chunk_terms ise (makale, terim) başına parça bazında
+# terim frekanslarını (varint ile kodlanmış postings) tutar. Sohbet sırasında
+# sadece sorudaki terimlerin satırları okunur, bm25 bu istatistiklerle
+# hesaplanır ve seçilen parçalar gövdeden dilimlenir. Token bütçesine zaten
+# sığan makaleler bütün gönderildiği için hiç indekslenmez.
+import math
+import re
+import unicodedata
+from collections import Counter
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal, read_engine
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+CHUNK_TABLE = "article_chunks"
+TERM_TABLE = "article_chunk_terms"
+CHARS_PER_TOKEN = 4
+
+# bm25 parametreleri (FTS5 varsayılanlarıyla aynı)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD = re.compile(r"\w+")
+_TOKEN = re.compile(r"\S+")
+# SQLite metinleri UTF-8 bayt sırasıyla karşılaştırır; bu, en büyük kod noktası
+_MAX_CHAR = "\U0010ffff"
+
+def estimate_tokens(value: str) -> int:
+    return len(value) // CHARS_PER_TOKEN + 1
+
+def chunk_spans(content: str, chunk_tokens: int = None):
+    """Return ``(start, end)`` offsets of roughly ``chunk_tokens``-token chunks.
+
+    Chunks end on word boundaries; a line break ends the chunk once it is at
+    least half full, so paragraphs stay together where possible.
+    """
+    content = content or ""
+    max_chars = (chunk_tokens or settings.CHAT_CHUNK_TOKENS) * CHARS_PER_TOKEN
+    spans = []
+    start = end = None
+    for match in _TOKEN.finditer(content):
+        if start is not None:
+            if match.end() - start > max_chars or (
+                end - start > max_chars // 2 and "\n" in content[end:match.start()]
+            ):
+                spans.append((start, end))
+                start = None
+        if start is None:
+            start = match.start()
+        end = match.end()
+    if start is not None:
+        spans.append((start, end))
+    return spans
+
+def chunk_text(content: str, chunk_tokens: int = None):
+    return [content[start:end] for start, end in chunk_spans(content, chunk_tokens)]
+
+def _terms(value: str):
+    # FTS5 'unicode61 remove_diacritics' gibi: küçük harf, aksanlar atılır
+    value = unicodedata.normalize("NFKD", (value or "").lower())
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return _WORD.findall(value)
+
+def encode_postings(postings) -> bytes:
+    # (position, tf) çiftleri; position farkları ve tf'ler varint olarak yazılır
+    out = bytearray()
+    previous = 0
+    for position, count in postings:
+        for value in (position - previous, count):
+            while value > 0x7F:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = position
+    return bytes(out)
+
+def decode_postings(data: bytes):
+    values, value, shift = [], 0, 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value, shift = 0, 0
+    position = 0
+    for index in range(0, len(values), 2):
+        position += values[index]
+        yield position, values[index + 1]
+
+def build_chunk_rows(article_id: int, content: str):
+    """Return ``(chunk_rows, term_rows)`` for one article; pure CPU, no database access.
+
+    Articles that fit in GPT_CONTEXT_TOKEN_BUDGET get no rows.
+    """
+    content = content or ""
+    if estimate_tokens(content) <= settings.GPT_CONTEXT_TOKEN_BUDGET:
+        return [], []
+    chunk_rows, postings = [], {}
+    for position, (start, end) in enumerate(chunk_spans(content)):
+        counts = Counter(_terms(content[start:end]))
+        chunk_rows.append({
+            "article_id": article_id,
+            "position": position,
+            "start_offset": start,
+            "end_offset": end,
+            "term_count": sum(counts.values())
+        })
+        for term, count in counts.items():
+            postings.setdefault(term, []).append((position, count))
+    term_rows = [
+        {"article_id": article_id, "term": term, "postings": encode_postings(items)}
+        for term, items in postings.items()
+    ]
+    return chunk_rows, term_rows
+
+_INSERT_CHUNK = text(
+    f"INSERT INTO {CHUNK_TABLE} (article_id, position, start_offset, end_offset, term_count) "
+    "VALUES (:article_id, :position, :start_offset, :end_offset, :term_count)"
+)
+_INSERT_TERM = text(f"INSERT INTO {TERM_TABLE} (article_id, term, postings) VALUES (:article_id, :term, :postings)")
+
+def write_chunk_rows(db, rows):
+    # Session veya Core bağlantısı olabilir
+    chunk_rows, term_rows = rows
+    if chunk_rows:
+        db.execute(_INSERT_CHUNK, chunk_rows)
+    if term_rows:
+        db.execute(_INSERT_TERM, term_rows)
+
+def index_article_chunks(db: Session, article, rows=None):
+    """Replace the article's chunk rows; ``rows`` may be prebuilt with build_chunk_rows."""
+    remove_article_chunks(db, article.id)
+    write_chunk_rows(db, rows if rows is not None else build_chunk_rows(article.id, article.content))
+
+def remove_article_chunks(db: Session, article_id: int):
+    for table in (TERM_TABLE, CHUNK_TABLE):
+        db.execute(text(f"DELETE FROM {table} WHERE article_id = :article_id"), {"article_id": article_id})
+
+def fill_chunk_index(conn) -> int:
+    """Index every article into empty chunk tables; returns the number of articles read."""
+    from app.db.article_body import iter_article_texts
+
+    count = 0
+    for article_id, _, content in iter_article_texts(conn):
+        write_chunk_rows(conn, build_chunk_rows(article_id, content))
+        count += 1
+    return count
+
+def rebuild_chunk_index(engine) -> int:
+    with engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {TERM_TABLE}"))
+        conn.execute(text(f"DELETE FROM {CHUNK_TABLE}"))
+        return fill_chunk_index(conn)
+
+def get_article_chunks(db: Session, article_id: int):
+    # Birincil anahtar aralığı: sadece bu makalenin satırları okunur
+    return db.execute(
+        text(
+            f"SELECT position, start_offset, end_offset, term_count FROM {CHUNK_TABLE} "
+            "WHERE article_id = :article_id ORDER BY position"
+        ),
+        {"article_id": article_id}
+    ).all()
+
+_EXACT_TERMS = text(
+    f"SELECT term, postings FROM {TERM_TABLE} WHERE article_id = :article_id AND term IN :terms"
+).bindparams(bindparam("terms", expanding=True))
+_PREFIX_TERMS = text(
+    f"SELECT term, postings FROM {TERM_TABLE} "
+    "WHERE article_id = :article_id AND term >= :prefix AND term < :upper"
+)
+
+def question_term_frequencies(db: Session, article_id: int, question: str):
+    """Return one ``{position: tf}`` dict per question word.
+
+    Only the postings of the question's words are read. The last word also
+    matches as a prefix, like the search box.
+    """
+    terms = list(dict.fromkeys(_terms(question)))
+    if not terms:
+        return []
+    *exact, prefix = terms
+    frequencies = {term: Counter() for term in terms}
+    if exact:
+        for row in db.execute(_EXACT_TERMS, {"article_id": article_id, "terms": exact}):
+            frequencies[row.term].update(dict(decode_postings(row.postings)))
+    for row in db.execute(_PREFIX_TERMS, {"article_id": article_id, "prefix": prefix, "upper": prefix + _MAX_CHAR}):
+        frequencies[prefix].update(dict(decode_postings(row.postings)))
+    return list(frequencies.values())
+
+def rank_chunks(chunks, term_frequencies, limit: int):
+    """Rank chunk positions by bm25; statistics come from this article's chunks only."""
+    if not chunks:
+        return []
+    lengths = {chunk.position: chunk.term_count for chunk in chunks}
+    avg_length = sum(lengths.values()) / len(lengths) or 1.0
+    scores = Counter()
+    for frequencies in term_frequencies:
+        df = len(frequencies)
+        if not df:
+            continue
+        idf = math.log((len(lengths) - df + 0.5) / (df + 0.5) + 1)
+        for position, tf in frequencies.items():
+            length = lengths.get(position, avg_length)
+            scores[position] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [position for position, _ in ranked[:limit]]
+
+def select_context(db: Session, article, question: str, token_budget: int = None, top_k: int = None) -> str:
+    """Return the part of the article to send to GPT for ``question``.
+
+    Short articles are sent whole. Longer ones send the top-k chunks ranked by
+    bm25 against the question, in article order, within ``token_budget``; if
+    nothing matches (e.g. "özetle"), the opening chunks are used instead.
+    """
+    token_budget = token_budget or settings.GPT_CONTEXT_TOKEN_BUDGET
+    top_k = top_k or settings.GPT_CONTEXT_TOP_K
+    content = article.content or ""
+    if estimate_tokens(content) <= token_budget:
+        return content
+
+    chunks = get_article_chunks(db, article.id)
+    if chunks:
+        spans = {chunk.position: (chunk.start_offset, chunk.end_offset) for chunk in chunks}
+        ranked = rank_chunks(chunks, question_term_frequencies(db, article.id, question), top_k)
+    else:
+        # Henüz indekslenmemiş (veya replikaya ulaşmamış) makale
+        spans = dict(enumerate(chunk_spans(content)))
+        ranked = []
+    if not ranked:
+        ranked = sorted(spans)[:top_k]
+
+    selected, used = [], 0
+    for position in ranked:
+        start, end = spans[position]
+        cost = (end - start) // CHARS_PER_TOKEN + 1
+        if used + cost > token_budget:
+            continue
+        selected.append((start, end))
+        used += cost
+    selected.sort()
+    return "\n...\n".join(content[start:end] for start, end in selected)
+
+def load_chat_context(article, question: str) -> str:
+    """select_context on its own sync session, for ``asyncio.to_thread`` in async routes."""
+    with SessionLocal(bind=read_engine) as db:
+        return select_context(db, article, question)
+
+if __name__ == "__main__":
+    # CHAT_CHUNK_TOKENS veya GPT_CONTEXT_TOKEN_BUDGET değiştirildikten sonra:
+    #   python -m app.db.chunk_index
+    from app.db.database import engine
+
+    count = rebuild_chunk_index(engine)
+    print(f"Chunk index rebuilt: {count} articles indexed")
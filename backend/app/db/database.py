@@ -1,5 +1,8 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -7,14 +10,117 @@ from config import settings
 
 Base = declarative_base()
 
-# echo=True debug amaçlı kullanılır. Prod'da False yapın.
-engine = create_engine(settings.DATABASE_URL, echo=True, future=True)
+def engine_options(url: str) -> dict:
+    """Pool and driver options from the Settings engine profile."""
+    options = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+    database_url = make_url(url)
+    if database_url.get_backend_name() == "sqlite" and database_url.database in (None, "", ":memory:"):
+        # Bellek içi SQLite tek bağlantılı havuz kullanır
+        return options
+    options.update(
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT
+    )
+    return options
+
+def apply_sqlite_pragmas(sync_engine):
+    """Set WAL, synchronous, mmap_size and busy_timeout on every new SQLite connection."""
+    if sync_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+            # Kilitli veritabanında hemen "database is locked" yerine bu kadar bekle
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        finally:
+            cursor.close()
+
+def _create_engine(url: str):
+    new_engine = create_engine(url, **engine_options(url))
+    apply_sqlite_pragmas(new_engine)
+    return new_engine
+
+engine = _create_engine(settings.DATABASE_URL)
+# Replika yoksa okumalar da birincil engine'e gider
+read_engine = _create_engine(settings.READ_REPLICA_DATABASE_URL) if settings.READ_REPLICA_DATABASE_URL else engine
+
+class RoutingSession(Session):
+    """Sends SELECTs to the read replica and everything else to the primary.
+
+    The session is pinned to the primary once it has pending changes
+    (``new``/``dirty``/``deleted``) or has executed a non-SELECT statement
+    or flushed; from then on it reads its own writes. A session whose reads
+    must not lag behind its own later writes is pinned up front with
+    ``use_primary()``; ``get_db`` does that for every non-GET request.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.info.get("primary"):
+            return engine
+        pending = self.new or self.dirty or self.deleted
+        if not pending and clause is not None and getattr(clause, "is_select", False):
+            return read_engine
+        # Bekleyen değişiklik, flush (clause yok) veya DML/DDL: bundan sonra hep birincil
+        self.info["primary"] = True
+        return engine
+
+def use_primary(db: Session) -> Session:
+    """Pin ``db`` to the primary for the rest of its life (harmless on a plain Session)."""
+    db.info["primary"] = True
+    return db
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+RoutingSessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=RoutingSession)
+
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
 
 # Dependency olarak kullanacağımız fonksiyon.
-def get_db():
-    db = SessionLocal()
+# Replika tanımlıysa sadece okuma isteklerinin (GET/HEAD) SELECT'leri replikaya gider;
+# yazan isteklerde önce okunup sonra güncellenen satırlar da birincilden okunur.
+def get_db(request: Request):
+    db = RoutingSessionLocal() if read_engine is not engine else SessionLocal()
+    if request.method not in READ_ONLY_METHODS:
+        use_primary(db)
     try:
         yield db
     finally:
         db.close()
+
+# Async sürücü karşılıkları. async def rotalar bu oturumları kullanır ki
+# sorgular event loop'u bloklamasın.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "mssql+pyodbc": "mssql+aioodbc",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def get_async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+ASYNC_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_URL, **engine_options(ASYNC_URL))
+apply_sqlite_pragmas(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# async def rotalar için dependency.
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,120 @@
+# db/explain.py
+"""Dump EXPLAIN QUERY PLAN for the repository read paths.
+
+    python -m app.db.explain
+
+Every repository read function is called once against the configured SQLite
+database inside a transaction that is rolled back. The SELECT statements it
+issues are captured and explained with the same parameters. Plan steps that
+scan a whole table (``SCAN <table>`` without an index) are marked FULL SCAN
+and make the command exit with status 1, unless the scenario is listed in
+EXPECTED_FULL_SCANS.
+"""
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.db.database import engine
+from app.db.models import Article, User
+from app.db.pagination import encode_cursor
+from app.db.repositories import article_repository, blob_outbox_repository, category_repository, user_repository
+from app.db.repositories.saved_article_repository import SavedArticleRepository
+from app.db.search import search_articles
+from app.db.chunk_index import question_term_frequencies, select_context
+from app.services.saved_state_cache import saved_state_cache
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+# Bilerek tüm tabloyu okuyan sorgular (küçük tablolar)
+EXPECTED_FULL_SCANS = {"list_categories", "blob outbox get_outbox_stats"}
+
+def _scenarios(db: Session):
+    user = db.query(User).first()
+    article = db.query(Article).first()
+    user_id = user.id if user else 1
+    cursor = encode_cursor(datetime.now(timezone.utc), 2 ** 31)
+
+    def saved_ids():
+        # Önbellekten değil veritabanından okunsun
+        saved_state_cache.invalidate_user(user_id)
+        return SavedArticleRepository(db).get_saved_ids(user_id)
+
+    scenarios = [
+        ("get_articles_by_user", lambda: article_repository.get_articles_by_user(db, user_id)),
+        ("get_articles_by_user (cursor)", lambda: article_repository.get_articles_by_user(db, user_id, cursor=cursor)),
+        ("get_feed", lambda: article_repository.get_feed(db, user_id)),
+        ("get_feed (cursor)", lambda: article_repository.get_feed(db, user_id, cursor=cursor)),
+        ("get_article", lambda: article_repository.get_article(db, article.id if article else 1)),
+        ("get_trending_candidates", lambda: article_repository.get_trending_candidates(db, datetime.now(timezone.utc) - timedelta(days=7))),
+        ("get_article_cards", lambda: article_repository.get_article_cards(db, [article.id if article else 1])),
+        ("search_articles", lambda: search_articles(db, "makale", limit=20)),
+        ("saved get_saved_articles", lambda: SavedArticleRepository(db).get_saved_articles(user_id)),
+        ("saved get_saved_articles (cursor)", lambda: SavedArticleRepository(db).get_saved_articles(user_id, cursor=cursor)),
+        ("saved get_saved_ids", saved_ids),
+        ("get_user_by_username", lambda: user_repository.get_user_by_username(db, user.username if user else "")),
+        ("get_user_by_email", lambda: user_repository.get_user_by_email(db, user.email if user else "")),
+        ("get_user_by_id", lambda: user_repository.get_user_by_id(db, user_id)),
+        ("list_categories", lambda: category_repository.list_categories(db)),
+        ("blob outbox get_due_entries", lambda: blob_outbox_repository.get_due_entries(db, limit=16)),
+        ("blob outbox get_outbox_stats", lambda: blob_outbox_repository.get_outbox_stats(db)),
+    ]
+    if article is not None:
+        scenarios.append(("select_context", lambda: select_context(db, article, "makale özeti", token_budget=1)))
+        scenarios.append(("question_term_frequencies", lambda: question_term_frequencies(db, article.id, "makale özeti")))
+    return scenarios
+
+def explain_queries():
+    """Return ``[(scenario, statement, plan_rows)]`` for every captured SELECT."""
+    if engine.dialect.name != "sqlite":
+        raise RuntimeError("EXPLAIN QUERY PLAN is only available on SQLite")
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")) and not executemany:
+            captured.append((statement, parameters))
+
+    results = []
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        db = Session(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            for name, run in _scenarios(db):
+                captured.clear()
+                event.listen(conn, "before_cursor_execute", capture)
+                try:
+                    run()
+                finally:
+                    event.remove(conn, "before_cursor_execute", capture)
+                seen = set()
+                for statement, parameters in list(captured):
+                    if statement in seen:
+                        continue
+                    seen.add(statement)
+                    plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+                    results.append((name, statement, [row[3] for row in plan]))
+        finally:
+            db.close()
+            transaction.rollback()
+    return results
+
+def main() -> int:
+    full_scans = 0
+    for name, statement, plan in explain_queries():
+        print(f"== {name}")
+        print(" ".join(statement.split()))
+        for step in plan:
+            flag = ""
+            if FULL_SCAN.match(step):
+                if name in EXPECTED_FULL_SCANS:
+                    flag = "  (full scan, expected)"
+                else:
+                    flag = "  <-- FULL SCAN"
+                    full_scans += 1
+            print(f"   {step}{flag}")
+        print()
+    print(f"{full_scans} full table scan(s)")
+    return 1 if full_scans else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
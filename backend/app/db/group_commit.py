@@ -0,0 +1,144 @@
+# db/group_commit.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+from .database import SessionLocal
+
+class GroupCommitWriter:
+    """Runs small writes from many requests in shared transactions.
+
+    ``submit(op)`` queues ``op(db)``; a single writer thread collects the ops
+    arriving within ``max_delay_ms`` of the first one (up to ``max_batch``),
+    runs them in one session and commits once. Each caller's future resolves
+    with its op's return value after that commit. If anything in a batch
+    fails, the batch is rolled back and its ops are retried one transaction
+    each, so a bad op only fails its own caller.
+
+    Ops must not commit themselves; flushing is fine.
+    """
+
+    def __init__(self, session_factory, max_delay_ms: float, max_batch: int):
+        self.session_factory = session_factory
+        self.max_delay = max_delay_ms / 1000
+        self.max_batch = max_batch
+        self.batches = 0
+        self.ops = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, op) -> Future:
+        future = Future()
+        self._ensure_started()
+        self._queue.put((op, future))
+        return future
+
+    def run(self, op):
+        """Submit ``op`` and wait for its batch to commit."""
+        return self.submit(op).result()
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=5)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "ops": self.ops,
+                "avg_batch": self.ops / self.batches if self.batches else 0.0
+            }
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            stopping = False
+            # İlk yazıdan sonra max_delay boyunca gelenleri aynı transaction'a topla
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    # Kuyrukta bekleyenler her durumda alınır, yenileri için en fazla max_delay beklenir
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+            if stopping:
+                return
+
+    def _commit_batch(self, batch):
+        batch = [(op, future) for op, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        with self.session_factory() as db:
+            try:
+                results = [op(db) for op, _ in batch]
+                db.commit()
+            except Exception:
+                db.rollback()
+            else:
+                with self._lock:
+                    self.batches += 1
+                    self.ops += len(batch)
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+                return
+
+        # Toplu commit başarısız: her işi kendi transaction'ında tekrar dene
+        for op, future in batch:
+            with self.session_factory() as db:
+                try:
+                    result = op(db)
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    future.set_exception(e)
+                else:
+                    with self._lock:
+                        self.batches += 1
+                        self.ops += 1
+                    future.set_result(result)
+
+_writer = None
+_writer_lock = threading.Lock()
+
+def get_group_commit_writer():
+    """Shared writer on the primary database, or None unless GROUP_COMMIT_ENABLED."""
+    global _writer
+    if not settings.GROUP_COMMIT_ENABLED:
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = GroupCommitWriter(
+                lambda: SessionLocal(expire_on_commit=False),
+                max_delay_ms=settings.GROUP_COMMIT_MAX_DELAY_MS,
+                max_batch=settings.GROUP_COMMIT_MAX_BATCH
+            )
+        return _writer
+
+def shutdown_group_commit_writer():
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
@@ -1,8 +1,19 @@
 # db/models.py
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Index, LargeBinary, func
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from .database import Base
 
+# SQLite'ta func.now() 'YYYY-MM-DD HH:MM:SS' yazar. Bind parametreleri de aynı biçimde
+# yazılsın ki (created_at, id) üzerindeki keyset karşılaştırmaları doğru sonuç versin.
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite"
+)
+
 class User(Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True, index=True)
@@ -21,6 +32,8 @@ class Category(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, index=True)
     description = Column(Text)
+    # Makale sayısı yazım yollarında artırılıp azaltılır (category_repository.adjust_article_count)
+    article_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -28,24 +41,131 @@ class Category(Base):
 
 class Article(Base):
     __tablename__ = "articles"
+    # Sıcak yollar: yazarın makaleleri ve feed (created_at, id) sıralı keyset ile gezilir.
+    # İndeks değişiklikleri migrations/versions altında da yer almalı.
+    __table_args__ = (
+        Index("ix_articles_author_created", "author_id", "created_at", "id"),
+        Index("ix_articles_category_id", "category_id"),
+        Index("ix_articles_created_at", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
-    content = Column(Text, nullable=False)
+    # Büyük gövdeler sıkıştırılmış olarak article_bodies'te durur, bu kolon o zaman boştur.
+    # Kod her zaman Article.content'i kullanır (app/db/article_body.py).
+    _content = Column("content", Text, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"))
     category_id = Column(Integer, ForeignKey("categories.id"))
     blob_filename = Column(String(255))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    blob_hash = Column(String(64), nullable=True)  # son yüklenen blob içeriğinin sha256'sı
+    # Yazım sırasında hesaplanır (app/db/article_metadata.py); listeler content'i okumaz
+    excerpt = Column(String(300), nullable=True)
+    word_count = Column(Integer, nullable=True)
+    reading_time = Column(Integer, nullable=True)  # dakika
+    content_length = Column(Integer, nullable=True)
+    content_hash = Column(String(40), nullable=True)  # başlık + içerik sha1'i; PDF/GPT önbellek sürümü
+    # Kaydetme sayısı save/unsave ile aynı transaction'da güncellenir (trending sıralaması için)
+    save_count = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, onupdate=func.now())
 
     author = relationship("User", back_populates="articles")
     category = relationship("Category", back_populates="articles")
+    # selectin: async oturumlarda da content erişimi ek lazy-load gerektirmez
+    body = relationship("ArticleBody", uselist=False, lazy="selectin", cascade="all, delete-orphan")
+
+    @hybrid_property
+    def content(self):
+        if self.body is not None:
+            return self.body.text
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        from .article_body import set_article_content
+
+        set_article_content(self, value)
+
+    @content.expression
+    def content(cls):
+        # SQL tarafında sadece satır içi gövde görünür; sıkıştırılmış gövdeler için boş string
+        return cls._content
+
+class ArticleBody(Base):
+    __tablename__ = "article_bodies"
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    codec = Column(String(10), nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    length = Column(Integer, nullable=False)  # açılmış metnin karakter sayısı
+
+    @property
+    def text(self) -> str:
+        # Aynı veri için tekrar tekrar açmamak adına son sonuç saklanır
+        cached = self.__dict__.get("_text_cache")
+        if cached is None or cached[0] is not self.data:
+            from .article_body import decompress
+
+            cached = (self.data, decompress(self.codec, self.data))
+            self.__dict__["_text_cache"] = cached
+        return cached[1]
+
+class ArticleChunk(Base):
+    # Sohbet bağlamı için makale parçaları; (article_id, position) ile makale bazında okunur
+    __tablename__ = "article_chunks"
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    # Metin kopyalanmaz; parça gövdedeki [start_offset, end_offset) aralığıdır
+    start_offset = Column(Integer, nullable=False)
+    end_offset = Column(Integer, nullable=False)
+    term_count = Column(Integer, nullable=False)
+
+class ArticleChunkTerm(Base):
+    # Makale bazında ters indeks: terimin geçtiği parçalar ve frekansları (varint)
+    __tablename__ = "article_chunk_terms"
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    term = Column(String, primary_key=True)
+    postings = Column(LargeBinary, nullable=False)
 
 class SavedArticle(Base):
     __tablename__ = "saved_articles"
+    # Aynı makale iki kez kaydedilemez; kullanıcı bazlı sorgular da bu indeksi kullanır
+    __table_args__ = (
+        Index("ix_saved_articles_user_article", "user_id", "article_id", unique=True),
+        Index("ix_saved_articles_user_saved", "user_id", "saved_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     article_id = Column(Integer, ForeignKey("articles.id"))
-    saved_at = Column(DateTime(timezone=True), server_default=func.now())
+    saved_at = Column(Timestamp, server_default=func.now())
 
     user = relationship("User", backref="saved_articles")
     article = relationship("Article", backref="saved_by_users")
+
+class UploadJob(Base):
+    __tablename__ = "upload_jobs"
+    id = Column(String(36), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    file_name = Column(String(255))
+    status = Column(String(20), nullable=False, default="pending")
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(Timestamp, server_default=func.now())
+    # Çalışan işte heartbeat ile yenilenir (kira süresi: UPLOAD_JOB_LEASE_SECONDS)
+    updated_at = Column(Timestamp, onupdate=func.now())
+
+class BlobOutbox(Base):
+    # Blob yazımları için write-behind kuyruğu; her blob için tek bekleyen satır tutulur
+    __tablename__ = "blob_outbox"
+    id = Column(Integer, primary_key=True, index=True)
+    blob_filename = Column(String(255), unique=True, nullable=False)
+    operation = Column(String(10), nullable=False)  # "upload" | "delete"
+    article_id = Column(Integer, nullable=True)
+    user_id = Column(Integer, nullable=False)
+    original_filename = Column(String(255), nullable=True)
+    version = Column(Integer, nullable=False, default=1)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(Timestamp, nullable=False, index=True)
+    locked_until = Column(Timestamp, nullable=True)
+    # BLOB_OUTBOX_MAX_ATTEMPTS aşılınca dolar; bu satır artık işlenmez (dead-letter)
+    dead_at = Column(Timestamp, nullable=True)
+    created_at = Column(Timestamp, server_default=func.now())
@@ -0,0 +1,65 @@
+# db/pagination.py
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def clamp_limit(limit: int) -> int:
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    # Cursor istemci için opak: (created_at, id) çifti base64 ile paketlenir
+    raw = json.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (datetime.fromisoformat(created_at) if created_at else None), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def keyset_query(query, created_col, id_col, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None):
+    """Add the cursor filter, newest-first order and ``limit + 1`` to ``query``.
+
+    Works on an ORM ``Query`` as well as a 2.0 ``select()``; returns
+    ``(query, limit)`` with the clamped limit for ``keyset_result``.
+    """
+    limit = clamp_limit(limit)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        if created_at is None:
+            query = query.filter(created_col.is_(None), id_col < row_id)
+        else:
+            query = query.filter(or_(
+                created_col < created_at,
+                and_(created_col == created_at, id_col < row_id),
+                created_col.is_(None)
+            ))
+    return query.order_by(created_col.desc(), id_col.desc()).limit(limit + 1), limit
+
+def keyset_result(rows, limit: int, key=None):
+    """Trim the extra row fetched by ``keyset_query``; returns ``(rows, next_cursor)``."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(*(key(last) if key else (last.created_at, last.id)))
+    return rows, next_cursor
+
+def keyset_page(query, created_col, id_col, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None, key=None):
+    """Apply newest-first keyset pagination on (created_col, id_col).
+
+    The query must select columns/entities exposing ``created_at`` and ``id``
+    attributes, unless ``key`` is given to map a row to its ``(created, id)``
+    pair. Returns ``(rows, next_cursor)``; ``next_cursor`` is None on the
+    last page.
+    """
+    query, limit = keyset_query(query, created_col, id_col, limit, cursor)
+    return keyset_result(query.all(), limit, key)
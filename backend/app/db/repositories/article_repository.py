@@ -1,15 +1,32 @@
+from sqlalchemy import and_, update
 from sqlalchemy.orm import Session
-from app.db.models import Article, User
+from app.db.models import Article, Category, SavedArticle, User
+from app.db.article_metadata import apply_article_metadata
+from app.db.pagination import DEFAULT_PAGE_SIZE, keyset_page
+from app.db import search, chunk_index
+from app.db.repositories.blob_outbox_repository import enqueue_blob_upload, enqueue_blob_delete
+from app.db.repositories.category_repository import adjust_article_count
 from app.schemas.article import ArticleCreate, ArticleUpdate
-from app.services.azure_blob_service import AzureBlobStorage
+from app.services.blob_storage import get_blob_storage
+from app.services.gpt_cache import gpt_cache
+from app.services.pdf_cache import pdf_cache
+from app.services.blob_outbox import blob_outbox
+from app.services.category_cache import category_cache
+import hashlib
 import uuid
 
-blob_storage = AzureBlobStorage()
+def index_article(db: Session, article: Article, previous=None, chunk_rows=None):
+    # Arama ve sohbet indekslerini aynı transaction içinde güncelle.
+    # previous: güncellemede indeksteki eski (başlık, içerik)
+    # chunk_rows: önceden (ör. thread'de) hesaplanmış chunk_index.build_chunk_rows sonucu
+    search.index_article(db, article, previous)
+    chunk_index.index_article_chunks(db, article, chunk_rows)
+
+def unindex_article(db: Session, article: Article):
+    search.remove_article(db, article)
+    chunk_index.remove_article_chunks(db, article.id)
 
 def create_article(db: Session, article_data: ArticleCreate, user_id: int):
-    # Get user information
-    user = db.query(User).filter(User.id == user_id).first()
-    
     # Benzersiz bir dosya adı oluştur (.txt uzantılı)
     filename = f"article_{user_id}_{uuid.uuid4()}.txt"
     
@@ -20,37 +37,108 @@ def create_article(db: Session, article_data: ArticleCreate, user_id: int):
         author_id=user_id,
         blob_filename=filename
     )
+    apply_article_metadata(article)
     
     db.add(article)
+    db.flush()
+    index_article(db, article)
+    adjust_article_count(db, article.category_id, 1)
+    # Azure Blob Storage'a yazım commit sonrası arka planda yapılır
+    enqueue_blob_upload(db, filename, article.id, user_id)
     db.commit()
     db.refresh(article)
-    
-    # Azure Blob Storage'a kaydet
-    article_json = {
-        "id": article.id,
-        "title": article.title,
-        "content": article.content,
-        "category_id": article.category_id,
-        "author_id": article.author_id,
-        "created_at": str(article.created_at),
-        "updated_at": str(article.updated_at) if article.updated_at else None
-    }
-    
-    blob_url = blob_storage.upload_article(
-        article_json, 
-        filename,
-        user_id=user.id,
-        first_name=user.first_name or "",
-        last_name=user.last_name or "",
-        as_plain_text=True  # Düz metin formatında kaydet
-    )
+    blob_outbox.notify()
+    category_cache.invalidate()
     return article
 
-def get_articles_by_user(db: Session, user_id: int):
-    return db.query(Article).filter(Article.author_id == user_id).all()
+# Liste sorguları content'i hiç okumaz; özet ve sayılar yazım sırasında hesaplanmış kolonlardan gelir
+SUMMARY_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.excerpt,
+    Article.word_count,
+    Article.reading_time,
+    Article.content_length,
+    Article.category_id,
+    Article.author_id,
+    Article.created_at,
+    Article.updated_at
+)
+
+def _summary_query(db: Session):
+    return db.query(*SUMMARY_COLUMNS)
+
+def get_articles_by_user(db: Session, user_id: int, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None):
+    query = _summary_query(db).filter(Article.author_id == user_id)
+    return keyset_page(query, Article.created_at, Article.id, limit, cursor)
+
+def with_card_columns(query):
+    # Özet kolonlarına yazar görünen adı ve kategori adı eklenir
+    return query.add_columns(
+        User.username.label("author_username"),
+        User.first_name.label("author_first_name"),
+        User.last_name.label("author_last_name"),
+        Category.name.label("category")
+    ).join(User, Article.author_id == User.id) \
+        .outerjoin(Category, Article.category_id == Category.id)
+
+def _card_query(db: Session):
+    return with_card_columns(_summary_query(db))
+
+def _card(row) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "excerpt": row.excerpt or "",
+        "word_count": row.word_count,
+        "reading_time": row.reading_time,
+        "content_length": row.content_length,
+        "category_id": row.category_id,
+        "category": row.category,
+        "author_id": row.author_id,
+        "author": {
+            "id": row.author_id,
+            "username": row.author_username,
+            "first_name": row.author_first_name,
+            "last_name": row.author_last_name
+        },
+        "created_at": row.created_at,
+        "updated_at": row.updated_at
+    }
+
+def feed_filter(query, user_id: int):
+    """Restrict a card query to the feed and add the caller's saved flag.
+
+    The saved flag comes from an outer join on the unique (user_id, article_id)
+    index of saved_articles.
+    """
+    return query.add_columns(
+        SavedArticle.id.isnot(None).label("is_saved")
+    ).outerjoin(SavedArticle, and_(SavedArticle.article_id == Article.id, SavedArticle.user_id == user_id)) \
+        .filter(Article.author_id != user_id)
 
-def get_articles_except_user(db: Session, user_id: int):
-    return db.query(Article).filter(Article.author_id != user_id).all()
+def feed_item(row) -> dict:
+    return {**_card(row), "is_saved": bool(row.is_saved)}
+
+def get_feed(db: Session, user_id: int, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None):
+    """Feed page with author display fields, category name and the caller's saved flag, in one joined query."""
+    query = feed_filter(_card_query(db), user_id)
+    rows, next_cursor = keyset_page(query, Article.created_at, Article.id, limit, cursor)
+    return [feed_item(row) for row in rows], next_cursor
+
+def get_trending_candidates(db: Session, since):
+    """``(id, save_count, created_at)`` of saved articles created at or after ``since``."""
+    return db.query(Article.id, Article.save_count, Article.created_at).filter(
+        Article.created_at >= since,
+        Article.save_count > 0
+    ).all()
+
+def get_article_cards(db: Session, article_ids) -> dict:
+    """Feed-style cards (without the saved flag) for ``article_ids``, keyed by id."""
+    if not article_ids:
+        return {}
+    rows = _card_query(db).add_columns(Article.save_count).filter(Article.id.in_(article_ids)).all()
+    return {row.id: {**_card(row), "save_count": row.save_count} for row in rows}
 
 def get_article(db: Session, article_id: int):
     return db.query(Article).filter(Article.id == article_id).first()
@@ -58,57 +146,57 @@ def get_article(db: Session, article_id: int):
 def update_article(db: Session, article_id: int, article_data: ArticleUpdate, user_id: int):
     article = get_article(db, article_id)
     if article and article.author_id == user_id:
-        # Get user information
-        user = db.query(User).filter(User.id == user_id).first()
-        
-        if article_data.title is not None:
+        # Sadece gerçekten değişen alanlar yazılır; otomatik kayıtların boş PUT'ları hiçbir iş tetiklemez
+        text_changed = False
+        changed = False
+        previous_text = (article.title, article.content)
+        if article_data.title is not None and article_data.title != article.title:
             article.title = article_data.title
-        if article_data.content is not None:
+            text_changed = True
+        if article_data.content is not None and article_data.content != article.content:
             article.content = article_data.content
-        if article_data.category_id is not None:
+            text_changed = True
+        if text_changed:
+            apply_article_metadata(article)
+        category_changed = article_data.category_id is not None and article_data.category_id != article.category_id
+        if category_changed:
+            adjust_article_count(db, article.category_id, -1)
+            adjust_article_count(db, article_data.category_id, 1)
             article.category_id = article_data.category_id
+            changed = True
+        if not (changed or text_changed):
+            return article
             
+        if text_changed:
+            index_article(db, article, previous_text)
+        # Azure Blob Storage'ı güncelle (write-behind)
+        enqueue_blob_upload(db, article.blob_filename, article.id, user_id)
         db.commit()
         db.refresh(article)
-        
-        # Azure Blob Storage'ı güncelle
-        article_json = {
-            "id": article.id,
-            "title": article.title,
-            "content": article.content,
-            "category_id": article.category_id,
-            "author_id": article.author_id,
-            "created_at": str(article.created_at),
-            "updated_at": str(article.updated_at)
-        }
-        blob_storage.upload_article(
-            article_json, 
-            article.blob_filename,
-            user_id=user.id,
-            first_name=user.first_name or "",
-            last_name=user.last_name or "",
-            as_plain_text=True  # Düz metin formatında kaydet
-        )
+        blob_outbox.notify()
+        # Makale değişti, eski GPT cevapları geçersiz
+        gpt_cache.invalidate_article(article.id)
+        pdf_cache.invalidate(article.id)
+        if category_changed:
+            category_cache.invalidate()
     return article
 
 def delete_article(db: Session, article_id: int, user_id: int):
     article = get_article(db, article_id)
     if article and article.author_id == user_id:
         try:
-            # Get user information
-            user = db.query(User).filter(User.id == user_id).first()
-            
-            # Azure Blob Storage'dan sil
-            blob_storage.delete_article(
-                article.blob_filename,  # Kaydedilen blob dosya adını kullan
-                user_id=user.id,
-                first_name=user.first_name or "",
-                last_name=user.last_name or ""
-            )
+            # Azure Blob Storage'dan silme işi kuyruğa alınır
+            enqueue_blob_delete(db, article.blob_filename, user_id)
             
             # Veritabanından sil
+            unindex_article(db, article)
+            adjust_article_count(db, article.category_id, -1)
             db.delete(article)
             db.commit()
+            blob_outbox.notify()
+            gpt_cache.invalidate_article(article_id)
+            pdf_cache.invalidate(article_id)
+            category_cache.invalidate()
             return True
         except Exception as e:
             print(f"Error deleting article: {str(e)}")
@@ -116,47 +204,12 @@ def delete_article(db: Session, article_id: int, user_id: int):
             return False
     return False
 
-def create_article_from_file(
-    db: Session,
-    title: str,
-    category_id: int,
-    file_content: bytes,
-    file_name: str,
-    user_id: int
-):
-    # Get user information
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    # Benzersiz bir dosya adı oluştur (.txt uzantılı)
-    filename = f"article_{user_id}_{uuid.uuid4()}.txt"
-    
-    # Dosya içeriğini text olarak al
-    if file_name.endswith('.pdf'):
-        # PDF dosyasını text'e çevir
-        import io
-        import PyPDF2
-        
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        content = ""
-        for page in pdf_reader.pages:
-            content += page.extract_text()
-    else:
-        # TXT dosyası ise direkt oku
-        content = file_content.decode('utf-8')
-    
-    article = Article(
-        title=title,
-        content=content,
-        category_id=category_id,
-        author_id=user_id,
-        blob_filename=filename
-    )
-    
-    db.add(article)
-    db.commit()
-    db.refresh(article)
-    
-    # Azure Blob Storage'a kaydet
+def upload_article_blob(db: Session, article: Article, user: User, original_filename: str = None):
+    """Upload the article's text rendering unless an identical payload is already stored.
+
+    Called by the blob_outbox worker; the new hash is flushed with the caller's
+    session and committed together with the outbox entry.
+    """
     article_json = {
         "id": article.id,
         "title": article.title,
@@ -164,17 +217,26 @@ def create_article_from_file(
         "category_id": article.category_id,
         "author_id": article.author_id,
         "created_at": str(article.created_at),
-        "updated_at": str(article.updated_at) if article.updated_at else None,
-        "original_filename": file_name
+        "updated_at": str(article.updated_at) if article.updated_at else None
     }
+    if original_filename:
+        article_json["original_filename"] = original_filename
     
-    blob_url = blob_storage.upload_article(
-        article_json, 
-        filename,
-        user_id=user.id,
-        first_name=user.first_name or "",
-        last_name=user.last_name or "",
-        as_plain_text=True
+    storage = get_blob_storage()
+    full_path = storage.blob_path(
+        article.blob_filename, user.id, user.first_name or "", user.last_name or ""
     )
+    payload = storage.serialize_article(article_json, as_plain_text=True).encode("utf-8")
+    # Hash blob yolunu da kapsar: yazar adı değişirse yeni yola tekrar yüklenir
+    content_hash = hashlib.sha256(full_path.encode("utf-8") + b"\0" + payload).hexdigest()
+    if article.blob_hash == content_hash:
+        return None
     
-    return article
+    blob_url = storage.write_blob(full_path, payload)
+    # updated_at açıkça korunur; aksi halde onupdate tetiklenir ve bir sonraki hash tutmaz
+    db.execute(
+        update(Article)
+        .where(Article.id == article.id)
+        .values(blob_hash=content_hash, updated_at=Article.updated_at)
+    )
+    return blob_url
@@ -0,0 +1,97 @@
+# db/repositories/async_article_repository.py
+# article_repository'deki fonksiyonların AsyncSession ile çalışan karşılıkları.
+# Sorgular async sürücü üzerinden gider; CPU işi (parçalama) thread'de
+# çalışır, böylece async def rotalar event loop'u bloklamaz.
+import asyncio
+import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.db.models import Article
+from app.db import chunk_index
+from app.db.article_metadata import apply_article_metadata
+from app.db.repositories import article_repository
+from app.db.repositories.blob_outbox_repository import enqueue_blob_upload
+from app.db.repositories.category_repository import adjust_article_count
+from app.services.blob_outbox import blob_outbox
+from app.services.category_cache import category_cache
+
+async def get_article(db: AsyncSession, article_id: int):
+    # Async oturumda lazy-load yapılamaz, kategori ve yazar önceden yüklenir
+    result = await db.execute(
+        select(Article)
+        .options(selectinload(Article.category), selectinload(Article.author))
+        .where(Article.id == article_id)
+    )
+    return result.scalar_one_or_none()
+
+EXPORT_BATCH_SIZE = 20
+
+def _export_query(user_id: int, article_ids=None):
+    # Sadece kullanıcının kendi makaleleri dışa aktarılır; ids verilirse bunlarla daraltılır
+    query = select(Article).where(Article.author_id == user_id)
+    if article_ids:
+        query = query.where(Article.id.in_(article_ids))
+    return query
+
+async def has_articles_for_export(db: AsyncSession, user_id: int, article_ids=None) -> bool:
+    query = _export_query(user_id, article_ids).with_only_columns(Article.id).limit(1)
+    return (await db.execute(query)).first() is not None
+
+async def iter_articles_for_export(
+    db: AsyncSession, user_id: int, article_ids=None, limit: int = None, batch_size: int = EXPORT_BATCH_SIZE
+):
+    """Yield the user's articles in id order, ``batch_size`` entities per query.
+
+    Entities are loaded so the compressed bodies (Article.body) come along;
+    only one batch is held at a time instead of every body in the export.
+    """
+    last_id = 0
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        result = await db.execute(
+            _export_query(user_id, article_ids).where(Article.id > last_id).order_by(Article.id).limit(size)
+        )
+        batch = result.scalars().all()
+        if not batch:
+            return
+        for article in batch:
+            yield article
+        last_id = batch[-1].id
+        if remaining is not None:
+            remaining -= len(batch)
+
+async def create_article_from_content(
+    db: AsyncSession,
+    title: str,
+    category_id: int,
+    content: str,
+    file_name: str,
+    user_id: int
+):
+    # Benzersiz bir dosya adı oluştur (.txt uzantılı)
+    filename = f"article_{user_id}_{uuid.uuid4()}.txt"
+
+    article = Article(
+        title=title,
+        content=content,
+        category_id=category_id,
+        author_id=user_id,
+        blob_filename=filename
+    )
+    apply_article_metadata(article)
+
+    db.add(article)
+    await db.flush()
+    # Parçalama ve terim sayımı CPU işi; event loop dışında yapılır
+    chunk_rows = await asyncio.to_thread(chunk_index.build_chunk_rows, article.id, content)
+    await db.run_sync(lambda session: article_repository.index_article(session, article, chunk_rows=chunk_rows))
+    await db.run_sync(lambda session: adjust_article_count(session, category_id, 1))
+    await db.run_sync(lambda session: enqueue_blob_upload(session, filename, article.id, user_id, file_name))
+    await db.commit()
+    await db.refresh(article)
+    blob_outbox.notify()
+    category_cache.invalidate()
+
+    return article
@@ -0,0 +1,123 @@
+# db/repositories/blob_outbox_repository.py
+from datetime import datetime, timedelta
+from sqlalchemy import func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.db.models import BlobOutbox
+
+# ON CONFLICT DO UPDATE destekleyen diyalektler; diğerlerinde select + insert/update yapılır
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def enqueue_blob_upload(db: Session, blob_filename: str, article_id: int, user_id: int, original_filename: str = None):
+    return _enqueue(db, "upload", blob_filename, user_id, article_id, original_filename)
+
+def enqueue_blob_delete(db: Session, blob_filename: str, user_id: int):
+    return _enqueue(db, "delete", blob_filename, user_id)
+
+def _enqueue(db: Session, operation: str, blob_filename: str, user_id: int, article_id: int = None, original_filename: str = None):
+    # Çağıranın transaction'ına eklenir: makale satırı ile birlikte commit edilir.
+    # Aynı blob için bekleyen bir iş varsa yenisi onun üzerine yazılır (coalescing).
+    values = {
+        "operation": operation,
+        "article_id": article_id,
+        "user_id": user_id,
+        "original_filename": original_filename,
+        "attempts": 0,
+        "last_error": None,
+        "next_attempt_at": datetime.utcnow(),
+        "dead_at": None
+    }
+    upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        # Tek ifade: blob_filename üzerindeki unique indeks sayesinde aynı blobu aynı anda
+        # kuyruğa alan iki yazıcı iki satır oluşturamaz, ikincisi version'ı artırır
+        statement = upsert(BlobOutbox).values(blob_filename=blob_filename, version=1, **values)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[BlobOutbox.blob_filename],
+            set_={**values, "version": BlobOutbox.version + 1}
+        ))
+        return
+    entry = db.query(BlobOutbox).filter(BlobOutbox.blob_filename == blob_filename).first()
+    if entry is None:
+        entry = BlobOutbox(blob_filename=blob_filename, version=0)
+        db.add(entry)
+    for key, value in values.items():
+        setattr(entry, key, value)
+    entry.version = (entry.version or 0) + 1
+
+def get_due_entries(db: Session, limit: int):
+    now = datetime.utcnow()
+    return db.query(BlobOutbox.id, BlobOutbox.version).filter(
+        BlobOutbox.next_attempt_at <= now,
+        BlobOutbox.dead_at.is_(None),
+        or_(BlobOutbox.locked_until.is_(None), BlobOutbox.locked_until < now)
+    ).order_by(BlobOutbox.next_attempt_at).limit(limit).all()
+
+def claim_entry(db: Session, entry_id: int, version: int, lease_seconds: float) -> bool:
+    now = datetime.utcnow()
+    claimed = db.query(BlobOutbox).filter(
+        BlobOutbox.id == entry_id,
+        BlobOutbox.version == version,
+        or_(BlobOutbox.locked_until.is_(None), BlobOutbox.locked_until < now)
+    ).update({BlobOutbox.locked_until: now + timedelta(seconds=lease_seconds)}, synchronize_session=False)
+    db.commit()
+    return claimed == 1
+
+def complete_entry(db: Session, entry_id: int, version: int):
+    # İşlem sırasında aynı blob için yeni bir yazım geldiyse satır silinmez, kilit bırakılır
+    deleted = db.query(BlobOutbox).filter(
+        BlobOutbox.id == entry_id, BlobOutbox.version == version
+    ).delete(synchronize_session=False)
+    if not deleted:
+        release_entry(db, entry_id)
+    db.commit()
+
+def fail_entry(db: Session, entry_id: int, version: int, error: str, retry_in: float, dead: bool = False):
+    # dead: deneme hakkı bitti, satır dead-letter olarak kalır (yeni bir yazım onu tekrar kuyruğa alır)
+    now = datetime.utcnow()
+    updated = db.query(BlobOutbox).filter(
+        BlobOutbox.id == entry_id, BlobOutbox.version == version
+    ).update({
+        BlobOutbox.attempts: BlobOutbox.attempts + 1,
+        BlobOutbox.last_error: error,
+        BlobOutbox.next_attempt_at: now + timedelta(seconds=retry_in),
+        BlobOutbox.locked_until: None,
+        BlobOutbox.dead_at: now if dead else None
+    }, synchronize_session=False)
+    if not updated:
+        release_entry(db, entry_id)
+    db.commit()
+
+def release_entry(db: Session, entry_id: int):
+    db.query(BlobOutbox).filter(BlobOutbox.id == entry_id).update(
+        {BlobOutbox.locked_until: None}, synchronize_session=False
+    )
+
+def requeue_dead_entries(db: Session) -> int:
+    """Give dead-lettered entries a fresh set of attempts; returns how many."""
+    requeued = db.query(BlobOutbox).filter(BlobOutbox.dead_at.isnot(None)).update({
+        BlobOutbox.dead_at: None,
+        BlobOutbox.attempts: 0,
+        BlobOutbox.next_attempt_at: datetime.utcnow()
+    }, synchronize_session=False)
+    db.commit()
+    return requeued
+
+def get_outbox_stats(db: Session) -> dict:
+    # depth ve retrying sadece hâlâ işlenecek satırları sayar; dead ayrı raporlanır
+    live = BlobOutbox.dead_at.is_(None)
+    depth, retrying, dead, oldest = db.query(
+        func.count(BlobOutbox.id).filter(live),
+        func.count(BlobOutbox.id).filter(live, BlobOutbox.attempts > 0),
+        func.count(BlobOutbox.dead_at),
+        func.min(BlobOutbox.created_at)
+    ).one()
+    return {"depth": depth, "retrying": retrying, "dead": dead, "oldest_created_at": oldest}
+
+if __name__ == "__main__":
+    # Blob deposu düzeldikten sonra dead-letter'daki işleri yeniden denemek için
+    from app.db.database import SessionLocal
+
+    with SessionLocal() as db:
+        count = requeue_dead_entries(db)
+    print(f"Dead blob outbox entries requeued: {count}")
@@ -1,6 +1,8 @@
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
-from app.db.models import Category
-from app.schemas.category import CategoryCreate
+from app.db.models import Article, Category
+from app.schemas.category import CategoryCreate, CategoryOut
+from app.services.category_cache import category_cache
 
 def create_category(db: Session, category_data: CategoryCreate):
     category = Category(
@@ -10,7 +12,52 @@ def create_category(db: Session, category_data: CategoryCreate):
     db.add(category)
     db.commit()
     db.refresh(category)
+    category_cache.invalidate()
     return category
 
 def list_categories(db: Session):
     return db.query(Category).all()
+
+def list_categories_cached(db: Session):
+    """Return ``(categories, etag)``; the database is only read when the cache is empty or expired."""
+    cached = category_cache.get()
+    if cached is not None:
+        return cached
+    version = category_cache.version
+    payload = [CategoryOut.model_validate(category, from_attributes=True).model_dump(mode="json") for category in list_categories(db)]
+    return payload, category_cache.store(payload, version)
+
+def adjust_article_count(db: Session, category_id, delta: int):
+    """Add ``delta`` to the category's article count inside the caller's transaction.
+
+    The caller invalidates ``category_cache`` after committing.
+    """
+    if category_id is None or delta == 0:
+        return
+    db.execute(
+        update(Category)
+        .where(Category.id == category_id)
+        .values(article_count=Category.article_count + delta, updated_at=Category.updated_at)
+    )
+
+def recount_articles(conn) -> int:
+    """Recompute every category's article count from ``articles``; returns the number of categories.
+
+    Core-only; migration 0004 has its own frozen copy. Also repairs drift.
+    """
+    count = (
+        select(func.count(Article.id))
+        .where(Article.category_id == Category.id)
+        .correlate(Category)
+        .scalar_subquery()
+    )
+    result = conn.execute(update(Category).values(article_count=count, updated_at=Category.updated_at))
+    return result.rowcount
+
+if __name__ == "__main__":
+    # Sayılar kayarsa (elle yapılan SQL değişiklikleri vb.) yeniden hesaplamak için
+    from app.db.database import engine
+
+    with engine.begin() as conn:
+        total = recount_articles(conn)
+    print(f"Category article counts recomputed: {total} categories")
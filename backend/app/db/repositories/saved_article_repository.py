@@ -1,53 +1,185 @@
+from sqlalchemy import text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from ..models import SavedArticle, Article, User
-from typing import List
+from typing import FrozenSet, List
+from ..models import SavedArticle, Article, User, Category
+from ..group_commit import get_group_commit_writer
+from ..pagination import DEFAULT_PAGE_SIZE, keyset_page
+from ...services.saved_state_cache import saved_state_cache
 
 class SavedArticleRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def save_article(self, user_id: int, article_id: int) -> SavedArticle:
-        saved_article = SavedArticle(user_id=user_id, article_id=article_id)
-        self.db.add(saved_article)
-        self.db.commit()
-        self.db.refresh(saved_article)
+        writer = get_group_commit_writer()
+        if writer is not None:
+            try:
+                saved_article = writer.run(lambda db: self._save(db, user_id, article_id))
+            except IntegrityError:
+                # Başka bir süreç aynı kaydı önce eklemiş
+                saved_article = self._get_saved(user_id, article_id)
+                if saved_article is None:
+                    raise
+            saved_state_cache.add(user_id, article_id)
+            return saved_article
+
+        # (user_id, article_id) benzersiz: tekrar kaydetmek mevcut satırı döndürür
+        saved_article = self._get_saved(user_id, article_id)
+        if saved_article is None:
+            saved_article = SavedArticle(user_id=user_id, article_id=article_id)
+            self.db.add(saved_article)
+            try:
+                # Sayaç INSERT ile aynı transaction'da: çakışmada rollback artışı da geri alır
+                self._bump_save_count(self.db, article_id, 1)
+                self.db.commit()
+            except IntegrityError:
+                # Eşzamanlı bir istek aynı kaydı önce eklemiş
+                self.db.rollback()
+                saved_article = self._get_saved(user_id, article_id)
+                if saved_article is None:
+                    raise
+            else:
+                self.db.refresh(saved_article)
+        saved_state_cache.add(user_id, article_id)
         return saved_article
 
     def unsave_article(self, user_id: int, article_id: int) -> bool:
-        saved_article = self.db.query(SavedArticle).filter(
-            SavedArticle.user_id == user_id,
-            SavedArticle.article_id == article_id
-        ).first()
+        writer = get_group_commit_writer()
+        if writer is not None:
+            removed = writer.run(lambda db: self._unsave(db, user_id, article_id))
+            if removed:
+                saved_state_cache.discard(user_id, article_id)
+            return removed
+
+        saved_article = self._get_saved(user_id, article_id)
         if saved_article:
             self.db.delete(saved_article)
+            self._bump_save_count(self.db, article_id, -1)
             self.db.commit()
+            saved_state_cache.discard(user_id, article_id)
             return True
         return False
 
-    def get_saved_articles(self, user_id: int) -> List[dict]:
-        saved = self.db.query(SavedArticle).filter(
-            SavedArticle.user_id == user_id
-        ).join(Article).join(User, Article.author_id == User.id).all()
-        
-        articles = []
-        for item in saved:
-            article = item.article
-            articles.append({
-                "id": article.id,
-                "title": article.title,
-                "content": article.content,
-                "created_at": article.created_at,
-                "updated_at": article.updated_at,
-                "author": {
-                    "id": article.author.id,
-                    "username": article.author.username,
-                    "email": article.author.email
-                }
-            })
-        return articles
+    # Group commit işleri: writer'ın oturumunda çalışır, commit etmez
+    @staticmethod
+    def _save(db: Session, user_id: int, article_id: int) -> SavedArticle:
+        saved_article = SavedArticleRepository(db)._get_saved(user_id, article_id)
+        if saved_article is None:
+            saved_article = SavedArticle(user_id=user_id, article_id=article_id)
+            db.add(saved_article)
+            # saved_at RETURNING ile gelir, ayrıca refresh gerekmez
+            db.flush()
+            SavedArticleRepository._bump_save_count(db, article_id, 1)
+        return saved_article
 
-    def is_article_saved(self, user_id: int, article_id: int) -> bool:
+    @staticmethod
+    def _unsave(db: Session, user_id: int, article_id: int) -> bool:
+        deleted = db.query(SavedArticle).filter(
+            SavedArticle.user_id == user_id,
+            SavedArticle.article_id == article_id
+        ).delete(synchronize_session=False)
+        if deleted:
+            SavedArticleRepository._bump_save_count(db, article_id, -deleted)
+        return deleted > 0
+
+    @staticmethod
+    def _bump_save_count(db: Session, article_id: int, delta: int):
+        # updated_at açıkça korunur: sayaç değişimi makaleyi "düzenlenmiş" yapmaz (PDF/ETag sürümleri)
+        db.execute(
+            update(Article)
+            .where(Article.id == article_id)
+            .values(save_count=Article.save_count + delta, updated_at=Article.updated_at)
+        )
+
+    def _get_saved(self, user_id: int, article_id: int):
         return self.db.query(SavedArticle).filter(
             SavedArticle.user_id == user_id,
             SavedArticle.article_id == article_id
-        ).first() is not None 
\ No newline at end of file
+        ).first()
+
+    def get_saved_articles(self, user_id: int, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None):
+        # Tek sorgu: makale, yazar ve kategori alanları join ile projekte edilir, tam içerik yüklenmez
+        query = self.db.query(
+            SavedArticle.id.label("saved_id"),
+            SavedArticle.saved_at,
+            Article.id,
+            Article.title,
+            Article.excerpt,
+            Article.reading_time,
+            Article.created_at,
+            Article.updated_at,
+            Category.name.label("category"),
+            User.id.label("author_id"),
+            User.username.label("author_username"),
+            User.email.label("author_email")
+        ).join(Article, SavedArticle.article_id == Article.id) \
+            .join(User, Article.author_id == User.id) \
+            .outerjoin(Category, Article.category_id == Category.id) \
+            .filter(SavedArticle.user_id == user_id)
+
+        rows, next_cursor = keyset_page(
+            query, SavedArticle.saved_at, SavedArticle.id, limit, cursor,
+            key=lambda row: (row.saved_at, row.saved_id)
+        )
+        items = [{
+            "id": row.id,
+            "title": row.title,
+            "excerpt": row.excerpt or "",
+            "reading_time": row.reading_time,
+            "category": row.category,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "saved_at": row.saved_at,
+            "author": {
+                "id": row.author_id,
+                "username": row.author_username,
+                "email": row.author_email
+            }
+        } for row in rows]
+        return items, next_cursor
+
+    def is_article_saved(self, user_id: int, article_id: int) -> bool:
+        return article_id in self.get_saved_ids(user_id)
+
+    def get_saved_article_ids(self, user_id: int, article_ids: List[int]) -> List[int]:
+        """Return the subset of ``article_ids`` the user has saved, in request order."""
+        saved_ids = self.get_saved_ids(user_id)
+        return [article_id for article_id in dict.fromkeys(article_ids) if article_id in saved_ids]
+
+    def get_saved_ids(self, user_id: int) -> FrozenSet[int]:
+        saved_ids = saved_state_cache.get(user_id)
+        if saved_ids is None:
+            generation = saved_state_cache.generation(user_id)
+            # (user_id, article_id) indeksi üzerinden tek sorgu, tablo satırlarına inmeden
+            saved_ids = frozenset(
+                row.article_id for row in
+                self.db.query(SavedArticle.article_id).filter(SavedArticle.user_id == user_id)
+            )
+            saved_state_cache.store(user_id, saved_ids, generation)
+        return saved_ids
+
+def recount_save_counts(conn) -> int:
+    """Recompute ``articles.save_count`` from ``saved_articles``; returns the number of saved articles.
+
+    Core-only; migration 0005 has its own frozen copy. Also repairs drift.
+    ``updated_at`` is left untouched.
+    """
+    counts = conn.execute(
+        text("SELECT article_id, count(*) AS saves FROM saved_articles GROUP BY article_id")
+    ).fetchall()
+    conn.execute(text("UPDATE articles SET save_count = 0 WHERE save_count != 0"))
+    if counts:
+        conn.execute(
+            text("UPDATE articles SET save_count = :saves WHERE id = :id"),
+            [{"id": row.article_id, "saves": row.saves} for row in counts]
+        )
+    return len(counts)
+
+if __name__ == "__main__":
+    # Sayaçlar kayarsa (elle yapılan SQL değişiklikleri vb.) yeniden hesaplamak için
+    from app.db.database import engine
+
+    with engine.begin() as conn:
+        total = recount_save_counts(conn)
+    print(f"Article save counts recomputed: {total} saved articles")
@@ -0,0 +1,75 @@
+# db/repositories/upload_job_repository.py
+# Arka planda işlenen dosya yüklemelerinin durum kayıtları (AsyncSession ile).
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import UploadJob
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from config import settings
+
+ACTIVE_STATUSES = ("pending", "processing")
+
+async def create_upload_job(db: AsyncSession, user_id: int, file_name: str):
+    job = UploadJob(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        file_name=file_name,
+        status="pending"
+    )
+    db.add(job)
+    await db.commit()
+    return job
+
+async def get_upload_job(db: AsyncSession, job_id: str):
+    return await db.get(UploadJob, job_id)
+
+async def update_upload_job(db: AsyncSession, job_id: str, **fields):
+    job = await db.get(UploadJob, job_id)
+    if job:
+        for key, value in fields.items():
+            setattr(job, key, value)
+        await db.commit()
+    return job
+
+async def touch_upload_job(db: AsyncSession, job_id: str):
+    # Heartbeat: iş hâlâ bir süreçte çalışıyor, kirası yenilenir
+    await db.execute(
+        update(UploadJob)
+        .where(UploadJob.id == job_id, UploadJob.status.in_(ACTIVE_STATUSES))
+        .values(updated_at=func.now())
+    )
+    await db.commit()
+
+async def fail_interrupted_jobs(db: AsyncSession, lease_seconds: int = None) -> int:
+    """Mark pending/processing jobs whose lease has expired as failed; returns how many.
+
+    Jobs run as in-process background tasks and their spooled uploads are not
+    tracked, so a job cut off by a restart can only be closed, not resumed.
+    A running job touches ``updated_at`` every third of UPLOAD_JOB_LEASE_SECONDS,
+    so jobs still owned by another live worker process are left alone.
+    """
+    lease_seconds = lease_seconds or settings.UPLOAD_JOB_LEASE_SECONDS
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=lease_seconds)
+    result = await db.execute(
+        update(UploadJob)
+        .where(
+            UploadJob.status.in_(ACTIVE_STATUSES),
+            func.coalesce(UploadJob.updated_at, UploadJob.created_at) < cutoff
+        )
+        .values(status="failed", error="Interrupted by a server restart; please upload the file again")
+    )
+    await db.commit()
+    return result.rowcount
+
+if __name__ == "__main__":
+    # Kirası dolmuş işleri elle kapatmak için (uygulama da açılışta çalıştırır)
+    import asyncio
+    from app.db.database import AsyncSessionLocal
+
+    async def main():
+        async with AsyncSessionLocal() as db:
+            return await fail_interrupted_jobs(db)
+
+    print(f"Interrupted upload jobs marked as failed: {asyncio.run(main())}")
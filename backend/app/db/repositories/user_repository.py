@@ -19,6 +19,9 @@ def create_user(db: Session, user_data: UserCreate):
 def get_user_by_username(db: Session, username: str):
     return db.query(User).filter(User.username == username).first()
 
+def get_user_by_id(db: Session, user_id: int):
+    return db.query(User).filter(User.id == user_id).first()
+
 def get_user_by_email(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
 
@@ -40,3 +43,10 @@ def update_user(db: Session, user_id: int, user_data: UserUpdate):
         db.commit()
         db.refresh(user)
     return user
+
+def update_user_password(db: Session, user_id: int, new_password: str):
+    user = get_user_by_id(db, user_id)
+    if user:
+        user.hashed_password = hash_password(new_password)
+        db.commit()
+    return user
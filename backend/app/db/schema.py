@@ -0,0 +1,55 @@
+# db/schema.py
+import os
+from sqlalchemy import inspect
+from .database import Base
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _alembic_config(conn):
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    config.attributes["connection"] = conn
+    return config
+
+def run_migrations(engine, revision: str = "head"):
+    """Apply the Alembic migrations under backend/migrations to ``revision``."""
+    from alembic import command
+
+    with engine.begin() as conn:
+        command.upgrade(_alembic_config(conn), revision)
+
+def stamp_head(engine):
+    """Mark a freshly created schema as being at the latest migration."""
+    from alembic import command
+
+    with engine.begin() as conn:
+        command.stamp(_alembic_config(conn), "head")
+
+def init_database(engine):
+    """Create or upgrade the schema.
+
+    A new database is built from the models with create_all() and stamped at
+    the latest revision; any existing database (including pre-Alembic ones) is
+    upgraded by the migrations only. Runs from the application lifespan
+    (DATABASE_INIT_ON_STARTUP) or once per deploy with ``python -m app.db.schema``.
+    """
+    from . import models  # noqa: F401  (modelleri Base.metadata'ya kaydeder)
+    from .search import ensure_search_index
+
+    inspector = inspect(engine)
+    if not inspector.has_table("alembic_version") and not inspector.has_table("articles"):
+        Base.metadata.create_all(bind=engine)
+        # FTS sanal tabloları modellerde yok; yeni veritabanında burada oluşturulur
+        ensure_search_index(engine)
+        stamp_head(engine)
+    else:
+        # Mevcut veritabanlarında arama ve parça indeksleri migration'larla oluşturulup doldurulur
+        run_migrations(engine)
+
+if __name__ == "__main__":
+    from app.db.database import engine
+
+    init_database(engine)
+    print("Database schema is up to date")
@@ -0,0 +1,200 @@
+# db/search.py
+# article_fts contentless bir FTS5 tablosudur (content=''): sadece indeks tutulur,
+# makale metninin ikinci bir kopyası tutulmaz (büyük gövdeler article_bodies'te
+# sıkıştırılmış durur). Bu yüzden satırlar 'delete' komutuyla, indekslenmiş eski
+# başlık ve içerik verilerek silinir; snippet'ler Python'da gövdenin başından üretilir.
+import re
+import unicodedata
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+FTS_TABLE = "article_fts"
+SNIPPET_TOKENS = 16
+# Snippet için gövdenin sadece bu kadar karakterine bakılır (sıkıştırılmışsa sadece bu kadarı açılır)
+SNIPPET_SCAN_CHARS = 64 * 1024
+
+# bm25 ağırlıkları: başlıktaki eşleşme içerikteki eşleşmeden daha değerli
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+def _is_sqlite(bind) -> bool:
+    return bind.dialect.name == "sqlite"
+
+def create_search_index(conn):
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        "USING fts5(title, content, content = '', tokenize = 'unicode61 remove_diacritics 2')"
+    ))
+
+def fill_search_index(conn) -> int:
+    """Index every article into an empty FTS table; returns the number of articles.
+
+    Core-only, used by rebuild_search_index; packed bodies are
+    decompressed on the way.
+    """
+    from app.db.article_body import iter_article_texts
+
+    count = 0
+    insert = text(f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:id, :title, :content)")
+    for article_id, title, content in iter_article_texts(conn):
+        conn.execute(insert, {"id": article_id, "title": title, "content": content})
+        count += 1
+    return count
+
+def ensure_search_index(engine):
+    """Create the FTS5 table if it does not exist yet. No-op on non-SQLite databases."""
+    if not _is_sqlite(engine):
+        return False
+    with engine.begin() as conn:
+        create_search_index(conn)
+    return True
+
+_DELETE_ROW = text(
+    f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, title, content) VALUES ('delete', :id, :title, :content)"
+)
+
+def index_article(db: Session, article, previous=None):
+    """(Re)index ``article``; ``previous`` is the ``(title, content)`` that is currently indexed, if any."""
+    # FTS satırının rowid'si makale id'si ile aynıdır
+    if not _is_sqlite(db.get_bind()):
+        return
+    if previous is not None:
+        db.execute(_DELETE_ROW, {"id": article.id, "title": previous[0], "content": previous[1]})
+    db.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:id, :title, :content)"),
+        {"id": article.id, "title": article.title, "content": article.content}
+    )
+
+def remove_article(db: Session, article):
+    # Contentless tabloda silme, indekslenmiş değerlerle yapılır; article henüz değiştirilmemiş olmalı
+    if not _is_sqlite(db.get_bind()):
+        return
+    db.execute(_DELETE_ROW, {"id": article.id, "title": article.title, "content": article.content})
+
+def rebuild_search_index(engine) -> int:
+    """Drop and repopulate the FTS table from the articles table."""
+    if not _is_sqlite(engine):
+        return 0
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+        create_search_index(conn)
+        return fill_search_index(conn)
+
+def build_match_query(q: str) -> str:
+    # Kullanıcı girdisini FTS5 sözdizimine sokmamak için her kelimeyi tırnakla;
+    # son kelime yazılırken de eşleşsin diye önek araması yapılır
+    terms = re.findall(r"\w+", q or "")
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+def _fold(word: str) -> str:
+    # Tokenizer ile aynı: küçük harf, aksanlar atılır
+    word = unicodedata.normalize("NFKD", word.lower())
+    return "".join(char for char in word if not unicodedata.combining(char))
+
+def make_snippet(value: str, q: str, tokens: int = SNIPPET_TOKENS) -> str:
+    """``tokens`` words of ``value`` around the first query match, matches wrapped in <mark>.
+
+    Matches like the MATCH query: whole words, the last query word as a
+    prefix. Without a match the opening words are returned.
+    """
+    terms = [_fold(term) for term in re.findall(r"\w+", q or "")]
+    if not terms:
+        return ""
+    prefix = terms[-1]
+    exact = set(terms[:-1])
+
+    def matches(word):
+        folded = _fold(word)
+        return folded in exact or folded.startswith(prefix)
+
+    words = list(re.finditer(r"\w+", value or ""))
+    first = next((index for index, word in enumerate(words) if matches(word.group())), None)
+    start = max((first or 0) - tokens // 4, 0)
+    window = words[start:start + tokens]
+    if not window:
+        return ""
+    parts = []
+    cursor = window[0].start()
+    for word in window:
+        parts.append(value[cursor:word.start()])
+        parts.append(f"<mark>{word.group()}</mark>" if matches(word.group()) else word.group())
+        cursor = word.end()
+    snippet = "".join(parts)
+    if start > 0:
+        snippet = "..." + snippet
+    if start + tokens < len(words):
+        snippet += "..."
+    return snippet
+
+def search_articles(db: Session, q: str, limit: int, offset: int = 0):
+    from app.db.article_body import read_text_prefix
+
+    match = build_match_query(q)
+    if not match:
+        return []
+
+    if not _is_sqlite(db.get_bind()):
+        return _search_articles_like(db, q, limit, offset)
+
+    rows = db.execute(text(f"""
+        SELECT a.id, a.title, a.category_id, a.author_id, a.created_at,
+               substr(a.content, 1, :scan) AS head, b.codec, b.data,
+               bm25({FTS_TABLE}, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS rank
+        FROM {FTS_TABLE}
+        JOIN articles a ON a.id = {FTS_TABLE}.rowid
+        LEFT JOIN article_bodies b ON b.article_id = a.id
+        WHERE {FTS_TABLE} MATCH :match
+        ORDER BY rank
+        LIMIT :limit OFFSET :offset
+    """), {"match": match, "limit": limit, "offset": offset, "scan": SNIPPET_SCAN_CHARS}).all()
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "category_id": row.category_id,
+            "author_id": row.author_id,
+            "created_at": row.created_at,
+            "snippet": make_snippet(
+                read_text_prefix(row.codec, row.data, SNIPPET_SCAN_CHARS) if row.codec else row.head, q
+            ),
+            "rank": row.rank
+        }
+        for row in rows
+    ]
+
+def _search_articles_like(db: Session, q: str, limit: int, offset: int):
+    # FTS5 olmayan veritabanları için basit LIKE yedeği (sıralama yok)
+    # Not: sıkıştırılmış gövdeler (article_bodies) burada aranmaz, başlık ve kısa gövdeler aranır
+    from app.db.models import Article
+
+    pattern = f"%{q.strip()}%"
+    rows = db.query(
+        Article.id, Article.title, Article.category_id, Article.author_id, Article.created_at,
+        Article.excerpt
+    ).filter(
+        (Article.title.like(pattern)) | (Article.content.like(pattern))
+    ).order_by(Article.id.desc()).limit(limit).offset(offset).all()
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "category_id": row.category_id,
+            "author_id": row.author_id,
+            "created_at": row.created_at,
+            "snippet": (row.excerpt or "")[:200],
+            "rank": 0.0
+        }
+        for row in rows
+    ]
+
+if __name__ == "__main__":
+    # İndeks bozulursa ya da tokenizer değişirse yeniden oluştur:
+    #   python -m app.db.search
+    from app.db.database import engine
+
+    count = rebuild_search_index(engine)
+    print(f"Search index rebuilt: {count} articles indexed")
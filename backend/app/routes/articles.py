@@ -1,23 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_db, get_async_db
 from app.auth.dependencies import get_current_user
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleOut
+from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleOut, ArticlePage, FeedPage, TrendingPage, ArticleSearchPage, UploadJobOut
+from app.db.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.search import search_articles
+from app.db.chunk_index import load_chat_context
+from app.db.article_metadata import article_content_hash
 from app.db.repositories.article_repository import (
     create_article, 
     get_articles_by_user, 
-    get_articles_except_user,
+    get_feed,
     get_article, 
     update_article, 
-    delete_article,
-    create_article_from_file
+    delete_article
 )
+from app.db.repositories import async_article_repository, upload_job_repository
 from typing import List, Optional
-from ..services.gpt_service import gpt_service
+from ..services.gpt_service import GPTService, get_gpt_service
+from ..services.gpt_cache import article_version, gpt_cache
+from ..services.blob_outbox import blob_outbox
+from ..services.trending import trending_articles
 from pydantic import BaseModel
+import asyncio
 import json
-from ..services.pdf_service import PDFService
-from fastapi.responses import StreamingResponse
+from ..services.pdf_service import render_article_pdf_async
+from ..services.export_service import stream_articles_zip
+from ..services import ingest_service
+from ..services.pdf_cache import pdf_cache, PDFCache
+from ..services.blob_storage import BlobNotFoundError, BlobStorageBackend, get_blob_storage
+from fastapi.responses import StreamingResponse, FileResponse, Response
+from fastapi.concurrency import run_in_threadpool
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
 
 router = APIRouter(prefix="/articles", tags=["Articles"])
 
@@ -33,21 +50,87 @@ def create_new_article(
     article = create_article(db, article_data, current_user.id)
     return article
 
-@router.get("/my-articles", response_model=list[ArticleOut])
+@router.get("/my-articles", response_model=ArticlePage)
 def get_user_articles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    articles = get_articles_by_user(db, current_user.id)
-    return articles
+    try:
+        articles, next_cursor = get_articles_by_user(db, current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": articles, "next_cursor": next_cursor}
 
-@router.get("/feed", response_model=list[ArticleOut])
+@router.get("/feed", response_model=FeedPage)
 def get_articles_feed(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    articles = get_articles_except_user(db, current_user.id)
-    return articles
+    try:
+        articles, next_cursor = get_feed(db, current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": articles, "next_cursor": next_cursor}
+
+@router.get("/trending", response_model=TrendingPage)
+def get_trending_articles(limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    # Bellekteki top-K listesinden servis edilir, veritabanına gitmez
+    items, refreshed_at = trending_articles.top(limit)
+    return {"items": items, "refreshed_at": refreshed_at}
+
+@router.get("/search", response_model=ArticleSearchPage)
+def search_all_articles(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    hits = search_articles(db, q, limit + 1, offset)
+    next_offset = offset + limit if len(hits) > limit else None
+    return {"items": hits[:limit], "next_offset": next_offset}
+
+@router.get("/export")
+async def export_articles(
+    ids: Optional[List[int]] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user)
+):
+    if not await async_article_repository.has_articles_for_export(db, current_user.id, ids):
+        raise HTTPException(status_code=404, detail="No articles to export")
+    # Makaleler akış sırasında partiler halinde okunur; oturum yanıt bitene kadar açık kalır
+    articles = async_article_repository.iter_articles_for_export(
+        db, current_user.id, ids, limit=settings.PDF_EXPORT_MAX_ARTICLES
+    )
+    
+    headers = {
+        'Content-Disposition': 'attachment; filename="articles.zip"'
+    }
+    return StreamingResponse(stream_articles_zip(articles), media_type="application/zip", headers=headers)
+
+@router.get("/gpt-cache/stats", response_model=dict)
+def get_gpt_cache_stats(current_user=Depends(get_current_user)):
+    return gpt_cache.stats()
+
+@router.get("/blob-outbox/stats", response_model=dict)
+def get_blob_outbox_stats(current_user=Depends(get_current_user)):
+    return blob_outbox.stats()
+
+@router.get("/trending/stats", response_model=dict)
+def get_trending_stats(current_user=Depends(get_current_user)):
+    return trending_articles.stats()
+
+@router.get("/blob-cache/stats", response_model=dict)
+def get_blob_cache_stats(
+    storage: BlobStorageBackend = Depends(get_blob_storage),
+    current_user=Depends(get_current_user)
+):
+    if not hasattr(storage, "stats"):
+        return {"enabled": False}
+    return {"enabled": True, **storage.stats()}
 
 @router.get("/{article_id}", response_model=ArticleOut)
 def read_article(
@@ -82,12 +165,13 @@ def remove_article(
         raise HTTPException(status_code=404, detail="Article not found or not allowed")
     return {"detail": "Article deleted"}
 
-@router.post("/upload")
+@router.post("/upload", response_model=UploadJobOut, status_code=status.HTTP_202_ACCEPTED)
 async def upload_article(
+    background_tasks: BackgroundTasks,
     title: str = Form(...),
     category_id: int = Form(...),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
     # Dosya tipini kontrol et
@@ -98,46 +182,114 @@ async def upload_article(
         )
     
     try:
-        # Dosya içeriğini oku
-        content = await file.read()
-        
-        # Yeni makale oluştur
-        article = create_article_from_file(
-            db=db,
-            title=title,
-            category_id=category_id,
-            file_content=content,
-            file_name=file.filename,
-            user_id=current_user.id
-        )
-        
-        return article
+        # Dosyayı belleğe almadan diske yaz
+        spool_path = await ingest_service.spool_upload(file)
+    except ingest_service.UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=str(e)
         )
+    
+    # Metin çıkarma ve makale oluşturma arka planda yapılır
+    job = await upload_job_repository.create_upload_job(db, current_user.id, file.filename)
+    background_tasks.add_task(
+        ingest_service.run_ingest_job,
+        job.id,
+        spool_path,
+        title,
+        category_id,
+        file.filename,
+        current_user.id
+    )
+    return job
+
+@router.get("/upload/{job_id}", response_model=UploadJobOut)
+async def get_upload_status(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    job = await upload_job_repository.get_upload_job(db, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    return job
 
 @router.post("/{article_id}/chat", response_model=str)
 async def chat_with_article(
     article_id: int,
     chat_message: ChatMessage,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    gpt: GPTService = Depends(get_gpt_service)
 ):
-    article = get_article(db, article_id)
+    article = await async_article_repository.get_article(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Makale bulunamadı")
     
     # Kategori adını al
     category_name = article.category.name if article.category else "Kategori belirtilmemiş"
-    
-    response = gpt_service.chat_with_article(article.content, article.title, category_name, chat_message.message)
+    response = await gpt.chat_with_article(
+        article.id,
+        article_version(article_content_hash(article), category_name),
+        article.title,
+        category_name,
+        chat_message.message,
+        _context_loader(article, chat_message.message)
+    )
     return response
 
+def _context_loader(article, question: str):
+    # Uzun makalelerde sadece soruyla ilgili parçalar gönderilir. Sıralama CPU işi
+    # olduğu için ayrı bir thread'de kendi sync oturumuyla yapılır; GPT önbelleğinde
+    # cevap varsa hiç çağrılmaz.
+    return lambda: asyncio.to_thread(load_chat_context, article, question)
+
+async def _sse_events(tokens):
+    # Server-sent events: her token ayrı bir "data" satırı olarak gönderilir
+    try:
+        async for token in tokens:
+            yield f"data: {json.dumps(token, ensure_ascii=False)}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps(str(e), ensure_ascii=False)}\n\n"
+        return
+    yield "event: done\ndata: [DONE]\n\n"
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@router.post("/{article_id}/chat/stream")
+async def stream_chat_with_article(
+    article_id: int,
+    chat_message: ChatMessage,
+    db: AsyncSession = Depends(get_async_db),
+    gpt: GPTService = Depends(get_gpt_service)
+):
+    article = await async_article_repository.get_article(db, article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Makale bulunamadı")
+    
+    category_name = article.category.name if article.category else "Kategori belirtilmemiş"
+    tokens = gpt.stream_chat_with_article(
+        article.id,
+        article_version(article_content_hash(article), category_name),
+        article.title,
+        category_name,
+        chat_message.message,
+        _context_loader(article, chat_message.message)
+    )
+    return StreamingResponse(_sse_events(tokens), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.post("/generate/stream")
+async def stream_generate_article(prompt: dict, gpt: GPTService = Depends(get_gpt_service)):
+    if "text" not in prompt:
+        raise HTTPException(status_code=400, detail="text alanı gerekli")
+    tokens = gpt.stream_generate_article(prompt["text"])
+    return StreamingResponse(_sse_events(tokens), media_type="text/event-stream", headers=SSE_HEADERS)
+
 @router.post("/generate", response_model=dict)
-async def generate_article(prompt: dict):
+async def generate_article(prompt: dict, gpt: GPTService = Depends(get_gpt_service)):
     try:
-        response = gpt_service.generate_article(prompt["text"])
+        response = await gpt.generate_article(prompt["text"])
         # GPT'den gelen string yanıtı JSON'a çevir
         article_data = json.loads(response)
         return article_data
@@ -153,22 +305,68 @@ async def generate_article(prompt: dict):
         )
 
 @router.get("/{article_id}/pdf")
-async def download_article_pdf(article_id: int, db: Session = Depends(get_db)):
-    article = get_article(db, article_id)
+async def download_article_pdf(article_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    article = await async_article_repository.get_article(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # SQLAlchemy modelini güvenli bir şekilde dict'e dönüştür
-    article_data = {
-        'title': getattr(article, 'title', ''),
-        'content': getattr(article, 'content', '')
+    version = PDFCache.version(article)
+    etag = PDFCache.etag(article_id, version)
+    headers = {
+        'Content-Disposition': f'attachment; filename="article_{article_id}.pdf"',
+        'ETag': etag,
+        'Cache-Control': 'private, max-age=0, must-revalidate'
     }
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={'ETag': etag})
     
-    pdf_service = PDFService()
-    pdf_buffer = pdf_service.create_article_pdf(article_data)
+    # Makale değişmediyse reportlab'a hiç girmeden önbellekten servis et
+    cached_path = pdf_cache.get(article_id, version)
+    if cached_path is None:
+        # SQLAlchemy modelini güvenli bir şekilde dict'e dönüştür
+        article_data = {
+            'title': getattr(article, 'title', ''),
+            'content': getattr(article, 'content', '')
+        }
+        # reportlab process pool'da çalışır, event loop bloklanmaz
+        pdf_bytes = await render_article_pdf_async(article_data)
+        cached_path = await run_in_threadpool(pdf_cache.put, article_id, version, pdf_bytes)
     
+    return FileResponse(cached_path, media_type="application/pdf", headers=headers)
+
+@router.get("/{article_id}/blob")
+async def download_article_blob(
+    article_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    storage: BlobStorageBackend = Depends(get_blob_storage)
+):
+    article = await async_article_repository.get_article(db, article_id)
+    if not article or not article.blob_filename:
+        raise HTTPException(status_code=404, detail="Article not found")
+    
+    author = article.author
+    full_path = storage.blob_path(
+        article.blob_filename, author.id, author.first_name or "", author.last_name or ""
+    )
     headers = {
-        'Content-Disposition': f'attachment; filename="article_{article_id}.pdf"'
+        'Content-Disposition': f'attachment; filename="{article.blob_filename}"'
     }
     
-    return StreamingResponse(pdf_buffer, media_type="application/pdf", headers=headers)
+    # Yerel dosya sisteminde ise dosya doğrudan gönderilir (sunucu destekliyorsa sendfile)
+    local_path = storage.local_path(full_path)
+    if local_path is not None:
+        if not os.path.exists(local_path):
+            raise HTTPException(status_code=404, detail="Article blob not found")
+        return FileResponse(local_path, media_type="text/plain; charset=utf-8", headers=headers)
+    
+    chunks = storage.iter_blob(full_path)
+    try:
+        first_chunk = await run_in_threadpool(next, chunks, b"")
+    except BlobNotFoundError:
+        raise HTTPException(status_code=404, detail="Article blob not found")
+    
+    def body():
+        yield first_chunk
+        yield from chunks
+    
+    return StreamingResponse(body(), media_type="text/plain; charset=utf-8", headers=headers)
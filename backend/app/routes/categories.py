@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from app.db.database import get_db
+from app.auth.dependencies import get_current_user
 from app.schemas.category import CategoryCreate, CategoryOut
-from app.db.repositories.category_repository import create_category, list_categories
+from app.db.repositories.category_repository import create_category, list_categories_cached
+from app.services.category_cache import category_cache
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
@@ -12,5 +14,14 @@ def add_category(category_data: CategoryCreate, db: Session = Depends(get_db)):
     return create_category(db, category_data)
 
 @router.get("/", response_model=list[CategoryOut])
-def get_all_categories(db: Session = Depends(get_db)):
-    return list_categories(db)
+def get_all_categories(request: Request, response: Response, db: Session = Depends(get_db)):
+    categories, etag = list_categories_cached(db)
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={'ETag': etag})
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return categories
+
+@router.get("/cache/stats", response_model=dict)
+def get_category_cache_stats(current_user=Depends(get_current_user)):
+    return category_cache.stats()
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from ..db.database import get_db
+from ..db.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from ..db.repositories.saved_article_repository import SavedArticleRepository
 from ..auth.dependencies import get_current_user
-from typing import List
+from typing import List, Optional
 from ..db.models import Article, User
+from ..schemas.saved_article import SavedArticlePage, SavedStatus
 
 router = APIRouter(
     prefix="/saved-articles",
@@ -26,10 +28,29 @@ def unsave_article(article_id: int, current_user: User = Depends(get_current_use
         return {"message": "Article unsaved successfully"}
     raise HTTPException(status_code=404, detail="Saved article not found")
 
-@router.get("/", response_model=List[dict])
-def get_saved_articles(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@router.get("/", response_model=SavedArticlePage)
+def get_saved_articles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
     repo = SavedArticleRepository(db)
-    return repo.get_saved_articles(current_user.id)
+    try:
+        items, next_cursor = repo.get_saved_articles(current_user.id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/status", response_model=SavedStatus)
+def get_saved_status(
+    ids: List[int] = Query(..., max_length=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    # Feed'deki tüm makalelerin kayıt durumu tek istekte
+    repo = SavedArticleRepository(db)
+    return {"saved_ids": repo.get_saved_article_ids(current_user.id, ids)}
 
 @router.get("/{article_id}/is-saved")
 def check_if_saved(article_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
@@ -2,10 +2,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.db.database import get_db
-from app.db.repositories.user_repository import create_user, get_user_by_username, update_user
+from app.db.repositories.user_repository import create_user, get_user_by_id, get_user_by_username, update_user, update_user_password
 from app.schemas.user import UserCreate, UserOut, UserLogin, Token, UserUpdate
-from app.auth.auth import create_access_token, verify_password, hash_password
+from app.auth.auth import create_access_token, verify_password
 from app.auth.dependencies import get_current_user
+from app.auth.user_cache import auth_user_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -37,6 +38,8 @@ def update_profile(
     current_user=Depends(get_current_user)
 ):
     updated_user = update_user(db, current_user.id, user_data)
+    # Önbellekteki eski profil bilgisi bir sonraki istekte kullanılmasın
+    auth_user_cache.invalidate_user(current_user.id)
     return updated_user
 
 @router.put("/password", response_model=dict)
@@ -46,13 +49,14 @@ def update_password(
     current_user=Depends(get_current_user)
 ):
     try:
-        # Mevcut şifreyi doğrula
-        if not verify_password(password_data["current_password"], current_user.hashed_password):
+        # Mevcut şifreyi doğrula (önbellekteki kullanıcıda şifre tutulmaz)
+        user = get_user_by_id(db, current_user.id)
+        if not user or not verify_password(password_data["current_password"], user.hashed_password):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
         
         # Yeni şifreyi hashle ve güncelle
-        current_user.hashed_password = hash_password(password_data["new_password"])
-        db.commit()
+        update_user_password(db, user.id, password_data["new_password"])
+        auth_user_cache.invalidate_user(user.id)
         
         return {"message": "Password updated successfully"}
     except Exception as e:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class ArticleBase(BaseModel):
@@ -21,8 +21,79 @@ class ArticleOut(BaseModel):
     content: str
     category_id: int
     author_id: int
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime]
 
     class Config:
         from_attributes = True
+
+class ArticleSummary(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    content_length: Optional[int] = None
+    category_id: int
+    author_id: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+class ArticlePage(BaseModel):
+    items: List[ArticleSummary]
+    next_cursor: Optional[str] = None
+
+class FeedAuthor(BaseModel):
+    id: int
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+class FeedItem(ArticleSummary):
+    category: Optional[str] = None
+    author: FeedAuthor
+    is_saved: bool = False
+
+class FeedPage(BaseModel):
+    items: List[FeedItem]
+    next_cursor: Optional[str] = None
+
+class TrendingItem(ArticleSummary):
+    category: Optional[str] = None
+    author: FeedAuthor
+    save_count: int
+    score: float
+
+class TrendingPage(BaseModel):
+    items: List[TrendingItem]
+    refreshed_at: Optional[datetime] = None
+
+class ArticleSearchHit(BaseModel):
+    id: int
+    title: str
+    snippet: str
+    rank: float
+    category_id: int
+    author_id: int
+    created_at: datetime
+
+class ArticleSearchPage(BaseModel):
+    items: List[ArticleSearchHit]
+    next_offset: Optional[int] = None
+
+class UploadJobOut(BaseModel):
+    id: str
+    status: str
+    file_name: Optional[str] = None
+    article_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -11,6 +11,7 @@ class CategoryCreate(CategoryBase):
 
 class CategoryOut(CategoryBase):
     id: int
+    article_count: int = 0
     created_at: datetime
     updated_at: Optional[datetime]
 
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+class SavedArticleAuthor(BaseModel):
+    id: int
+    username: str
+    email: str
+
+class SavedArticleItem(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    reading_time: Optional[int] = None
+    category: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    saved_at: Optional[datetime] = None
+    author: SavedArticleAuthor
+
+class SavedArticlePage(BaseModel):
+    items: List[SavedArticleItem]
+    next_cursor: Optional[str] = None
+
+class SavedStatus(BaseModel):
+    saved_ids: List[int]
@@ -1,73 +1,81 @@
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
 from azure.storage.blob import BlobServiceClient
-import json
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import settings
+from .blob_storage import BlobStorageBackend, BlobNotFoundError
 
-class AzureBlobStorage:
+class AzureBlobStorage(BlobStorageBackend):
     def __init__(self):
-        self.blob_service_client = BlobServiceClient.from_connection_string(settings.AZURE_STORAGE_CONNECTION_STRING)
+        # Büyük içerikler blok blok ve paralel yüklenir
+        self.blob_service_client = BlobServiceClient.from_connection_string(
+            settings.AZURE_STORAGE_CONNECTION_STRING,
+            max_single_put_size=settings.BLOB_MAX_SINGLE_PUT_SIZE,
+            max_block_size=settings.BLOB_BLOCK_SIZE
+        )
         self.container_client = self.blob_service_client.get_container_client(settings.AZURE_STORAGE_CONTAINER_NAME)
 
-    def _get_user_folder_name(self, user_id, first_name, last_name):
-        # Remove any special characters that might cause issues in blob storage
-        sanitized_first_name = ''.join(e for e in first_name if e.isalnum())
-        sanitized_last_name = ''.join(e for e in last_name if e.isalnum())
-        return f"{user_id}-{sanitized_first_name}-{sanitized_last_name}"
+    def close(self):
+        self.blob_service_client.close()
 
-    def upload_article(self, article_data, filename, user_id, first_name, last_name, as_plain_text=False):
+    def write_blob(self, full_path, data: bytes):
         try:
-            # Create user folder structure
-            user_folder = self._get_user_folder_name(user_id, first_name, last_name)
-            full_path = f"{user_folder}/{filename}"
-            
-            if as_plain_text:
-                # Düz metin formatında kaydet
-                text_content = f"""Başlık: {article_data['title']}
-                
-Yazar ID: {article_data['author_id']}
-Kategori ID: {article_data['category_id']}
-Oluşturulma Tarihi: {article_data['created_at']}
-Son Güncelleme: {article_data['updated_at']}
-
-İçerik:
-{article_data['content']}
-"""
-                data_to_upload = text_content
-            else:
-                # JSON formatında kaydet
-                data_to_upload = json.dumps(article_data)
-            
             # Blob client oluştur
             blob_client = self.container_client.get_blob_client(full_path)
             
             # Veriyi yükle
-            blob_client.upload_blob(data_to_upload, overwrite=True)
+            blob_client.upload_blob(
+                data,
+                overwrite=True,
+                max_concurrency=settings.BLOB_UPLOAD_CONCURRENCY
+            )
             
             return blob_client.url
         except Exception as e:
             print(f"Error uploading to blob storage: {str(e)}")
             raise
 
-    def get_article(self, filename, user_id, first_name, last_name):
+    def read_blob(self, full_path) -> bytes:
         try:
-            user_folder = self._get_user_folder_name(user_id, first_name, last_name)
-            full_path = f"{user_folder}/{filename}"
             blob_client = self.container_client.get_blob_client(full_path)
-            json_data = blob_client.download_blob().readall()
-            return json.loads(json_data)
+            return blob_client.download_blob().readall()
+        except ResourceNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
         except Exception as e:
             print(f"Error downloading from blob storage: {str(e)}")
             raise
 
-    def delete_article(self, filename, user_id, first_name, last_name):
+    def read_blob_conditional(self, full_path, etag=None):
+        try:
+            blob_client = self.container_client.get_blob_client(full_path)
+            if etag:
+                # If-None-Match: değişmediyse gövde indirilmez
+                downloader = blob_client.download_blob(etag=etag, match_condition=MatchConditions.IfModified)
+            else:
+                downloader = blob_client.download_blob()
+            return downloader.readall(), downloader.properties.etag
+        except ResourceNotModifiedError:
+            return None, etag
+        except ResourceNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
+        except Exception as e:
+            print(f"Error downloading from blob storage: {str(e)}")
+            raise
+
+    def iter_blob(self, full_path, chunk_size=64 * 1024):
+        try:
+            blob_client = self.container_client.get_blob_client(full_path)
+            yield from blob_client.download_blob().chunks()
+        except ResourceNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
+
+    def delete_blob(self, full_path):
         try:
-            # Get user folder name and create full path
-            user_folder = self._get_user_folder_name(user_id, first_name, last_name)
-            full_path = f"{user_folder}/{filename}"
-            
             blob_client = self.container_client.get_blob_client(full_path)
             blob_client.delete_blob()
+        except ResourceNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
         except Exception as e:
             print(f"Error deleting from blob storage: {str(e)}")
             raise
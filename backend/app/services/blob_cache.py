@@ -0,0 +1,179 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from .blob_storage import BlobStorageBackend
+
+class CachedBlobStorage(BlobStorageBackend):
+    """Read-through cache in front of a remote blob backend.
+
+    Payloads are kept in a byte-bounded in-memory LRU and mirrored to a
+    byte-bounded directory on disk, keyed by blob path together with the
+    backend's ETag. Entries younger than ``fresh_seconds`` are served as is;
+    older ones are revalidated with a conditional (If-None-Match) read.
+    Writes and deletes through this wrapper invalidate the path.
+    """
+
+    def __init__(self, backend: BlobStorageBackend, directory: str, memory_bytes: int,
+                 disk_bytes: int, fresh_seconds: float):
+        self.backend = backend
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.fresh_seconds = fresh_seconds
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._memory = OrderedDict()  # path -> (etag, data, checked_at)
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    # --- BlobStorageBackend ---
+
+    def close(self):
+        self.backend.close()
+
+    def write_blob(self, full_path, data: bytes):
+        try:
+            return self.backend.write_blob(full_path, data)
+        finally:
+            self.invalidate(full_path)
+
+    def delete_blob(self, full_path):
+        try:
+            return self.backend.delete_blob(full_path)
+        finally:
+            self.invalidate(full_path)
+
+    def read_blob(self, full_path) -> bytes:
+        cached = self._lookup(full_path)
+        if cached is not None:
+            etag, data, checked_at = cached
+            if time.time() - checked_at < self.fresh_seconds:
+                self._count("hits")
+                return data
+            fresh_data, fresh_etag = self.backend.read_blob_conditional(full_path, etag)
+            if fresh_data is None:
+                # 304: yerel kopya hâlâ geçerli
+                self._count("revalidated")
+                self._store(full_path, etag, data, write_disk=False)
+                return data
+        else:
+            fresh_data, fresh_etag = self.backend.read_blob_conditional(full_path, None)
+        self._count("misses")
+        self._store(full_path, fresh_etag, fresh_data)
+        return fresh_data
+
+    def read_blob_conditional(self, full_path, etag=None):
+        return self.backend.read_blob_conditional(full_path, etag)
+
+    def iter_blob(self, full_path, chunk_size=64 * 1024):
+        data = self.read_blob(full_path)
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
+    # --- cache ---
+
+    def invalidate(self, full_path):
+        with self._lock:
+            entry = self._memory.pop(full_path, None)
+            if entry is not None:
+                self._memory_size -= len(entry[1])
+        for path in self._disk_paths(full_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.revalidated + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.revalidated) / total if total else 0.0
+            }
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _disk_paths(self, full_path):
+        key = hashlib.sha1(full_path.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".blob", base + ".etag"
+
+    def _lookup(self, full_path):
+        with self._lock:
+            entry = self._memory.get(full_path)
+            if entry is not None:
+                self._memory.move_to_end(full_path)
+                return entry
+        data_path, etag_path = self._disk_paths(full_path)
+        try:
+            with open(etag_path, "r", encoding="utf-8") as f:
+                etag = f.read() or None
+            with open(data_path, "rb") as f:
+                data = f.read()
+            os.utime(data_path)
+        except FileNotFoundError:
+            return None
+        # Diskten okunan kopya her zaman yeniden doğrulanır
+        entry = (etag, data, 0)
+        self._store_memory(full_path, entry)
+        return entry
+
+    def _store(self, full_path, etag, data, write_disk=True):
+        self._store_memory(full_path, (etag, data, time.time()))
+        if write_disk:
+            self._store_disk(full_path, etag, data)
+
+    def _store_memory(self, full_path, entry):
+        if len(entry[1]) > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(full_path, None)
+            if previous is not None:
+                self._memory_size -= len(previous[1])
+            self._memory[full_path] = entry
+            self._memory_size += len(entry[1])
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted[1])
+
+    def _store_disk(self, full_path, etag, data):
+        if len(data) > self.disk_bytes:
+            return
+        data_path, etag_path = self._disk_paths(full_path)
+        # Atomik yazım: önce veri, sonra etag
+        for path, content in ((data_path, data), (etag_path, (etag or "").encode("utf-8"))):
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.replace(tmp_path, path)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith(".blob"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            entries.sort()
+            while total > self.disk_bytes and entries:
+                _, size, path = entries.pop(0)
+                for victim in (path, path[:-len(".blob")] + ".etag"):
+                    try:
+                        os.remove(victim)
+                    except FileNotFoundError:
+                        pass
+                total -= size
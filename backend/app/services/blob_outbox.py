@@ -0,0 +1,148 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+from app.db.database import SessionLocal
+from app.db.models import Article, BlobOutbox, User
+from app.db.repositories import blob_outbox_repository
+from app.services.blob_storage import BlobNotFoundError, get_blob_storage
+
+logger = logging.getLogger(__name__)
+
+class BlobOutboxWorker:
+    """Drains the blob_outbox table in the background.
+
+    Article writes only insert/update an outbox row inside their own
+    transaction; this worker uploads (or deletes) the blobs afterwards with
+    exponential backoff. Upload payloads are built from the current article row,
+    so several pending edits of the same article become a single write. After
+    ``max_attempts`` failures an entry is dead-lettered (``dead_at`` set) and
+    left for an operator; a new write of the same blob requeues it.
+    """
+
+    def __init__(self, workers: int, poll_interval: float, lease_seconds: float,
+                 backoff_base: float, backoff_max: float, max_attempts: int):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.completed = 0
+        self.failed = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="blob-outbox")
+        self._thread = threading.Thread(target=self._run, name="blob-outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        self._pool.shutdown(wait=True)
+        self._thread = None
+        self._pool = None
+
+    def notify(self):
+        # Yeni bir iş commit edildi, beklemeden kuyruğa bak
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Blob outbox dispatcher error")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def drain(self):
+        with SessionLocal() as db:
+            due = blob_outbox_repository.get_due_entries(db, limit=self.workers * 4)
+        if not due:
+            return 0
+        if self._pool is None:
+            for entry_id, version in due:
+                self._process(entry_id, version)
+        else:
+            list(self._pool.map(lambda item: self._process(*item), due))
+        return len(due)
+
+    def _process(self, entry_id: int, version: int):
+        from app.db.repositories.article_repository import upload_article_blob
+
+        with SessionLocal() as db:
+            if not blob_outbox_repository.claim_entry(db, entry_id, version, self.lease_seconds):
+                return
+            entry = db.get(BlobOutbox, entry_id)
+            try:
+                user = db.get(User, entry.user_id)
+                if entry.operation == "upload":
+                    article = db.get(Article, entry.article_id)
+                    # Makale bu arada silindiyse yüklenecek bir şey yok
+                    if article is not None:
+                        upload_article_blob(db, article, user, original_filename=entry.original_filename)
+                else:
+                    self._delete_blob(entry, user)
+                blob_outbox_repository.complete_entry(db, entry_id, version)
+                with self._lock:
+                    self.completed += 1
+            except Exception as e:
+                db.rollback()
+                retry_in = min(self.backoff_base * (2 ** entry.attempts), self.backoff_max)
+                dead = entry.attempts + 1 >= self.max_attempts
+                if dead:
+                    logger.exception(
+                        "Blob outbox: %s %s failed %d times, moved to dead letter",
+                        entry.operation, entry.blob_filename, entry.attempts + 1
+                    )
+                else:
+                    logger.warning(
+                        "Blob outbox: %s %s failed, retrying in %ss: %s",
+                        entry.operation, entry.blob_filename, retry_in, e
+                    )
+                blob_outbox_repository.fail_entry(db, entry_id, version, str(e), retry_in, dead=dead)
+                with self._lock:
+                    self.failed += 1
+
+    @staticmethod
+    def _delete_blob(entry, user):
+        try:
+            get_blob_storage().delete_article(
+                entry.blob_filename,
+                user_id=user.id,
+                first_name=user.first_name or "",
+                last_name=user.last_name or ""
+            )
+        except BlobNotFoundError:
+            # Blob hiç yüklenmemiş olabilir (upload + delete birleşti)
+            pass
+
+    def stats(self) -> dict:
+        with SessionLocal() as db:
+            stats = blob_outbox_repository.get_outbox_stats(db)
+        with self._lock:
+            stats.update({"completed": self.completed, "failed_attempts": self.failed})
+        return stats
+
+blob_outbox = BlobOutboxWorker(
+    workers=settings.BLOB_OUTBOX_WORKERS,
+    poll_interval=settings.BLOB_OUTBOX_POLL_INTERVAL,
+    lease_seconds=settings.BLOB_OUTBOX_LEASE_SECONDS,
+    backoff_base=settings.BLOB_OUTBOX_BACKOFF_BASE,
+    backoff_max=settings.BLOB_OUTBOX_BACKOFF_MAX,
+    max_attempts=settings.BLOB_OUTBOX_MAX_ATTEMPTS
+)
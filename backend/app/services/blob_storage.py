@@ -0,0 +1,110 @@
+import json
+from abc import ABC, abstractmethod
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+class BlobNotFoundError(Exception):
+    pass
+
+class BlobStorageBackend(ABC):
+    """Common interface for article blob storage.
+
+    Articles are stored under ``<user_id>-<first>-<last>/<filename>``; backends
+    only have to implement the raw byte operations.
+    """
+
+    def _get_user_folder_name(self, user_id, first_name, last_name):
+        # Remove any special characters that might cause issues in blob storage
+        sanitized_first_name = ''.join(e for e in first_name if e.isalnum())
+        sanitized_last_name = ''.join(e for e in last_name if e.isalnum())
+        return f"{user_id}-{sanitized_first_name}-{sanitized_last_name}"
+
+    def blob_path(self, filename, user_id, first_name, last_name):
+        return f"{self._get_user_folder_name(user_id, first_name, last_name)}/{filename}"
+
+    @staticmethod
+    def serialize_article(article_data, as_plain_text=False) -> str:
+        if as_plain_text:
+            # Düz metin formatında kaydet
+            return f"""Başlık: {article_data['title']}
+                
+Yazar ID: {article_data['author_id']}
+Kategori ID: {article_data['category_id']}
+Oluşturulma Tarihi: {article_data['created_at']}
+Son Güncelleme: {article_data['updated_at']}
+
+İçerik:
+{article_data['content']}
+"""
+        # JSON formatında kaydet
+        return json.dumps(article_data)
+
+    def upload_article(self, article_data, filename, user_id, first_name, last_name, as_plain_text=False):
+        full_path = self.blob_path(filename, user_id, first_name, last_name)
+        return self.write_blob(full_path, self.serialize_article(article_data, as_plain_text).encode("utf-8"))
+
+    def get_article(self, filename, user_id, first_name, last_name):
+        full_path = self.blob_path(filename, user_id, first_name, last_name)
+        return json.loads(self.read_blob(full_path))
+
+    def delete_article(self, filename, user_id, first_name, last_name):
+        self.delete_blob(self.blob_path(filename, user_id, first_name, last_name))
+
+    def local_path(self, full_path):
+        """Filesystem path of the blob if it is stored locally, otherwise None."""
+        return None
+
+    def iter_blob(self, full_path, chunk_size=64 * 1024):
+        yield self.read_blob(full_path)
+
+    def read_blob_conditional(self, full_path, etag=None):
+        """Return ``(data, etag)``, or ``(None, etag)`` if the blob still matches ``etag``."""
+        return self.read_blob(full_path), None
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def write_blob(self, full_path, data: bytes):
+        ...
+
+    @abstractmethod
+    def read_blob(self, full_path) -> bytes:
+        ...
+
+    @abstractmethod
+    def delete_blob(self, full_path):
+        ...
+
+_blob_storage = None
+
+def get_blob_storage() -> BlobStorageBackend:
+    """Return the process-wide backend selected by ``settings.BLOB_STORAGE_BACKEND``."""
+    global _blob_storage
+    if _blob_storage is None:
+        if settings.BLOB_STORAGE_BACKEND == "local":
+            from .local_blob_service import LocalBlobStorage
+            _blob_storage = LocalBlobStorage(settings.LOCAL_BLOB_STORAGE_DIR)
+        elif settings.BLOB_STORAGE_BACKEND == "azure":
+            from .azure_blob_service import AzureBlobStorage
+            _blob_storage = AzureBlobStorage()
+            if settings.BLOB_CACHE_ENABLED:
+                # Uzak okumalar için yerel read-through önbellek
+                from .blob_cache import CachedBlobStorage
+                _blob_storage = CachedBlobStorage(
+                    _blob_storage,
+                    directory=settings.BLOB_CACHE_DIR,
+                    memory_bytes=settings.BLOB_CACHE_MEMORY_BYTES,
+                    disk_bytes=settings.BLOB_CACHE_DISK_BYTES,
+                    fresh_seconds=settings.BLOB_CACHE_FRESH_SECONDS
+                )
+        else:
+            raise ValueError(f"Unknown BLOB_STORAGE_BACKEND: {settings.BLOB_STORAGE_BACKEND}")
+    return _blob_storage
+
+def close_blob_storage():
+    global _blob_storage
+    if _blob_storage is not None:
+        _blob_storage.close()
+        _blob_storage = None
@@ -0,0 +1,58 @@
+import hashlib
+import json
+import threading
+import time
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+class CategoryCache:
+    """In-process copy of the serialized category list and its ETag.
+
+    Every invalidation bumps ``version``; a load that started before an
+    invalidation cannot store its (possibly stale) result. The ETag is a hash
+    of the payload, so all processes hand out the same tag for the same list,
+    and the TTL bounds how long another process's writes go unseen.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entry = None  # (payload, etag, expires_at)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def etag(payload) -> str:
+        digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return f'"categories-{digest}"'
+
+    def get(self):
+        """Return ``(payload, etag)`` or None when empty or expired."""
+        with self._lock:
+            if self._entry is None or self._entry[2] < time.time():
+                self._entry = None
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._entry[0], self._entry[1]
+
+    def store(self, payload, version: int) -> str:
+        etag = self.etag(payload)
+        with self._lock:
+            # Yükleme sırasında kategori/sayı değiştiyse eski listeyi yazma
+            if version == self.version:
+                self._entry = (payload, etag, time.time() + self.ttl)
+        return etag
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+            self._entry = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"version": self.version, "cached": self._entry is not None, "hits": self.hits, "misses": self.misses}
+
+category_cache = CategoryCache(settings.CATEGORY_CACHE_TTL)
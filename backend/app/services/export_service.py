@@ -0,0 +1,90 @@
+import asyncio
+import re
+import time
+import zipfile
+from fastapi.concurrency import run_in_threadpool
+from .pdf_cache import PDFCache, pdf_cache
+from .pdf_service import render_article_pdf_async
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+class _ZipChunks:
+    """Write-only, non-seekable sink for ZipFile.
+
+    ZipFile falls back to data descriptors on unseekable outputs, so every
+    entry can be flushed to the client as soon as it is written.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def _entry_name(article) -> str:
+    slug = re.sub(r"[^\w\-]+", "_", article.title or "", flags=re.UNICODE).strip("_")[:60]
+    return f"{article.id}_{slug or 'article'}.pdf"
+
+async def _article_pdf(article):
+    version = PDFCache.version(article)
+    cached_path = pdf_cache.get(article.id, version)
+    if cached_path is not None:
+        return article, await run_in_threadpool(_read_file, cached_path)
+    data = await render_article_pdf_async({'title': article.title, 'content': article.content})
+    await run_in_threadpool(pdf_cache.put, article.id, version, data)
+    return article, data
+
+def _read_file(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+async def stream_articles_zip(articles, workers: int = None):
+    """Render ``articles`` (an async iterable) and yield a ZIP archive entry by entry.
+
+    At most ``workers`` (PDF_RENDER_WORKERS) renders are in flight; the next
+    article is only read once one of them has been written to the archive,
+    so memory stays bounded by the worker count, not the export size.
+    Entries are in completion order.
+    """
+    workers = workers or settings.PDF_RENDER_WORKERS
+    sink = _ZipChunks()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+    pending = set()
+
+    async def write_finished():
+        nonlocal pending
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            article, data = task.result()
+            info = zipfile.ZipInfo(_entry_name(article), date_time=time.localtime()[:6])
+            archive.writestr(info, data)
+
+    try:
+        async for article in articles:
+            if len(pending) >= workers:
+                await write_finished()
+                yield sink.drain()
+            pending.add(asyncio.ensure_future(_article_pdf(article)))
+        while pending:
+            await write_finished()
+            yield sink.drain()
+        archive.close()
+        yield sink.drain()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+def normalize_message(message: str) -> str:
+    # "Özetle", "özetle?" ve "  özetle " aynı soru sayılır
+    return " ".join((message or "").casefold().split()).strip(" ?!.")
+
+def article_version(content_hash: str, category: str) -> str:
+    # content_hash başlığı ve içeriği kapsar (article_metadata.compute_content_hash)
+    digest = hashlib.sha1()
+    for part in (content_hash, category):
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+class GPTResponseCache:
+    """Bounded LRU + TTL cache for GPT answers, optionally mirrored to a SQLite file.
+
+    Chat entries are keyed on (article id, article version, normalized message), so
+    an edited article never serves an old answer; invalidate_article() also drops
+    its entries eagerly. Async callers use aget()/aset(), which run the SQLite
+    reads and writes in a worker thread instead of on the event loop.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, path: str = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (article_id, value, expires_at)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS gpt_cache ("
+                "key TEXT PRIMARY KEY, article_id INTEGER, value TEXT, expires_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS ix_gpt_cache_article ON gpt_cache (article_id)")
+            self._db.commit()
+
+    @staticmethod
+    def chat_key(article_id: int, version: str, message: str) -> str:
+        return json.dumps(["chat", article_id, version, normalize_message(message)], ensure_ascii=False)
+
+    @staticmethod
+    def generate_key(prompt: str) -> str:
+        return json.dumps(["generate", normalize_message(prompt)], ensure_ascii=False)
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT article_id, value, expires_at FROM gpt_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    entry = (row[0], json.loads(row[1]), row[2])
+                    self._store(key, entry)
+            if entry is None or entry[2] < now:
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    async def aget(self, key: str):
+        if self._db is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value, article_id: int = None):
+        if self._db is None:
+            return self.set(key, value, article_id)
+        return await asyncio.to_thread(self.set, key, value, article_id)
+
+    def set(self, key: str, value, article_id: int = None):
+        entry = (article_id, value, time.time() + self.ttl)
+        with self._lock:
+            self._store(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO gpt_cache (key, article_id, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, article_id, json.dumps(value, ensure_ascii=False), entry[2])
+                )
+                self._db.commit()
+
+    def invalidate_article(self, article_id: int):
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v[0] == article_id]:
+                del self._entries[key]
+            if self._db is not None:
+                self._db.execute("DELETE FROM gpt_cache WHERE article_id = ?", (article_id,))
+                self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0
+            }
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            if self._db is not None:
+                self._db.execute("DELETE FROM gpt_cache WHERE key = ?", (evicted,))
+
+    def _drop(self, key):
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM gpt_cache WHERE key = ?", (key,))
+            self._db.commit()
+
+gpt_cache = GPTResponseCache(
+    max_entries=settings.GPT_CACHE_MAX_ENTRIES,
+    ttl=settings.GPT_CACHE_TTL,
+    path=settings.GPT_CACHE_PATH
+)
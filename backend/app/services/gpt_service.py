@@ -1,23 +1,38 @@
+import asyncio
 import sys, os
-from openai import AzureOpenAI
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import settings
+from .gpt_cache import GPTResponseCache, gpt_cache
 
 class GPTService:
     def __init__(self):
-        self.client = AzureOpenAI(
-            api_key=settings.GPT_API_KEY,
-            azure_endpoint=settings.GPT_ENDPOINT,
-            api_version="2024-02-15-preview"
-        )
+        self._client = None
         self.model = settings.GPT_MODEL
+        # Aynı anda GPT'ye giden istek sayısını sınırla
+        self.semaphore = asyncio.Semaphore(settings.GPT_MAX_CONCURRENCY)
 
-    def generate_article(self, prompt):
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": """Sen bir makale yazarısın. Kullanıcının promptuna göre bir makale oluşturacaksın. Dönen response cevabı makaleye dönüştürüp kullanıcıya göndermelisin.
+    @property
+    def client(self):
+        # openai paketi ağır; ilk GPT çağrısında yüklenir
+        if self._client is None:
+            from openai import AsyncAzureOpenAI
+
+            self._client = AsyncAzureOpenAI(
+                api_key=settings.GPT_API_KEY,
+                azure_endpoint=settings.GPT_ENDPOINT,
+                api_version="2024-02-15-preview",
+                timeout=settings.GPT_TIMEOUT
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _generate_messages(self, prompt):
+        return [
+            {"role": "system", "content": """Sen bir makale yazarısın. Kullanıcının promptuna göre bir makale oluşturacaksın. Dönen response cevabı makaleye dönüştürüp kullanıcıya göndermelisin.
                     Yanıtını şu formatta ver:
                     {
                         "title": "Makalenin başlığı",
@@ -25,20 +40,12 @@ class GPTService:
                         "category": "Makale için en uygun kategori (Technology, Science, Health, Travel, Food, Art, Business, Education, Entertainment, Sports kategorilerinden biri)"
                     }
                     """},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            return f"Hata oluştu: {str(e)}"
+            {"role": "user", "content": prompt}
+        ]
 
-    def chat_with_article(self, article_content, article_title, article_category, user_message):
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": f"""Sen bir makale asistanısın. Aşağıdaki makale hakkında sorulara cevap vereceksin:
+    def _chat_messages(self, article_content, article_title, article_category, user_message):
+        return [
+            {"role": "system", "content": f"""Sen bir makale asistanısın. Aşağıdaki makale hakkında sorulara cevap vereceksin:
 
                 Makale Başlığı: {article_title}
 
@@ -46,12 +53,102 @@ class GPTService:
 
                 Makale İçeriği:
                 {article_content}"""},
-                    {"role": "user", "content": user_message}
-                ],
+            {"role": "user", "content": user_message}
+        ]
+
+    async def _complete(self, messages):
+        async with self.semaphore:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                timeout=settings.GPT_TIMEOUT,
+            )
+        return response.choices[0].message.content
+
+    async def _stream(self, messages):
+        # Token'ları geldikçe döndürür; semafor akış bitene kadar tutulur
+        async with self.semaphore:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
                 temperature=0.7,
+                timeout=settings.GPT_TIMEOUT,
+                stream=True,
             )
-            return response.choices[0].message.content
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    async def _cached_stream(self, key, load_messages, article_id=None):
+        # load_messages: mesajları döndüren async fonksiyon; sadece önbellek ıskalanırsa çağrılır
+        cached = await gpt_cache.aget(key)
+        if cached is not None:
+            yield cached
+            return
+        parts = []
+        async for token in self._stream(await load_messages()):
+            parts.append(token)
+            yield token
+        await gpt_cache.aset(key, "".join(parts), article_id=article_id)
+
+    async def generate_article(self, prompt):
+        key = GPTResponseCache.generate_key(prompt)
+        cached = await gpt_cache.aget(key)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._complete(self._generate_messages(prompt))
         except Exception as e:
             return f"Hata oluştu: {str(e)}"
+        await gpt_cache.aset(key, response)
+        return response
+
+    async def chat_with_article(self, article_id, version, article_title, article_category, user_message, load_context):
+        # version: gpt_cache.article_version; load_context (async) makale bağlamını
+        # sadece önbellekte cevap yoksa oluşturur
+        key = GPTResponseCache.chat_key(article_id, version, user_message)
+        cached = await gpt_cache.aget(key)
+        if cached is not None:
+            return cached
+        try:
+            article_content = await load_context()
+            response = await self._complete(
+                self._chat_messages(article_content, article_title, article_category, user_message)
+            )
+        except Exception as e:
+            return f"Hata oluştu: {str(e)}"
+        await gpt_cache.aset(key, response, article_id=article_id)
+        return response
+
+    def stream_generate_article(self, prompt):
+        async def load_messages():
+            return self._generate_messages(prompt)
+
+        return self._cached_stream(GPTResponseCache.generate_key(prompt), load_messages)
+
+    def stream_chat_with_article(self, article_id, version, article_title, article_category, user_message, load_context):
+        async def load_messages():
+            article_content = await load_context()
+            return self._chat_messages(article_content, article_title, article_category, user_message)
+
+        return self._cached_stream(
+            GPTResponseCache.chat_key(article_id, version, user_message),
+            load_messages,
+            article_id=article_id
+        )
+
+_gpt_service = None
+
+def get_gpt_service() -> GPTService:
+    """Process-wide GPTService, created on first use (FastAPI dependency)."""
+    global _gpt_service
+    if _gpt_service is None:
+        _gpt_service = GPTService()
+    return _gpt_service
 
-gpt_service = GPTService() 
\ No newline at end of file
+async def close_gpt_service():
+    global _gpt_service
+    if _gpt_service is not None:
+        await _gpt_service.close()
+        _gpt_service = None
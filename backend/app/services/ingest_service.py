@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.repositories import async_article_repository, upload_job_repository
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+PAGES_PER_TASK = 20
+
+class UploadTooLarge(Exception):
+    pass
+
+async def spool_upload(upload: UploadFile) -> str:
+    """Copy an upload to a temp file in UPLOAD_SPOOL_DIR chunk by chunk instead of reading it into memory."""
+    os.makedirs(settings.UPLOAD_SPOOL_DIR, exist_ok=True)
+    suffix = os.path.splitext(upload.filename or "")[1]
+    fd, path = tempfile.mkstemp(dir=settings.UPLOAD_SPOOL_DIR, suffix=suffix)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await upload.read(SPOOL_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.UPLOAD_MAX_BYTES:
+                    raise UploadTooLarge(f"File is larger than {settings.UPLOAD_MAX_BYTES} bytes")
+                await run_in_threadpool(out.write, chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+def _pdf_page_count(path: str) -> int:
+    import PyPDF2
+
+    return len(PyPDF2.PdfReader(path).pages)
+
+def _extract_pdf_pages(path: str, start: int, end: int) -> str:
+    # Process pool içinde çalışır; her görev kendi sayfa aralığını okur
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(path)
+    return "\n".join(reader.pages[i].extract_text() or "" for i in range(start, end))
+
+def _read_text_file(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+_extract_pool = None
+
+def get_extract_pool():
+    global _extract_pool
+    if _extract_pool is None:
+        # fork yerine forkserver: çalışan thread'lerin kilitleri worker'lara kopyalanmaz
+        _extract_pool = ProcessPoolExecutor(
+            max_workers=settings.INGEST_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _extract_pool
+
+def shutdown_extract_pool():
+    global _extract_pool
+    if _extract_pool is not None:
+        _extract_pool.shutdown(wait=False, cancel_futures=True)
+        _extract_pool = None
+
+async def extract_text(path: str, file_name: str) -> str:
+    if not file_name.endswith('.pdf'):
+        return await run_in_threadpool(_read_text_file, path)
+
+    loop = asyncio.get_running_loop()
+    pool = get_extract_pool()
+    page_count = await loop.run_in_executor(pool, _pdf_page_count, path)
+    parts = await asyncio.gather(*[
+        loop.run_in_executor(pool, _extract_pdf_pages, path, start, min(start + PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, PAGES_PER_TASK)
+    ])
+    return "\n".join(parts)
+
+async def _heartbeat(job_id: str):
+    # Ayrı oturum: işin kendi oturumu bu sırada kullanımda olabilir
+    interval = max(settings.UPLOAD_JOB_LEASE_SECONDS / 3, 1)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                await upload_job_repository.touch_upload_job(db, job_id)
+        except Exception:
+            logger.warning("Upload job %s heartbeat failed", job_id, exc_info=True)
+
+async def run_ingest_job(job_id: str, spool_path: str, title: str, category_id: int, file_name: str, user_id: int):
+    """Background task: extract the spooled file, create the article and record the outcome on the job."""
+    async with AsyncSessionLocal() as db:
+        await upload_job_repository.update_upload_job(db, job_id, status="processing")
+        heartbeat = asyncio.create_task(_heartbeat(job_id))
+        try:
+            content = await extract_text(spool_path, file_name)
+            article = await async_article_repository.create_article_from_content(
+                db,
+                title=title,
+                category_id=category_id,
+                content=content,
+                file_name=file_name,
+                user_id=user_id
+            )
+            await upload_job_repository.update_upload_job(db, job_id, status="completed", article_id=article.id)
+        except Exception as e:
+            logger.exception("Upload job %s failed", job_id)
+            await db.rollback()
+            await upload_job_repository.update_upload_job(db, job_id, status="failed", error=str(e))
+        finally:
+            heartbeat.cancel()
+            try:
+                os.remove(spool_path)
+            except FileNotFoundError:
+                pass
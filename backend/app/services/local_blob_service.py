@@ -0,0 +1,59 @@
+import os
+import tempfile
+from .blob_storage import BlobStorageBackend, BlobNotFoundError
+
+class LocalBlobStorage(BlobStorageBackend):
+    """Stores article blobs as files under ``root``; for offline deployments and benchmarks."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def local_path(self, full_path):
+        path = os.path.abspath(os.path.join(self.root, full_path))
+        # Kök dizinin dışına çıkan yolları reddet
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Invalid blob path: {full_path}")
+        return path
+
+    def write_blob(self, full_path, data: bytes):
+        path = self.local_path(full_path)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Atomik yazım: önce geçici dosya, sonra rename
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return f"file://{path}"
+
+    def read_blob(self, full_path) -> bytes:
+        try:
+            with open(self.local_path(full_path), "rb") as f:
+                return f.read()
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
+
+    def read_blob_conditional(self, full_path, etag=None):
+        path = self.local_path(full_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
+        current = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        if etag == current:
+            return None, etag
+        return self.read_blob(full_path), current
+
+    def delete_blob(self, full_path):
+        try:
+            os.remove(self.local_path(full_path))
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(full_path) from e
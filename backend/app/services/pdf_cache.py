@@ -0,0 +1,125 @@
+import os
+import tempfile
+import threading
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+from app.db.article_metadata import article_content_hash
+
+class PDFCache:
+    """On-disk cache of rendered article PDFs with size-bounded LRU eviction.
+
+    Files live at ``<directory>/<article id>/<version>.pdf`` where version is
+    the article's stored ``content_hash``, so any edit of the title or content
+    misses, however quickly it follows the previous one. File mtimes are
+    touched on every hit and serve as the LRU order. The total size is kept
+    up to date as files are written and removed; the directory is scanned
+    once on the first write and otherwise only when the cache goes over
+    ``max_bytes``. The directory is created on the first write.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size = None  # bilinen toplam boyut; ilk yazımda dizin taranarak öğrenilir
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def version(article) -> str:
+        # Hash yazım sırasında hesaplanır; istek başına gövde açılıp hashlenmez
+        return article_content_hash(article)[:16]
+
+    @staticmethod
+    def etag(article_id: int, version: str) -> str:
+        return f'"{article_id}-{version}"'
+
+    def _article_dir(self, article_id: int) -> str:
+        return os.path.join(self.directory, str(article_id))
+
+    def path(self, article_id: int, version: str) -> str:
+        return os.path.join(self._article_dir(article_id), f"{version}.pdf")
+
+    def get(self, article_id: int, version: str):
+        path = self.path(article_id, version)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, article_id: int, version: str, data: bytes) -> str:
+        path = self.path(article_id, version)
+        directory = self._article_dir(article_id)
+        os.makedirs(directory, exist_ok=True)
+        # Atomik yazım: yarım dosya asla servis edilmez
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+        removed = self._remove_versions(article_id, keep=path)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += len(data) - removed
+            over = self._size > self.max_bytes
+        if over:
+            self._evict()
+        return path
+
+    def invalidate(self, article_id: int):
+        removed = self._remove_versions(article_id)
+        with self._lock:
+            if self._size is not None:
+                self._size -= removed
+
+    def _remove_versions(self, article_id: int, keep: str = None) -> int:
+        # Sadece bu makalenin dizinine bakılır; tüm önbellek taranmaz
+        removed = 0
+        try:
+            entries = list(os.scandir(self._article_dir(article_id)))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            if entry.path == keep or not entry.name.endswith(".pdf"):
+                continue
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                removed += size
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _scan(self):
+        """Return ``([(mtime, size, path)], total)`` for every cached PDF."""
+        entries = []
+        total = 0
+        try:
+            top = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return entries, total
+        for entry in top:
+            # Eski düz yerleşimden kalan dosyalar da sayılır ve zamanla atılır
+            files = list(os.scandir(entry.path)) if entry.is_dir() else [entry]
+            for item in files:
+                if item.is_file() and item.name.endswith(".pdf"):
+                    stat = item.stat()
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+                    total += stat.st_size
+        return entries, total
+
+    def _evict(self):
+        with self._lock:
+            entries, total = self._scan()
+            entries.sort()
+            while total > self.max_bytes and len(entries) > 1:
+                _, size, path = entries.pop(0)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._size = total
+
+pdf_cache = PDFCache(settings.PDF_CACHE_DIR, settings.PDF_CACHE_MAX_BYTES)
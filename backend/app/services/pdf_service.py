@@ -1,60 +1,65 @@
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.pdfbase import pdfmetrics, ttfonts
-from reportlab.lib.units import cm
+# reportlab sadece render eden süreçte (process pool worker) yüklenir
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import asyncio
 import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+FONTS_DIR = os.path.join(os.path.dirname(__file__), '../static/fonts')
+
+_registered_fonts = None
+
+def register_fonts():
+    """Register the DejaVu fonts with reportlab once per process.
+
+    Returns the (normal, bold) font names, falling back to Helvetica when the
+    TTF files cannot be loaded.
+    """
+    global _registered_fonts
+    if _registered_fonts is not None:
+        return _registered_fonts
+    from reportlab.pdfbase import pdfmetrics, ttfonts
+
+    regular_font = os.path.join(FONTS_DIR, 'DejaVuSans.ttf')
+    bold_font = os.path.join(FONTS_DIR, 'DejaVuSans-Bold.ttf')
+
+    try:
+        # Regular font'u kaydet
+        regular_font_obj = ttfonts.TTFont('DejaVuSans', regular_font)
+        pdfmetrics.registerFont(regular_font_obj)
+
+        # Bold font'u kaydet
+        bold_font_obj = ttfonts.TTFont('DejaVuSans-Bold', bold_font)
+        pdfmetrics.registerFont(bold_font_obj)
+
+        # Font ailesini kaydet
+        pdfmetrics.registerFontFamily(
+            'DejaVuSans',
+            normal='DejaVuSans',
+            bold='DejaVuSans-Bold'
+        )
+
+        _registered_fonts = ('DejaVuSans', 'DejaVuSans-Bold')
+    except Exception as e:
+        print(f"Font yüklenemedi: {str(e)}")
+        _registered_fonts = ('Helvetica', 'Helvetica-Bold')
+    return _registered_fonts
 
 class PDFService:
     def __init__(self):
-        # Font dosyalarının yolları
-        self.fonts_dir = os.path.join(os.path.dirname(__file__), '../static/fonts')
-        regular_font = os.path.join(self.fonts_dir, 'DejaVuSans.ttf')
-        bold_font = os.path.join(self.fonts_dir, 'DejaVuSans-Bold.ttf')
-
-        try:
-            # Regular font'u kaydet
-            regular_font_obj = ttfonts.TTFont('DejaVuSans', regular_font)
-            pdfmetrics.registerFont(regular_font_obj)
-
-            # Bold font'u kaydet
-            bold_font_obj = ttfonts.TTFont('DejaVuSans-Bold', bold_font)
-            pdfmetrics.registerFont(bold_font_obj)
-
-            # Font ailesini kaydet
-            pdfmetrics.registerFontFamily(
-                'DejaVuSans',
-                normal='DejaVuSans',
-                bold='DejaVuSans-Bold'
-            )
-
-            self.normal_font = 'DejaVuSans'
-            self.bold_font = 'DejaVuSans-Bold'
-        except Exception as e:
-            print(f"Font yüklenemedi: {str(e)}")
-            self.normal_font = 'Helvetica'
-            self.bold_font = 'Helvetica-Bold'
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
-    def create_article_pdf(self, article_dict):
-        buffer = BytesIO()
-        
-        # PDF dokümanını oluştur
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm,
-            encoding='UTF-8'
-        )
+        self.fonts_dir = FONTS_DIR
+        self.normal_font, self.bold_font = register_fonts()
 
         # Stil tanımlamaları
         styles = getSampleStyleSheet()
         
         # Başlık stili
-        title_style = ParagraphStyle(
+        self.title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Title'],
             fontName=self.bold_font,
@@ -66,7 +71,7 @@ class PDFService:
         )
 
         # Normal metin stili
-        normal_style = ParagraphStyle(
+        self.normal_style = ParagraphStyle(
             'CustomNormal',
             parent=styles['Normal'],
             fontName=self.normal_font,
@@ -77,6 +82,27 @@ class PDFService:
             encoding='UTF-8'
         )
 
+    def create_article_pdf(self, article_dict):
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+        buffer = BytesIO()
+        
+        # PDF dokümanını oluştur
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=2*cm,
+            leftMargin=2*cm,
+            topMargin=2*cm,
+            bottomMargin=2*cm,
+            encoding='UTF-8'
+        )
+
+        title_style = self.title_style
+        normal_style = self.normal_style
+
         # İçeriği hazırla
         story = []
         
@@ -103,4 +129,40 @@ class PDFService:
         doc.build(story)
         
         buffer.seek(0)
-        return buffer
\ No newline at end of file
+        return buffer
+
+_pdf_service = None
+
+def get_pdf_service() -> PDFService:
+    global _pdf_service
+    if _pdf_service is None:
+        _pdf_service = PDFService()
+    return _pdf_service
+
+def render_article_pdf(article_dict) -> bytes:
+    # Process pool içinde çalışır; her worker kendi PDFService örneğini kullanır
+    return get_pdf_service().create_article_pdf(article_dict).getvalue()
+
+_render_pool = None
+
+def get_render_pool():
+    global _render_pool
+    if _render_pool is None:
+        # Havuz, outbox/group-commit/trending thread'leri çalışırken oluşur; fork bu
+        # thread'lerin tuttuğu kilitleri çocuğa kopyalayıp kilitlenebilir, forkserver kopyalamaz
+        _render_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _render_pool
+
+async def render_article_pdf_async(article_dict) -> bytes:
+    """Render a PDF in the process pool so reportlab never runs on the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_render_pool(), render_article_pdf, article_dict)
+
+def shutdown_render_pool():
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+
+class SavedStateCache:
+    """Bounded LRU of user id -> set of saved article ids.
+
+    The set is loaded with one indexed query on the first lookup and then kept
+    in sync by save/unsave. Sets are stored as frozensets and replaced rather
+    than mutated, so callers can hold on to what ``get`` returned. A per-user generation counter stops a load that
+    raced with a save/unsave from storing a stale set; the TTL bounds staleness
+    across processes.
+    """
+
+    def __init__(self, max_users: int, ttl: float):
+        self.max_users = max_users
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # user id -> (saved ids, expires_at)
+        self._generations = {}  # user id -> int
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] < time.time():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self, user_id: int) -> int:
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def store(self, user_id: int, saved_ids, generation: int):
+        with self._lock:
+            # Yükleme sırasında kayıt değiştiyse eski kümeyi yazma
+            if self._generations.get(user_id, 0) != generation:
+                return
+            self._entries[user_id] = (frozenset(saved_ids), time.time() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                evicted, _ = self._entries.popitem(last=False)
+                self._generations.pop(evicted, None)
+
+    def add(self, user_id: int, article_id: int):
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries[user_id] = (entry[0] | {article_id}, entry[1])
+
+    def discard(self, user_id: int, article_id: int):
+        with self._lock:
+            self._bump(user_id)
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries[user_id] = (entry[0] - {article_id}, entry[1])
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self._bump(user_id)
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"users": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _bump(self, user_id):
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+saved_state_cache = SavedStateCache(
+    max_users=settings.SAVED_CACHE_MAX_USERS,
+    ttl=settings.SAVED_CACHE_TTL
+)
@@ -0,0 +1,105 @@
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from config import settings
+from app.db.database import SessionLocal, read_engine
+
+logger = logging.getLogger(__name__)
+
+def trending_score(save_count: int, created_at, now: datetime, gravity: float) -> float:
+    """Hacker News style decay: saves divided by (age in hours + 2) ** gravity."""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    age_hours = max((now - created_at).total_seconds() / 3600, 0.0)
+    return save_count / (age_hours + 2) ** gravity
+
+class TrendingArticles:
+    """Top-K trending articles, recomputed in the background and served from memory.
+
+    Every ``refresh_seconds`` the saved articles of the last ``window_days`` are
+    scored from their ``save_count`` and age, and the best ``top_k`` are
+    stored with their cards. ``top(limit)`` only slices that list, so the
+    endpoint costs O(K) however large the corpus gets.
+    """
+
+    def __init__(self, top_k: int, window_days: int, gravity: float, refresh_seconds: float):
+        self.top_k = top_k
+        self.window_days = window_days
+        self.gravity = gravity
+        self.refresh_seconds = refresh_seconds
+        self.refreshes = 0
+        self.refreshed_at = None
+        self._items = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="trending-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def top(self, limit: int):
+        # Worker çalışmıyorsa (ör. script/test) ilk istekte bir kez hesapla
+        if self.refreshed_at is None:
+            self.refresh()
+        with self._lock:
+            return self._items[:limit], self.refreshed_at
+
+    def refresh(self):
+        from app.db.repositories.article_repository import get_article_cards, get_trending_candidates
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Sadece okuma: replika tanımlıysa oraya gider
+        with SessionLocal(bind=read_engine) as db:
+            candidates = get_trending_candidates(db, now - timedelta(days=self.window_days))
+            best = heapq.nlargest(
+                self.top_k,
+                ((trending_score(row.save_count, row.created_at, now, self.gravity), row.id) for row in candidates)
+            )
+            cards = get_article_cards(db, [article_id for _, article_id in best])
+        # Aday ile kart sorgusu arasında silinen makaleler atlanır
+        items = [{**cards[article_id], "score": score} for score, article_id in best if article_id in cards]
+        with self._lock:
+            self._items = items
+            self.refreshed_at = now
+            self.refreshes += 1
+        return len(items)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "refreshes": self.refreshes,
+                "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None
+            }
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Trending refresh error")
+            self._wakeup.wait(self.refresh_seconds)
+            self._wakeup.clear()
+
+trending_articles = TrendingArticles(
+    top_k=settings.TRENDING_TOP_K,
+    window_days=settings.TRENDING_WINDOW_DAYS,
+    gravity=settings.TRENDING_GRAVITY,
+    refresh_seconds=settings.TRENDING_REFRESH_SECONDS
+)
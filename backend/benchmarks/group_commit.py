@@ -0,0 +1,91 @@
+# benchmarks/group_commit.py
+"""Save/unsave throughput with one commit per write vs. the group-commit writer.
+
+    python benchmarks/group_commit.py --threads 32 --ops 100 --synchronous FULL
+
+Runs against a throwaway SQLite file with the engine profile from config.py
+(WAL, busy_timeout, ...); --synchronous overrides SQLITE_SYNCHRONOUS so the
+fsync-per-commit case (FULL) can be compared with NORMAL.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import settings
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.database import Base, apply_sqlite_pragmas, engine_options
+from app.db.group_commit import GroupCommitWriter
+from app.db.repositories.saved_article_repository import SavedArticleRepository
+
+def _workload(write, threads: int, ops: int) -> float:
+    """Each thread toggles its own bookmarks; returns writes per second."""
+    errors = []
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(user_id):
+        start_barrier.wait()
+        try:
+            for i in range(ops):
+                article_id = i // 2
+                if i % 2 == 0:
+                    write(lambda db: SavedArticleRepository._save(db, user_id, article_id))
+                else:
+                    write(lambda db: SavedArticleRepository._unsave(db, user_id, article_id))
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(user_id,)) for user_id in range(1, threads + 1)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise errors[0]
+    return threads * ops / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=100, help="writes per thread")
+    parser.add_argument("--synchronous", default=settings.SQLITE_SYNCHRONOUS)
+    parser.add_argument("--delay-ms", type=float, default=settings.GROUP_COMMIT_MAX_DELAY_MS)
+    parser.add_argument("--max-batch", type=int, default=settings.GROUP_COMMIT_MAX_BATCH)
+    args = parser.parse_args()
+    settings.SQLITE_SYNCHRONOUS = args.synchronous
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        bench_engine = create_engine(url, **engine_options(url))
+        apply_sqlite_pragmas(bench_engine)
+        Base.metadata.create_all(bench_engine)
+        Session = sessionmaker(bind=bench_engine, autoflush=False, expire_on_commit=False)
+
+        def commit_each(op):
+            with Session() as db:
+                result = op(db)
+                db.commit()
+                return result
+
+        writer = GroupCommitWriter(Session, max_delay_ms=args.delay_ms, max_batch=args.max_batch)
+        try:
+            per_commit = _workload(commit_each, args.threads, args.ops)
+            grouped = _workload(writer.run, args.threads, args.ops)
+        finally:
+            writer.stop()
+            bench_engine.dispose()
+
+    print(f"threads={args.threads} writes={args.threads * args.ops} synchronous={args.synchronous}")
+    print(f"commit per write : {per_commit:10.0f} writes/s")
+    print(f"group commit     : {grouped:10.0f} writes/s  "
+          f"(avg batch {writer.stats()['avg_batch']:.1f}, delay {args.delay_ms} ms)")
+    print(f"speedup          : {grouped / per_commit:10.2f}x")
+
+if __name__ == "__main__":
+    main()
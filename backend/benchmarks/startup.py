@@ -0,0 +1,88 @@
+# benchmarks/startup.py
+"""Cold-start report: import time of main.py, app startup and first request.
+
+    python benchmarks/startup.py --repeat 5 --top 15
+
+Each run is a fresh interpreter against a throwaway SQLite database, so schema
+creation is included in the startup figure. The import breakdown comes from
+``python -X importtime`` and lists the slowest modules by cumulative time.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+TIMING_SNIPPET = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    ready = time.perf_counter()
+    client.get("/")
+    first = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "first_request_ms": (first - ready) * 1000,
+}))
+"""
+
+def _env(directory):
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'startup.db')}"
+    env.pop("ASYNC_DATABASE_URL", None)
+    return env
+
+def measure_once() -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run(
+            [sys.executable, "-c", TIMING_SNIPPET],
+            cwd=BACKEND_DIR, env=_env(directory), capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def import_breakdown(top: int):
+    """Return ``[(cumulative_ms, self_ms, module)]`` for the slowest modules under main."""
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main"],
+            cwd=BACKEND_DIR, env=_env(directory), capture_output=True, text=True, check=True
+        )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        # Sadece main'in doğrudan ve bir alt seviyedeki importları
+        if match and len(match.group(3)) <= 4:
+            rows.append((int(match.group(2)) / 1000, int(match.group(1)) / 1000, match.group(4)))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.repeat)]
+    print(f"median of {args.repeat} cold starts")
+    for key in ("import_ms", "startup_ms", "first_request_ms"):
+        print(f"  {key:<18} {statistics.median(run[key] for run in runs):9.1f} ms")
+    total = statistics.median(run["import_ms"] + run["startup_ms"] for run in runs)
+    print(f"  {'import + startup':<18} {total:9.1f} ms")
+
+    print(f"\nslowest imports under main (-X importtime, top {args.top})")
+    print(f"  {'cumulative':>10} {'self':>9}  module")
+    for cumulative, self_ms, module in import_breakdown(args.top):
+        print(f"  {cumulative:8.1f}ms {self_ms:7.1f}ms  {module}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 # config.example.py
 import os
+from typing import Optional
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
@@ -24,20 +25,105 @@ class Settings(BaseSettings):
     DB_DRIVER: str = DB_DRIVER
     ENCODED_DRIVER: str = ENCODED_DRIVER
     DATABASE_URL: str = "sqlite:///./blog.db"
+    # Boş bırakılırsa DATABASE_URL'in async sürücülü hali kullanılır (sqlite -> sqlite+aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
     # Alternative SQL Server connection:
     # DATABASE_URL: str = f"mssql+pyodbc://{DB_USER}:{DB_PASSWORD}@{DB_SERVER}:1433/{DB_NAME}?driver={ENCODED_DRIVER}"
+    # Okuma replikası: verilirse salt okunur sorgular buraya, yazmalar DATABASE_URL'e gider
+    READ_REPLICA_DATABASE_URL: Optional[str] = None
+    # Açılışta şemayı kur/güncelle (yeni veritabanında create_all + stamp, aksi halde migration'lar)
+    DATABASE_INIT_ON_STARTUP: bool = True
+    # Bu boyutu (UTF-8 bayt) aşan makale gövdeleri article_bodies'te zlib ile sıkıştırılmış tutulur
+    ARTICLE_BODY_COMPRESS_THRESHOLD: int = 64 * 1024
+    ARTICLE_BODY_COMPRESS_LEVEL: int = 6
+
+    # Engine profili
+    DATABASE_ECHO: bool = False  # tüm SQL'i loglar; sadece debug için açın
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    # SQLite pragmaları (her bağlantıda uygulanır)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # Group commit: küçük yazılar (kaydet/kaldır) birkaç ms içinde toplanıp tek transaction'da commit edilir
+    GROUP_COMMIT_ENABLED: bool = False
+    GROUP_COMMIT_MAX_DELAY_MS: float = 2.0
+    GROUP_COMMIT_MAX_BATCH: int = 64
     
     # JWT settings
     JWT_SECRET: str = "your-jwt-secret"
     JWT_ALGORITHM: str = "HS256"
+    # Doğrulanmış token -> kullanıcı önbelleği
+    AUTH_CACHE_TTL: float = 60.0
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # Kullanıcı başına kaydedilen makale id kümesi önbelleği
+    SAVED_CACHE_TTL: float = 300.0
+    SAVED_CACHE_MAX_USERS: int = 10000
+    # /categories listesi (makale sayılarıyla) süreç içi önbellekte tutulur
+    CATEGORY_CACHE_TTL: float = 60.0
+    # Trending: son TRENDING_WINDOW_DAYS içindeki makaleler save_count / (yaş_saat + 2) ^ gravity ile
+    # sıralanır; ilk TRENDING_TOP_K bellekte tutulur ve TRENDING_REFRESH_SECONDS'ta bir yenilenir
+    TRENDING_TOP_K: int = 100
+    TRENDING_WINDOW_DAYS: int = 7
+    TRENDING_GRAVITY: float = 1.8
+    TRENDING_REFRESH_SECONDS: float = 60.0
+    
+    # Blob storage: "azure" veya "local" (yerel dosya sistemi)
+    BLOB_STORAGE_BACKEND: str = "azure"
+    LOCAL_BLOB_STORAGE_DIR: str = "./blob_storage"
     
     # Azure Blob Storage settings
     AZURE_STORAGE_CONNECTION_STRING: str = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "your-azure-storage-connection-string")
     AZURE_STORAGE_CONTAINER_NAME: str = "your-container-name"
+    # Bu boyutun üzerindeki içerikler blok blok, paralel yüklenir
+    BLOB_MAX_SINGLE_PUT_SIZE: int = 4 * 1024 * 1024
+    BLOB_BLOCK_SIZE: int = 4 * 1024 * 1024
+    BLOB_UPLOAD_CONCURRENCY: int = 4
+    # Uzak blob okumaları için yerel önbellek (bellek + disk, ETag ile doğrulanır)
+    BLOB_CACHE_ENABLED: bool = True
+    BLOB_CACHE_DIR: str = "./blob_cache"
+    BLOB_CACHE_MEMORY_BYTES: int = 64 * 1024 * 1024
+    BLOB_CACHE_DISK_BYTES: int = 1024 * 1024 * 1024
+    BLOB_CACHE_FRESH_SECONDS: float = 30.0
+    # Write-behind blob kuyruğu (blob_outbox tablosu)
+    BLOB_OUTBOX_WORKERS: int = 4
+    BLOB_OUTBOX_POLL_INTERVAL: float = 1.0
+    BLOB_OUTBOX_LEASE_SECONDS: float = 60.0
+    BLOB_OUTBOX_BACKOFF_BASE: float = 2.0
+    BLOB_OUTBOX_BACKOFF_MAX: float = 300.0
+    # Bu kadar başarısız denemeden sonra iş dead-letter'a alınır (dead_at dolu, tekrar denenmez)
+    BLOB_OUTBOX_MAX_ATTEMPTS: int = 10
     
     # GPT settings
     GPT_ENDPOINT: str = "https://your-gpt-endpoint"
     GPT_API_KEY: str = "your-gpt-api-key"
     GPT_MODEL: str = "your-gpt-model"
+    GPT_TIMEOUT: float = 60.0  # saniye, her çağrı için
+    GPT_MAX_CONCURRENCY: int = 8
+    # GPT cevap önbelleği (LRU + TTL). GPT_CACHE_PATH verilirse SQLite dosyasında da tutulur.
+    GPT_CACHE_MAX_ENTRIES: int = 1000
+    GPT_CACHE_TTL: int = 24 * 60 * 60
+    GPT_CACHE_PATH: Optional[str] = None
+    # Sohbette uzun makalelerin sadece ilgili parçaları gönderilir
+    CHAT_CHUNK_TOKENS: int = 300
+    GPT_CONTEXT_TOKEN_BUDGET: int = 3000
+    GPT_CONTEXT_TOP_K: int = 8
+
+    # PDF önbelleği
+    PDF_CACHE_DIR: str = "./pdf_cache"
+    PDF_CACHE_MAX_BYTES: int = 200 * 1024 * 1024
+    PDF_RENDER_WORKERS: int = 2
+    PDF_EXPORT_MAX_ARTICLES: int = 100
+
+    # Dosya yükleme (arka planda işlenir)
+    UPLOAD_SPOOL_DIR: str = "./upload_spool"
+    UPLOAD_MAX_BYTES: int = 100 * 1024 * 1024
+    INGEST_WORKERS: int = 2
+    # Çalışan iş updated_at'i düzenli yeniler; bu süreden uzun sessiz kalan iş yarım kalmış sayılır
+    UPLOAD_JOB_LEASE_SECONDS: int = 300
 
-settings = Settings() 
\ No newline at end of file
+settings = Settings()
@@ -1,20 +1,56 @@
 # main.py
-import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.db.database import Base, engine
+from app.db.database import AsyncSessionLocal, async_engine, engine, read_engine
+from app.db.repositories.upload_job_repository import fail_interrupted_jobs
+from app.db.schema import init_database
+from app.db.group_commit import shutdown_group_commit_writer
 from app.routes.users import router as users_router
 from app.routes.articles import router as articles_router
 from app.routes.categories import router as categories_router
 from app.routes.saved_articles import router as saved_articles_router
+from app.services.pdf_service import shutdown_render_pool
+from app.services.ingest_service import shutdown_extract_pool
+from app.services.blob_outbox import blob_outbox
+from app.services.trending import trending_articles
+from app.services.blob_storage import close_blob_storage
+from app.services.gpt_service import close_gpt_service
 from fastapi.middleware.cors import CORSMiddleware
+from config import settings
 
-# Veritabanı tablolarını oluşturun (eğer yoksa)
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Şema import sırasında değil uygulama açılırken kurulur.
+    # Çok worker'lı dağıtımlarda kapatıp bir kez `python -m app.db.schema` çalıştırın.
+    if settings.DATABASE_INIT_ON_STARTUP:
+        init_database(engine)
+    # Yükleme işleri process belleğinde çalışır; kirası dolmuş (hiçbir sürecin
+    # yenilemediği) işler kapatılır, diğer worker'ların çalışan işlerine dokunulmaz.
+    async with AsyncSessionLocal() as db:
+        await fail_interrupted_jobs(db)
+    # Blob yazımlarını arka planda işleyen worker
+    blob_outbox.start()
+    # Trending top-K listesi arka planda periyodik olarak yeniden hesaplanır
+    trending_articles.start()
+    # GPT ve blob istemcileri ilk kullanımda oluşturulur (get_gpt_service / get_blob_storage)
+    yield
+    blob_outbox.stop()
+    trending_articles.stop()
+    shutdown_group_commit_writer()
+    shutdown_render_pool()
+    shutdown_extract_pool()
+    await close_gpt_service()
+    close_blob_storage()
+    await async_engine.dispose()
+    if read_engine is not engine:
+        read_engine.dispose()
+    engine.dispose()
 
 app = FastAPI(
     title="My Blog API",
     description="A backend API for a personal blog platform similar to Medium.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS ayarları
@@ -38,4 +74,6 @@ def read_root():
     return {"Hello": "World"}
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,55 @@
+# migrations/env.py
+from logging.config import fileConfig
+from alembic import context
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import settings
+from app.db.database import Base, engine
+from app.db import models  # noqa: F401  (modelleri Base.metadata'ya kaydeder)
+from app.db.search import FTS_TABLE
+
+config = context.config
+target_metadata = Base.metadata
+
+# Uygulama içinden çalıştırıldığında (run_migrations) bağlantı hazır gelir
+# ve uygulamanın logging ayarlarına dokunulmaz.
+connection = config.attributes.get("connection")
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+def include_object(object, name, type_, reflected, compare_to):
+    # FTS5 sanal tablosu ve gölge tabloları (article_fts_data, _idx, ...) modellerde yok;
+    # autogenerate bunlar için DROP üretmesin
+    if type_ == "table" and (name == FTS_TABLE or name.startswith(f"{FTS_TABLE}_")):
+        return False
+    return True
+
+def run_migrations_offline():
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+        include_object=include_object
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online(connection):
+    # SQLite ALTER TABLE kısıtları yüzünden batch modu açık
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+        include_object=include_object
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif connection is not None:
+    run_migrations_online(connection)
+else:
+    with engine.connect() as conn:
+        run_migrations_online(conn)
@@ -0,0 +1,80 @@
+"""post-baseline tables and hot path indexes
+
+Brings a pre-Alembic database up to the first tracked revision: the
+blob_outbox and upload_jobs tables, articles.blob_hash, and the indexes for
+the article listings, the feed and saved-article lookups. Databases created
+by init_database() are stamped at head and never run this.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (tablo, indeks, kolonlar, unique)
+INDEXES = [
+    ("articles", "ix_articles_author_created", ["author_id", "created_at", "id"], False),
+    ("articles", "ix_articles_category_id", ["category_id"], False),
+    ("articles", "ix_articles_created_at", ["created_at", "id"], False),
+    ("saved_articles", "ix_saved_articles_user_article", ["user_id", "article_id"], True),
+    ("saved_articles", "ix_saved_articles_user_saved", ["user_id", "saved_at", "id"], False),
+]
+
+def upgrade():
+    with op.batch_alter_table("articles") as batch:
+        batch.add_column(sa.Column("blob_hash", sa.String(64), nullable=True))
+
+    op.create_table(
+        "upload_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("file_name", sa.String(255)),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id"), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True))
+    )
+    op.create_index("ix_upload_jobs_user_id", "upload_jobs", ["user_id"])
+
+    op.create_table(
+        "blob_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("blob_filename", sa.String(255), nullable=False, unique=True),
+        sa.Column("operation", sa.String(10), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("original_filename", sa.String(255), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now())
+    )
+    op.create_index("ix_blob_outbox_id", "blob_outbox", ["id"])
+    op.create_index("ix_blob_outbox_next_attempt_at", "blob_outbox", ["next_attempt_at"])
+
+    for table, name, columns, unique in INDEXES:
+        if unique:
+            # Eski veritabanlarındaki tekrarlı satırlar: en eskisi kalır
+            column_list = ", ".join(columns)
+            op.execute(
+                f"DELETE FROM {table} WHERE id NOT IN "
+                f"(SELECT MIN(id) FROM {table} GROUP BY {column_list})"
+            )
+        op.create_index(name, table, columns, unique=unique)
+
+def downgrade():
+    for table, name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    op.drop_table("blob_outbox")
+    op.drop_table("upload_jobs")
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_column("blob_hash")
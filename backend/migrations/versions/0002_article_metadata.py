@@ -0,0 +1,70 @@
+"""article metadata columns
+
+Adds excerpt, word_count, reading_time and content_length to articles and
+backfills them in batches.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+import math
+import re
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+_WORD = re.compile(r"\S+")
+
+COLUMNS = [
+    sa.Column("excerpt", sa.String(300), nullable=True),
+    sa.Column("word_count", sa.Integer(), nullable=True),
+    sa.Column("reading_time", sa.Integer(), nullable=True),
+    sa.Column("content_length", sa.Integer(), nullable=True),
+]
+
+def upgrade():
+    with op.batch_alter_table("articles") as batch:
+        for column in COLUMNS:
+            batch.add_column(column)
+    _backfill(op.get_bind())
+
+def _metadata(content: str) -> dict:
+    # Bu revizyondaki hesap; uygulamadaki compute_article_metadata değişse de sabit kalır
+    content = content or ""
+    word_count = sum(1 for _ in _WORD.finditer(content))
+    return {
+        "excerpt": content[:EXCERPT_LENGTH],
+        "word_count": word_count,
+        "reading_time": math.ceil(word_count / WORDS_PER_MINUTE),
+        "content_length": len(content)
+    }
+
+def _backfill(bind):
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text("SELECT id, content FROM articles WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            return
+        bind.execute(
+            sa.text(
+                "UPDATE articles SET excerpt = :excerpt, word_count = :word_count, "
+                "reading_time = :reading_time, content_length = :content_length WHERE id = :id"
+            ),
+            [{"id": row.id, **_metadata(row.content)} for row in rows]
+        )
+        last_id = rows[-1].id
+
+def downgrade():
+    with op.batch_alter_table("articles") as batch:
+        for column in reversed(COLUMNS):
+            batch.drop_column(column.name)
@@ -0,0 +1,73 @@
+"""compressed article bodies
+
+Creates article_bodies and moves article bodies at or above
+ARTICLE_BODY_COMPRESS_THRESHOLD into it, zlib-compressed.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+import zlib
+from alembic import op
+import sqlalchemy as sa
+from config import settings
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 100
+
+def upgrade():
+    op.create_table(
+        "article_bodies",
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id"), primary_key=True),
+        sa.Column("codec", sa.String(10), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("length", sa.Integer(), nullable=False)
+    )
+    _repack(op.get_bind())
+
+def _repack(bind):
+    # Eşik ve seviye ayardan okunur; biçim (codec "zlib", UTF-8) bu revizyonda sabittir
+    threshold = settings.ARTICLE_BODY_COMPRESS_THRESHOLD
+    level = settings.ARTICLE_BODY_COMPRESS_LEVEL
+    last_id = 0
+    while True:
+        # Bayt eşiğinin altındaki satırlar karakter uzunluğuyla zaten elenir
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, content FROM articles "
+                "WHERE id > :last_id AND length(content) * 4 >= :threshold ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "threshold": threshold, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            return
+        packed = []
+        for row in rows:
+            raw = row.content.encode("utf-8")
+            if len(raw) >= threshold:
+                packed.append({"id": row.id, "codec": "zlib", "data": zlib.compress(raw, level), "length": len(row.content)})
+        if packed:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO article_bodies (article_id, codec, data, length) "
+                    "VALUES (:id, :codec, :data, :length)"
+                ),
+                packed
+            )
+            bind.execute(sa.text("UPDATE articles SET content = '' WHERE id = :id"), [{"id": p["id"]} for p in packed])
+        last_id = rows[-1].id
+
+def downgrade():
+    # Gövdeler açılıp articles.content'e geri yazılır
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT article_id, data FROM article_bodies")).fetchall()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE articles SET content = :content WHERE id = :id"),
+            [{"id": row.article_id, "content": zlib.decompress(row.data).decode("utf-8")} for row in rows]
+        )
+    op.drop_table("article_bodies")
@@ -0,0 +1,28 @@
+"""category article counts
+
+Adds categories.article_count and fills it once from articles; from then on
+the article write paths keep it up to date.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table("categories") as batch:
+        batch.add_column(sa.Column("article_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        "UPDATE categories SET article_count = "
+        "(SELECT count(*) FROM articles WHERE articles.category_id = categories.id)"
+    )
+
+def downgrade():
+    with op.batch_alter_table("categories") as batch:
+        batch.drop_column("article_count")
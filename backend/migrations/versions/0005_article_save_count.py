@@ -0,0 +1,34 @@
+"""article save counts
+
+Adds articles.save_count and fills it once from saved_articles; from then on
+save/unsave keep it up to date.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table("articles") as batch:
+        batch.add_column(sa.Column("save_count", sa.Integer(), nullable=False, server_default="0"))
+    # Tek GROUP BY ile sayılır; makale başına alt sorgu saved_articles'ı tekrar tekrar tarardı
+    bind = op.get_bind()
+    counts = bind.execute(
+        sa.text("SELECT article_id, count(*) AS saves FROM saved_articles GROUP BY article_id")
+    ).fetchall()
+    if counts:
+        bind.execute(
+            sa.text("UPDATE articles SET save_count = :saves WHERE id = :id"),
+            [{"id": row.article_id, "saves": row.saves} for row in counts]
+        )
+
+def downgrade():
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_column("save_count")
@@ -0,0 +1,58 @@
+"""search index backfill
+
+Creates the contentless article_fts table and indexes the existing
+articles, so search works right after upgrading a database that predates
+it. SQLite only.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+import zlib
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+FTS_TABLE = "article_fts"
+BATCH_SIZE = 100
+
+def _iter_articles(bind):
+    # Bu revizyondaki gövde biçimi: satır içi ya da article_bodies'te zlib
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT a.id, a.title, a.content, b.codec, b.data FROM articles a "
+                "LEFT JOIN article_bodies b ON b.article_id = a.id "
+                "WHERE a.id > :last_id ORDER BY a.id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            return
+        for row in rows:
+            content = zlib.decompress(row.data).decode("utf-8") if row.codec == "zlib" else row.content
+            yield row.id, row.title, content
+        last_id = rows[-1].id
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    # Elle çalıştırılmış eski bir rebuild'in kalıntısı (içerik kopyalı tablo) yeniden oluşturulur
+    op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    op.execute(
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} "
+        "USING fts5(title, content, content = '', tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    insert = sa.text(f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:id, :title, :content)")
+    for article_id, title, content in _iter_articles(bind):
+        bind.execute(insert, {"id": article_id, "title": title, "content": content})
+
+def downgrade():
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
@@ -0,0 +1,137 @@
+"""per-article chat chunks
+
+Creates article_chunks, which stores each chunk as offsets into the article
+body, and article_chunk_terms, which stores per-article term postings for
+bm25. Both are keyed by article_id first, so chat context is read per
+article. Existing articles are indexed.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from alembic import op
+import sqlalchemy as sa
+from config import settings
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 100
+CHARS_PER_TOKEN = 4
+_WORD = re.compile(r"\w+")
+_TOKEN = re.compile(r"\S+")
+
+# Aşağıdakiler bu revizyondaki app.db.chunk_index mantığının sabit kopyasıdır;
+# uygulama kodu değişse de bu migration aynı satırları üretir.
+
+def _iter_articles(bind):
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT a.id, a.content, b.codec, b.data FROM articles a "
+                "LEFT JOIN article_bodies b ON b.article_id = a.id "
+                "WHERE a.id > :last_id ORDER BY a.id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            return
+        for row in rows:
+            content = zlib.decompress(row.data).decode("utf-8") if row.codec == "zlib" else row.content
+            yield row.id, content or ""
+        last_id = rows[-1].id
+
+def _chunk_spans(content: str, max_chars: int):
+    spans = []
+    start = end = None
+    for match in _TOKEN.finditer(content):
+        if start is not None:
+            if match.end() - start > max_chars or (
+                end - start > max_chars // 2 and "\n" in content[end:match.start()]
+            ):
+                spans.append((start, end))
+                start = None
+        if start is None:
+            start = match.start()
+        end = match.end()
+    if start is not None:
+        spans.append((start, end))
+    return spans
+
+def _terms(value: str):
+    value = unicodedata.normalize("NFKD", value.lower())
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return _WORD.findall(value)
+
+def _encode_postings(postings) -> bytes:
+    out = bytearray()
+    previous = 0
+    for position, count in postings:
+        for value in (position - previous, count):
+            while value > 0x7F:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = position
+    return bytes(out)
+
+def _fill(bind):
+    max_chars = settings.CHAT_CHUNK_TOKENS * CHARS_PER_TOKEN
+    insert_chunk = sa.text(
+        "INSERT INTO article_chunks (article_id, position, start_offset, end_offset, term_count) "
+        "VALUES (:article_id, :position, :start_offset, :end_offset, :term_count)"
+    )
+    insert_term = sa.text(
+        "INSERT INTO article_chunk_terms (article_id, term, postings) VALUES (:article_id, :term, :postings)"
+    )
+    for article_id, content in _iter_articles(bind):
+        # Token bütçesine sığan makaleler bütün gönderilir, indekslenmez
+        if len(content) // CHARS_PER_TOKEN + 1 <= settings.GPT_CONTEXT_TOKEN_BUDGET:
+            continue
+        chunk_rows, postings = [], {}
+        for position, (start, end) in enumerate(_chunk_spans(content, max_chars)):
+            counts = Counter(_terms(content[start:end]))
+            chunk_rows.append({
+                "article_id": article_id,
+                "position": position,
+                "start_offset": start,
+                "end_offset": end,
+                "term_count": sum(counts.values())
+            })
+            for term, count in counts.items():
+                postings.setdefault(term, []).append((position, count))
+        if not chunk_rows:
+            continue
+        bind.execute(insert_chunk, chunk_rows)
+        bind.execute(insert_term, [
+            {"article_id": article_id, "term": term, "postings": _encode_postings(items)}
+            for term, items in postings.items()
+        ])
+
+def upgrade():
+    op.create_table(
+        "article_chunks",
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id"), primary_key=True),
+        sa.Column("position", sa.Integer(), primary_key=True),
+        sa.Column("start_offset", sa.Integer(), nullable=False),
+        sa.Column("end_offset", sa.Integer(), nullable=False),
+        sa.Column("term_count", sa.Integer(), nullable=False)
+    )
+    op.create_table(
+        "article_chunk_terms",
+        sa.Column("article_id", sa.Integer(), sa.ForeignKey("articles.id"), primary_key=True),
+        sa.Column("term", sa.String(), primary_key=True),
+        sa.Column("postings", sa.LargeBinary(), nullable=False)
+    )
+    _fill(op.get_bind())
+
+def downgrade():
+    op.drop_table("article_chunk_terms")
+    op.drop_table("article_chunks")
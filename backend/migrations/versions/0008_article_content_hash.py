@@ -0,0 +1,61 @@
+"""article content hash
+
+Adds articles.content_hash (sha1 of title and content, written together
+with the other article metadata) and fills it for the existing rows. The
+PDF and GPT caches use it as the article version instead of hashing the
+body on every request.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+import hashlib
+import zlib
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 100
+
+def _body(row) -> str:
+    # Bu revizyondaki gövde biçimi: satır içi ya da article_bodies'te zlib
+    if row.codec == "zlib":
+        return zlib.decompress(row.data).decode("utf-8")
+    return row.content or ""
+
+def _content_hash(title: str, content: str) -> str:
+    digest = hashlib.sha1()
+    digest.update((title or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((content or "").encode("utf-8"))
+    return digest.hexdigest()
+
+def upgrade():
+    with op.batch_alter_table("articles") as batch:
+        batch.add_column(sa.Column("content_hash", sa.String(40), nullable=True))
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT a.id, a.title, a.content, b.codec, b.data FROM articles a "
+                "LEFT JOIN article_bodies b ON b.article_id = a.id "
+                "WHERE a.id > :last_id ORDER BY a.id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            return
+        bind.execute(
+            sa.text("UPDATE articles SET content_hash = :content_hash WHERE id = :id"),
+            [{"id": row.id, "content_hash": _content_hash(row.title, _body(row))} for row in rows]
+        )
+        last_id = rows[-1].id
+
+def downgrade():
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_column("content_hash")
@@ -0,0 +1,24 @@
+"""blob outbox dead letter
+
+Adds blob_outbox.dead_at. Entries that fail BLOB_OUTBOX_MAX_ATTEMPTS times
+get it set and are no longer picked up by the worker.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    with op.batch_alter_table("blob_outbox") as batch:
+        batch.add_column(sa.Column("dead_at", sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    with op.batch_alter_table("blob_outbox") as batch:
+        batch.drop_column("dead_at")
@@ -0,0 +1,114 @@
+# tests/conftest.py
+# Ayarlar config import edilirken okunur; uygulama modüllerinden önce veritabanı ve
+# dizinler geçici bir klasöre yönlendirilir. Tüm oturum tek veritabanını paylaşır,
+# testler birbirine karışmasın diye benzersiz kullanıcı/makale verisi üretir.
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+TMP_DIR = tempfile.mkdtemp(prefix="blog-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP_DIR, 'test.db')}"
+os.environ["BLOB_STORAGE_BACKEND"] = "local"
+for name, folder in (
+    ("LOCAL_BLOB_STORAGE_DIR", "blob_storage"),
+    ("BLOB_CACHE_DIR", "blob_cache"),
+    ("PDF_CACHE_DIR", "pdf_cache"),
+    ("UPLOAD_SPOOL_DIR", "upload_spool"),
+):
+    os.environ[name] = os.path.join(TMP_DIR, folder)
+for name in ("READ_REPLICA_DATABASE_URL", "ASYNC_DATABASE_URL", "GPT_CACHE_PATH"):
+    os.environ.pop(name, None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session")
+def engine():
+    from app.db.database import engine
+    from app.db.schema import init_database
+
+    init_database(engine)
+    return engine
+
+@pytest.fixture
+def db(engine):
+    from app.db.database import SessionLocal
+
+    with SessionLocal() as session:
+        yield session
+
+@pytest.fixture
+def client(engine):
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def run_async(engine):
+    """Run ``scenario(session)`` on a fresh event loop with its own AsyncSession.
+
+    The app's async engine pools aiosqlite connections bound to the
+    TestClient's loop, so each call gets a short-lived engine of its own.
+    """
+    import asyncio
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.db.database import ASYNC_URL
+
+    def run(scenario):
+        async def main():
+            async_engine = create_async_engine(ASYNC_URL)
+            try:
+                sessions = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+                async with sessions() as session:
+                    return await scenario(session)
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(main())
+    return run
+
+def unique(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+@pytest.fixture
+def make_user(db):
+    from app.db.repositories.user_repository import create_user
+    from app.schemas.user import UserCreate
+
+    def make(password: str = "secret"):
+        username = unique("user")
+        return create_user(db, UserCreate(username=username, email=f"{username}@example.com", password=password))
+    return make
+
+@pytest.fixture
+def category(db):
+    from app.db.repositories.category_repository import create_category
+    from app.schemas.category import CategoryCreate
+
+    return create_category(db, CategoryCreate(name=unique("category"), description="test"))
+
+@pytest.fixture
+def make_article(db, category):
+    from app.db.repositories.article_repository import create_article
+    from app.schemas.article import ArticleCreate
+
+    def make(user, title: str = None, content: str = "body", category_id: int = None):
+        data = ArticleCreate(title=title or unique("title"), content=content, category_id=category_id or category.id)
+        return create_article(db, data, user.id)
+    return make
+
+@pytest.fixture
+def register(client):
+    """Register a user through the API; returns ``(user json, auth headers)``."""
+    def make(password: str = "secret"):
+        username = unique("user")
+        user = client.post(
+            "/users/register",
+            json={"username": username, "email": f"{username}@example.com", "password": password}
+        ).json()
+        token = client.post("/users/login", json={"username": username, "password": password}).json()["access_token"]
+        return user, {"Authorization": f"Bearer {token}"}
+    return make
@@ -0,0 +1,40 @@
+from sqlalchemy import text
+
+from app.db.article_body import compress, decompress, read_text_prefix
+from app.db.database import SessionLocal
+from app.db.models import Article, ArticleBody
+from app.db.repositories.article_repository import update_article
+from app.schemas.article import ArticleUpdate
+from config import settings
+
+def large_text() -> str:
+    paragraph = "Çok uzun bir makale gövdesi: ışık, gölge ve ünlü şiirler. "
+    return paragraph * (settings.ARTICLE_BODY_COMPRESS_THRESHOLD // len(paragraph) + 10)
+
+def test_compress_round_trip():
+    content = large_text()
+    codec, data = compress(content)
+    assert len(data) < len(content.encode("utf-8"))
+    assert decompress(codec, data) == content
+    assert read_text_prefix(codec, data, 100) == content[:100]
+
+def test_large_body_is_stored_compressed_and_read_back(db, make_user, make_article):
+    content = large_text()
+    article = make_article(make_user(), content=content)
+
+    inline = db.execute(text("SELECT content, content_length FROM articles WHERE id = :id"), {"id": article.id}).one()
+    assert inline.content == ""
+    assert inline.content_length == len(content)
+    with SessionLocal() as other:
+        assert other.get(Article, article.id).content == content
+        assert other.get(ArticleBody, article.id).length == len(content)
+
+def test_shrinking_body_moves_it_back_inline(db, make_user, make_article):
+    user = make_user()
+    article = make_article(user, content=large_text())
+
+    update_article(db, article.id, ArticleUpdate(title=None, content="short now", category_id=None), user.id)
+
+    with SessionLocal() as other:
+        assert other.get(ArticleBody, article.id) is None
+        assert other.get(Article, article.id).content == "short now"
@@ -0,0 +1,45 @@
+from app.db.models import BlobOutbox, Category
+from app.db.repositories import async_article_repository
+from app.db.search import search_articles
+
+from conftest import unique
+
+def test_created_article_is_indexed_counted_and_queued(db, make_user, category, run_async):
+    user = make_user()
+    term = unique("asenkron").replace("-", "")
+
+    async def scenario(session):
+        article = await async_article_repository.create_article_from_content(
+            session, title="Async makale", category_id=category.id,
+            content=f"Dosyadan gelen {term} gövdesi", file_name="kaynak.txt", user_id=user.id
+        )
+        loaded = await async_article_repository.get_article(session, article.id)
+        # İlişkiler önceden yüklenmiş olmalı (async oturumda lazy-load hata verir)
+        return article.id, article.blob_filename, loaded.category.name, loaded.author.username
+
+    article_id, blob_filename, category_name, author = run_async(scenario)
+
+    assert (category_name, author) == (category.name, user.username)
+    assert [row["id"] for row in search_articles(db, term, limit=10)] == [article_id]
+    db.expire_all()
+    assert db.get(Category, category.id).article_count == 1
+    entry = db.query(BlobOutbox).filter(BlobOutbox.blob_filename == blob_filename).one()
+    assert (entry.operation, entry.article_id, entry.original_filename) == ("upload", article_id, "kaynak.txt")
+
+def test_export_iterates_own_articles_in_batches(make_user, make_article, run_async):
+    user, other = make_user(), make_user()
+    own = [make_article(user).id for _ in range(5)]
+    foreign = make_article(other).id
+
+    async def scenario(session):
+        everything = [a.id async for a in async_article_repository.iter_articles_for_export(session, user.id, batch_size=2)]
+        limited = [a.id async for a in async_article_repository.iter_articles_for_export(session, user.id, limit=3, batch_size=2)]
+        picked = [a.id async for a in async_article_repository.iter_articles_for_export(session, user.id, [own[1], foreign])]
+        exists = await async_article_repository.has_articles_for_export(session, user.id, [foreign])
+        return everything, limited, picked, exists
+
+    everything, limited, picked, exists = run_async(scenario)
+    assert everything == own
+    assert limited == own[:3]
+    assert picked == [own[1]]
+    assert not exists
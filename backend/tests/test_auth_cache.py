@@ -0,0 +1,64 @@
+import time
+
+from app.auth.user_cache import AuthUserCache, UserSnapshot, auth_user_cache
+
+def _token(headers) -> str:
+    return headers["Authorization"].split(" ", 1)[1]
+
+def _snapshot(user_id: int) -> UserSnapshot:
+    return UserSnapshot(user_id, f"user{user_id}", f"user{user_id}@example.com", None, None, None, None)
+
+def test_authenticated_user_is_cached_per_token(client, register):
+    user, headers = register()
+    assert client.get("/users/me", headers=headers).status_code == 200
+    cached = auth_user_cache.get(_token(headers))
+    assert cached is not None and cached.id == user["id"]
+
+def test_profile_update_is_visible_immediately(client, register):
+    _, headers = register()
+    client.get("/users/me", headers=headers)
+
+    response = client.put("/users/me", json={"first_name": "Ayşe", "last_name": "Yılmaz"}, headers=headers)
+    assert response.status_code == 200
+    assert auth_user_cache.get(_token(headers)) is None
+
+    me = client.get("/users/me", headers=headers).json()
+    assert (me["first_name"], me["last_name"]) == ("Ayşe", "Yılmaz")
+
+def test_password_change_drops_the_users_cached_tokens(client, register):
+    _, headers = register(password="eski-sifre")
+    client.get("/users/me", headers=headers)
+    assert auth_user_cache.get(_token(headers)) is not None
+
+    response = client.put(
+        "/users/password",
+        json={"current_password": "eski-sifre", "new_password": "yeni-sifre"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert auth_user_cache.get(_token(headers)) is None
+
+def test_wrong_current_password_is_rejected(client, register):
+    _, headers = register(password="dogru")
+    response = client.put(
+        "/users/password",
+        json={"current_password": "yanlis", "new_password": "yeni"},
+        headers=headers
+    )
+    assert response.status_code == 400
+
+def test_entries_expire_with_the_token_and_are_bounded():
+    cache = AuthUserCache(max_entries=2, ttl=60)
+    cache.set("expired", _snapshot(1), token_exp=time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.set("a", _snapshot(1))
+    cache.set("b", _snapshot(2))
+    cache.get("a")
+    cache.set("c", _snapshot(3))
+    assert cache.get("b") is None
+    assert cache.get("a").id == 1 and cache.get("c").id == 3
+
+    cache.invalidate_user(1)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
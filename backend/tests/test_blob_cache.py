@@ -0,0 +1,93 @@
+import hashlib
+
+from app.services.blob_cache import CachedBlobStorage
+from app.services.blob_storage import BlobStorageBackend
+
+class FakeRemote(BlobStorageBackend):
+    """In-memory backend with content ETags; records every remote read."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.reads = []
+
+    def write_blob(self, full_path, data: bytes):
+        self.blobs[full_path] = data
+
+    def read_blob(self, full_path) -> bytes:
+        return self.read_blob_conditional(full_path)[0]
+
+    def read_blob_conditional(self, full_path, etag=None):
+        data = self.blobs[full_path]
+        current = hashlib.md5(data).hexdigest()
+        self.reads.append((full_path, "304" if etag == current else "200"))
+        return (None, current) if etag == current else (data, current)
+
+    def delete_blob(self, full_path):
+        del self.blobs[full_path]
+
+def _cache(tmp_path, remote, fresh_seconds=60, memory_bytes=1000, disk_bytes=1000):
+    return CachedBlobStorage(remote, str(tmp_path), memory_bytes=memory_bytes,
+                             disk_bytes=disk_bytes, fresh_seconds=fresh_seconds)
+
+def test_fresh_entries_skip_the_remote(tmp_path):
+    remote = FakeRemote()
+    remote.blobs["u/a.json"] = b"payload"
+    cache = _cache(tmp_path, remote)
+
+    assert cache.read_blob("u/a.json") == b"payload"
+    assert cache.read_blob("u/a.json") == b"payload"
+    assert remote.reads == [("u/a.json", "200")]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_stale_entries_are_revalidated_with_the_etag(tmp_path):
+    remote = FakeRemote()
+    remote.blobs["u/a.json"] = b"v1"
+    cache = _cache(tmp_path, remote, fresh_seconds=0)
+
+    cache.read_blob("u/a.json")
+    assert cache.read_blob("u/a.json") == b"v1"
+    assert remote.reads[-1] == ("u/a.json", "304")
+
+    # Başka bir süreç blobu değiştirdi
+    remote.blobs["u/a.json"] = b"v2"
+    assert cache.read_blob("u/a.json") == b"v2"
+    assert remote.reads[-1] == ("u/a.json", "200")
+
+def test_writes_and_deletes_invalidate(tmp_path):
+    remote = FakeRemote()
+    cache = _cache(tmp_path, remote)
+    cache.write_blob("u/a.json", b"v1")
+    cache.read_blob("u/a.json")
+
+    cache.write_blob("u/a.json", b"v2")
+    assert cache.read_blob("u/a.json") == b"v2"
+
+    cache.delete_blob("u/a.json")
+    assert cache.stats()["memory_entries"] == 0
+    assert not any(path.suffix == ".blob" for path in tmp_path.iterdir())
+
+def test_disk_copy_survives_a_restart_and_is_revalidated(tmp_path):
+    remote = FakeRemote()
+    remote.blobs["u/a.json"] = b"payload"
+    _cache(tmp_path, remote).read_blob("u/a.json")
+
+    restarted = _cache(tmp_path, remote)
+    assert restarted.read_blob("u/a.json") == b"payload"
+    assert remote.reads == [("u/a.json", "200"), ("u/a.json", "304")]
+
+def test_memory_and_disk_are_byte_bounded(tmp_path):
+    remote = FakeRemote()
+    for name in "abc":
+        remote.blobs[name] = name.encode() * 40
+    cache = _cache(tmp_path, remote, memory_bytes=100, disk_bytes=100)
+
+    for name in "abc":
+        cache.read_blob(name)
+    assert cache.stats()["memory_bytes"] <= 100 and cache.stats()["memory_entries"] == 2
+    disk_bytes = sum(path.stat().st_size for path in tmp_path.iterdir() if path.suffix == ".blob")
+    assert disk_bytes <= 100
+
+def test_stats_endpoint_requires_authentication(client, register):
+    assert client.get("/articles/blob-cache/stats").status_code == 401
+    _, headers = register()
+    assert client.get("/articles/blob-cache/stats", headers=headers).status_code == 200
@@ -0,0 +1,81 @@
+import pytest
+
+from app.db.models import BlobOutbox
+from app.db.repositories import blob_outbox_repository
+from app.services import blob_outbox as blob_outbox_module
+from app.services.blob_outbox import BlobOutboxWorker
+
+from conftest import unique
+
+@pytest.fixture
+def worker():
+    # start() çağrılmaz: işler test içinde senkron işlenir
+    return BlobOutboxWorker(workers=1, poll_interval=1, lease_seconds=60,
+                            backoff_base=0, backoff_max=0, max_attempts=2)
+
+def _enqueue_delete(db, user):
+    blob_filename = unique("blob") + ".json"
+    blob_outbox_repository.enqueue_blob_delete(db, blob_filename, user.id)
+    db.commit()
+    return db.query(BlobOutbox).filter(BlobOutbox.blob_filename == blob_filename).one()
+
+def _entry(db, entry_id):
+    db.expire_all()
+    return db.get(BlobOutbox, entry_id)
+
+def test_pending_writes_of_one_blob_coalesce(db, make_user):
+    user = make_user()
+    blob_filename = unique("blob") + ".json"
+    blob_outbox_repository.enqueue_blob_upload(db, blob_filename, None, user.id, "a.txt")
+    blob_outbox_repository.enqueue_blob_delete(db, blob_filename, user.id)
+    db.commit()
+
+    entries = db.query(BlobOutbox).filter(BlobOutbox.blob_filename == blob_filename).all()
+    assert len(entries) == 1
+    assert entries[0].operation == "delete" and entries[0].version == 2
+
+def test_successful_entry_is_removed(db, make_user, worker):
+    entry = _enqueue_delete(db, make_user())
+    # yerel depoda böyle bir blob yok: silme başarılı sayılır
+    worker._process(entry.id, entry.version)
+    assert _entry(db, entry.id) is None
+    assert worker.completed == 1
+
+def test_failures_retry_then_dead_letter(db, make_user, worker, monkeypatch):
+    def broken_storage():
+        raise RuntimeError("blob store down")
+
+    monkeypatch.setattr(blob_outbox_module, "get_blob_storage", broken_storage)
+    entry = _enqueue_delete(db, make_user())
+
+    worker._process(entry.id, entry.version)
+    entry = _entry(db, entry.id)
+    assert entry.attempts == 1 and entry.dead_at is None
+    assert entry.last_error == "blob store down"
+
+    worker._process(entry.id, entry.version)
+    entry = _entry(db, entry.id)
+    assert entry.attempts == 2 and entry.dead_at is not None
+    assert (entry.id, entry.version) not in blob_outbox_repository.get_due_entries(db, limit=10_000)
+    assert blob_outbox_repository.get_outbox_stats(db)["dead"] >= 1
+
+    assert blob_outbox_repository.requeue_dead_entries(db) >= 1
+    entry = _entry(db, entry.id)
+    assert entry.attempts == 0 and entry.dead_at is None
+
+    monkeypatch.undo()
+    worker._process(entry.id, entry.version)
+    assert _entry(db, entry.id) is None
+
+def test_new_write_revives_a_dead_entry(db, make_user, worker, monkeypatch):
+    monkeypatch.setattr(blob_outbox_module, "get_blob_storage", lambda: 1 / 0)
+    user = make_user()
+    entry = _enqueue_delete(db, user)
+    for _ in range(2):
+        worker._process(entry.id, entry.version)
+    assert _entry(db, entry.id).dead_at is not None
+
+    blob_outbox_repository.enqueue_blob_delete(db, entry.blob_filename, user.id)
+    db.commit()
+    entry = _entry(db, entry.id)
+    assert entry.dead_at is None and entry.attempts == 0 and entry.version == 2
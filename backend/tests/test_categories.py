@@ -0,0 +1,43 @@
+from app.db.models import Category
+from app.db.repositories.article_repository import delete_article, update_article
+from app.db.repositories.category_repository import create_category
+from app.schemas.article import ArticleUpdate
+from app.schemas.category import CategoryCreate
+
+from conftest import unique
+
+def _count(db, category_id) -> int:
+    db.expire_all()
+    return db.get(Category, category_id).article_count
+
+def test_article_count_follows_creates_moves_and_deletes(db, make_user, make_article, category):
+    user = make_user()
+    other = create_category(db, CategoryCreate(name=unique("category"), description="test"))
+    first = make_article(user)
+    make_article(user)
+    assert _count(db, category.id) == 2
+
+    update_article(db, first.id, ArticleUpdate(title=None, content=None, category_id=other.id), user.id)
+    assert (_count(db, category.id), _count(db, other.id)) == (1, 1)
+
+    assert delete_article(db, first.id, user.id)
+    assert (_count(db, category.id), _count(db, other.id)) == (1, 0)
+
+def test_category_list_is_conditional_and_invalidated_by_writes(client, make_user, make_article, category):
+    response = client.get("/categories/")
+    etag = response.headers["etag"]
+    listed = {item["id"]: item["article_count"] for item in response.json()}
+    assert listed[category.id] == 0
+
+    assert client.get("/categories/", headers={"If-None-Match": etag}).status_code == 304
+
+    make_article(make_user())
+    response = client.get("/categories/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert {item["id"]: item["article_count"] for item in response.json()}[category.id] == 1
+
+def test_cache_stats_require_authentication(client, register):
+    assert client.get("/categories/cache/stats").status_code == 401
+    _, headers = register()
+    assert client.get("/categories/cache/stats", headers=headers).status_code == 200
@@ -0,0 +1,64 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.db.chunk_index import (
+    CHARS_PER_TOKEN, chunk_spans, decode_postings, encode_postings, load_chat_context, select_context
+)
+from app.db.repositories.article_repository import delete_article
+from config import settings
+
+def long_text(marker: str) -> str:
+    filler = [f"Paragraf {i}: sıradan dolgu metni, konu dışı cümleler ve tekrarlar." for i in range(600)]
+    filler[450] = f"Zürafa {marker} Ankara'da yaşıyor."
+    return "\n\n".join(filler)
+
+def chunk_count(db, article_id):
+    return db.execute(text("SELECT count(*) FROM article_chunks WHERE article_id = :id"), {"id": article_id}).scalar()
+
+def test_postings_round_trip():
+    postings = [(0, 1), (3, 200), (4, 1), (70000, 3)]
+    assert list(decode_postings(encode_postings(postings))) == postings
+
+def test_chunk_spans_are_word_aligned_offsets():
+    content = long_text("x")
+    max_chars = settings.CHAT_CHUNK_TOKENS * CHARS_PER_TOKEN
+    spans = chunk_spans(content)
+    assert spans[0][0] == 0 and spans[-1][1] == len(content)
+    for (start, end), (next_start, _) in zip(spans, spans[1:]):
+        assert end - start <= max_chars
+        assert content[end:next_start].strip() == ""
+
+def test_short_article_is_sent_whole_and_not_indexed(db, make_user, make_article):
+    article = make_article(make_user(), content="Kısa bir makale.")
+    assert chunk_count(db, article.id) == 0
+    assert select_context(db, article, "ne diyor") == "Kısa bir makale."
+
+def test_long_article_sends_the_matching_chunk(db, make_user, make_article):
+    article = make_article(make_user(), content=long_text("benekli"))
+    assert chunk_count(db, article.id) > 1
+
+    context = select_context(db, article, "zürafa nerede yaşıyor", top_k=1)
+    assert "benekli" in context
+    assert len(context) <= settings.CHAT_CHUNK_TOKENS * CHARS_PER_TOKEN
+    # Son kelime önek olarak da eşleşir
+    assert "benekli" in select_context(db, article, "benek", top_k=1)
+
+def test_no_match_falls_back_to_the_opening(db, make_user, make_article):
+    article = make_article(make_user(), content=long_text("benekli"))
+    context = select_context(db, article, "özetle")
+    assert context.startswith("Paragraf 0:")
+    assert len(context) // CHARS_PER_TOKEN <= settings.GPT_CONTEXT_TOKEN_BUDGET
+
+def test_context_can_be_built_off_the_event_loop(db, make_user, make_article):
+    article = make_article(make_user(), content=long_text("benekli"))
+    context = asyncio.run(asyncio.to_thread(load_chat_context, article, "zürafa"))
+    assert "benekli" in context
+
+def test_delete_removes_chunk_rows(db, make_user, make_article):
+    user = make_user()
+    article = make_article(user, content=long_text("benekli"))
+    assert delete_article(db, article.id, user.id)
+    assert chunk_count(db, article.id) == 0
+    terms = db.execute(text("SELECT count(*) FROM article_chunk_terms WHERE article_id = :id"), {"id": article.id})
+    assert terms.scalar() == 0
@@ -0,0 +1,59 @@
+import asyncio
+import io
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import export_service
+
+@pytest.fixture
+def fake_render(monkeypatch):
+    # Gerçek PDF yerine gövde döner; aynı anda kaç render açık olduğu izlenir
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def fake_article_pdf(article):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01 * (article.id % 3))
+        state["in_flight"] -= 1
+        return article, article.content.encode()
+
+    monkeypatch.setattr(export_service, "_article_pdf", fake_article_pdf)
+    return state
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+def test_zip_stream_keeps_renders_bounded(fake_render):
+    read = []
+
+    async def articles():
+        for article_id in range(1, 11):
+            # bir sonraki makale ancak bir render bitince okunur
+            read.append(fake_render["in_flight"])
+            yield SimpleNamespace(id=article_id, title=f"Makale {article_id}", content=f"gövde {article_id}")
+
+    data = asyncio.run(_collect(export_service.stream_articles_zip(articles(), workers=3)))
+
+    assert fake_render["max_in_flight"] == 3
+    assert max(read) <= 2
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        names = archive.namelist()
+        assert sorted(names, key=lambda name: int(name.split("_")[0])) == [
+            f"{article_id}_Makale_{article_id}.pdf" for article_id in range(1, 11)
+        ]
+        assert archive.read("4_Makale_4.pdf") == "gövde 4".encode()
+
+def test_export_only_includes_own_articles(client, fake_render, make_article, register):
+    user, headers = register()
+    _, other_headers = register()
+    article_ids = [make_article(SimpleNamespace(**user), content=f"export {i}").id for i in range(3)]
+
+    response = client.get("/articles/export", params={"ids": article_ids}, headers=headers)
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(int(name.split("_")[0]) for name in archive.namelist()) == article_ids
+
+    response = client.get("/articles/export", params={"ids": article_ids}, headers=other_headers)
+    assert response.status_code == 404
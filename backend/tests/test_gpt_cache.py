@@ -0,0 +1,51 @@
+import pytest
+
+from app.db.repositories.article_repository import update_article
+from app.routes import articles as article_routes
+from app.schemas.article import ArticleUpdate
+from app.services.gpt_cache import GPTResponseCache, article_version
+from app.services.gpt_service import GPTService
+
+@pytest.fixture
+def fake_gpt(monkeypatch):
+    calls = {"gpt": 0, "context": 0}
+
+    async def complete(self, messages):
+        calls["gpt"] += 1
+        return f"answer {calls['gpt']}"
+
+    def load_chat_context(article, question):
+        calls["context"] += 1
+        return article.content
+
+    monkeypatch.setattr(GPTService, "_complete", complete)
+    monkeypatch.setattr(article_routes, "load_chat_context", load_chat_context)
+    return calls
+
+def test_chat_key_normalizes_the_message():
+    version = article_version("hash", "Tech")
+    assert GPTResponseCache.chat_key(1, version, "What is it?") == GPTResponseCache.chat_key(1, version, "  what IS it ")
+    assert article_version("hash", "Tech") != article_version("other", "Tech")
+    assert article_version("hash", "Tech") != article_version("hash", "Art")
+
+def test_cached_answer_skips_context_and_gpt(client, db, make_user, make_article, fake_gpt):
+    article = make_article(make_user(), content="Kediler hakkında kısa bir yazı.")
+
+    first = client.post(f"/articles/{article.id}/chat", json={"message": "Ne anlatıyor?"})
+    again = client.post(f"/articles/{article.id}/chat", json={"message": "ne anlatıyor"})
+    stream = client.post(f"/articles/{article.id}/chat/stream", json={"message": "Ne anlatıyor!"})
+
+    assert first.json() == again.json() == "answer 1"
+    assert 'data: "answer 1"' in stream.text
+    assert fake_gpt == {"gpt": 1, "context": 1}
+
+def test_edit_changes_the_cache_version(client, db, make_user, make_article, fake_gpt):
+    user = make_user()
+    article = make_article(user, content="İlk sürüm.")
+    client.post(f"/articles/{article.id}/chat", json={"message": "özetle"})
+
+    update_article(db, article.id, ArticleUpdate(title=None, content="İkinci sürüm.", category_id=None), user.id)
+    response = client.post(f"/articles/{article.id}/chat", json={"message": "özetle"})
+
+    assert response.json() == "answer 2"
+    assert fake_gpt == {"gpt": 2, "context": 2}
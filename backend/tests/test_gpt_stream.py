@@ -0,0 +1,48 @@
+import pytest
+
+from app.routes import articles as article_routes
+from app.services.gpt_service import GPTService
+
+from conftest import unique
+
+@pytest.fixture
+def fake_stream(monkeypatch):
+    calls = []
+
+    async def stream(self, messages):
+        calls.append(messages)
+        if "patla" in messages[-1]["content"]:
+            yield "yarım"
+            raise RuntimeError("bağlantı koptu")
+        for token in ("Mer", "ha", "ba"):
+            yield token
+
+    monkeypatch.setattr(GPTService, "_stream", stream)
+    monkeypatch.setattr(article_routes, "load_chat_context", lambda article, question: article.content)
+    return calls
+
+def test_tokens_are_sent_as_server_sent_events(client, fake_stream):
+    response = client.post("/articles/generate/stream", json={"text": unique("prompt")})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'data: "Mer"\n\ndata: "ha"\n\ndata: "ba"\n\nevent: done\ndata: [DONE]\n\n'
+
+def test_finished_stream_is_cached_whole(client, fake_stream):
+    prompt = unique("prompt")
+    client.post("/articles/generate/stream", json={"text": prompt})
+    again = client.post("/articles/generate/stream", json={"text": prompt})
+
+    assert again.text == 'data: "Merhaba"\n\nevent: done\ndata: [DONE]\n\n'
+    assert len(fake_stream) == 1
+
+def test_failed_stream_reports_an_error_and_is_not_cached(client, make_user, make_article, fake_stream):
+    article = make_article(make_user(), content="Akış testi.")
+    for _ in range(2):
+        response = client.post(f"/articles/{article.id}/chat/stream", json={"message": "patla"})
+        assert response.text == 'data: "yarım"\n\nevent: error\ndata: "bağlantı koptu"\n\n'
+    assert len(fake_stream) == 2
+
+def test_missing_article_is_a_404_before_streaming(client, fake_stream):
+    assert client.post("/articles/999999999/chat/stream", json={"message": "merhaba"}).status_code == 404
+    assert client.post("/articles/generate/stream", json={}).status_code == 400
+    assert fake_stream == []
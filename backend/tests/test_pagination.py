@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import pytest
+
+from app.db.pagination import decode_cursor, encode_cursor
+from app.db.repositories.article_repository import get_articles_by_user
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 18, 12, 30, 5)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(datetime(2026, 1, 1), 1)[:-3]])
+def test_bad_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_pages_cover_every_article_once(db, make_user, make_article):
+    user = make_user()
+    # Aynı saniyede oluşturulan satırlar id ile ayrışır
+    created = [make_article(user).id for _ in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = get_articles_by_user(db, user.id, limit=2, cursor=cursor)
+        seen += [row.id for row in rows]
+        if cursor is None:
+            break
+    assert seen == sorted(created, reverse=True)
+
+def test_bad_cursor_is_a_400(client, register):
+    _, headers = register()
+    response = client.get("/articles/my-articles", params={"cursor": "garbage"}, headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,56 @@
+import os
+
+from app.db.repositories.article_repository import update_article
+from app.schemas.article import ArticleUpdate
+from app.services.pdf_cache import PDFCache
+
+def test_put_replaces_older_versions(tmp_path):
+    cache = PDFCache(str(tmp_path), max_bytes=10_000)
+    old = cache.put(1, "v1", b"a" * 100)
+    new = cache.put(1, "v2", b"b" * 120)
+
+    assert cache.get(1, "v2") == new
+    assert cache.get(1, "v1") is None and not os.path.exists(old)
+    assert cache._size == 120
+
+def test_directory_is_scanned_only_on_first_put_and_when_full(tmp_path, monkeypatch):
+    cache = PDFCache(str(tmp_path), max_bytes=250)
+    scans = []
+    real_scan = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or real_scan())
+
+    cache.put(1, "v", b"x" * 100)
+    cache.put(2, "v", b"x" * 100)
+    assert len(scans) == 1
+
+    os.utime(cache.path(1, "v"), (1, 1))  # en eski dosya
+    cache.put(3, "v", b"x" * 100)
+    assert len(scans) == 2
+    assert cache.get(1, "v") is None
+    assert cache.get(2, "v") and cache.get(3, "v")
+    assert cache._size == 200
+
+def test_invalidate_keeps_the_size_in_step(tmp_path):
+    cache = PDFCache(str(tmp_path), max_bytes=10_000)
+    cache.put(1, "v", b"x" * 100)
+    cache.put(2, "v", b"x" * 50)
+    cache.invalidate(1)
+    assert cache.get(1, "v") is None
+    assert cache._size == 50
+
+def test_version_is_the_stored_content_hash(db, make_user, make_article):
+    user = make_user()
+    article = make_article(user, content="PDF gövdesi")
+    version = PDFCache.version(article)
+    assert version == article.content_hash[:16]
+
+    update_article(db, article.id, ArticleUpdate(title="Yeni başlık", content=None, category_id=None), user.id)
+    assert PDFCache.version(article) != version
+
+def test_matching_etag_is_a_304_without_rendering(client, make_user, make_article):
+    article = make_article(make_user(), content="PDF gövdesi")
+    etag = PDFCache.etag(article.id, PDFCache.version(article))
+
+    response = client.get(f"/articles/{article.id}/pdf", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import create_engine, select, text, update
+from starlette.requests import Request
+
+from app.db import database
+from app.db.database import RoutingSessionLocal, get_db, use_primary
+from app.db.models import Category
+
+from conftest import unique
+
+@pytest.fixture
+def replica(engine, monkeypatch):
+    # Aynı dosyaya bakan ayrı bir engine, replika yerine geçer
+    replica_engine = create_engine(engine.url.render_as_string(hide_password=False))
+    monkeypatch.setattr(database, "read_engine", replica_engine)
+    yield replica_engine
+    replica_engine.dispose()
+
+def _request(method: str) -> Request:
+    return Request({"type": "http", "method": method, "path": "/", "headers": []})
+
+def test_selects_go_to_the_replica(replica):
+    with RoutingSessionLocal() as db:
+        assert db.get_bind(clause=select(Category.id)) is replica
+        db.execute(select(Category.id)).all()
+        assert not db.info.get("primary")
+
+def test_pending_changes_pin_the_session_to_the_primary(replica):
+    with RoutingSessionLocal() as db:
+        db.add(Category(name=unique("category")))
+        assert db.get_bind(clause=select(Category.id)) is database.engine
+        db.rollback()
+        # Değişiklik geri alınsa da oturum birincilde kalır (kendi yazdığını okur)
+        assert db.get_bind(clause=select(Category.id)) is database.engine
+
+def test_writes_pin_the_session_to_the_primary(replica):
+    with RoutingSessionLocal() as db:
+        db.execute(update(Category).where(Category.id == -1).values(description="x"))
+        assert db.info["primary"]
+        assert db.get_bind(clause=select(Category.id)) is database.engine
+        db.rollback()
+
+def test_use_primary_pins_up_front(replica):
+    with RoutingSessionLocal() as db:
+        use_primary(db)
+        assert db.get_bind(clause=text("SELECT 1")) is database.engine
+
+@pytest.mark.parametrize("method, primary", [("GET", False), ("HEAD", False), ("POST", True), ("DELETE", True)])
+def test_get_db_pins_non_read_requests(replica, method, primary):
+    dependency = get_db(_request(method))
+    db = next(dependency)
+    try:
+        assert isinstance(db, database.RoutingSession)
+        assert bool(db.info.get("primary")) is primary
+    finally:
+        dependency.close()
+
+def test_get_db_uses_a_plain_session_without_a_replica():
+    dependency = get_db(_request("GET"))
+    db = next(dependency)
+    try:
+        assert not isinstance(db, database.RoutingSession)
+        assert db.get_bind() is database.engine
+    finally:
+        dependency.close()
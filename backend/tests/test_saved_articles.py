@@ -0,0 +1,48 @@
+from app.db.models import Article, SavedArticle
+from app.db.repositories.saved_article_repository import SavedArticleRepository
+
+def _save_count(db, article_id) -> int:
+    db.expire_all()
+    return db.get(Article, article_id).save_count
+
+def test_saving_twice_keeps_one_row_and_one_count(db, make_user, make_article):
+    reader = make_user()
+    article = make_article(make_user())
+    updated_at = article.updated_at
+    repo = SavedArticleRepository(db)
+
+    first = repo.save_article(reader.id, article.id)
+    second = repo.save_article(reader.id, article.id)
+    assert first.id == second.id
+    assert db.query(SavedArticle).filter(SavedArticle.article_id == article.id).count() == 1
+    assert _save_count(db, article.id) == 1
+    # Sayaç değişimi makaleyi düzenlenmiş saymaz
+    assert db.get(Article, article.id).updated_at == updated_at
+
+    assert repo.unsave_article(reader.id, article.id)
+    assert not repo.unsave_article(reader.id, article.id)
+    assert _save_count(db, article.id) == 0
+
+def test_save_routes_and_batch_status(client, db, register, make_user, make_article):
+    user, headers = register()
+    author = make_user()
+    saved, other = make_article(author), make_article(author)
+
+    for _ in range(2):
+        assert client.post(f"/saved-articles/{saved.id}", headers=headers).status_code == 200
+    assert _save_count(db, saved.id) == 1
+
+    response = client.get("/saved-articles/status", params={"ids": [other.id, saved.id, saved.id]}, headers=headers)
+    assert response.json() == {"saved_ids": [saved.id]}
+    assert client.get(f"/saved-articles/{saved.id}/is-saved", headers=headers).json() == {"is_saved": True}
+
+    assert client.delete(f"/saved-articles/{saved.id}", headers=headers).status_code == 200
+    assert client.delete(f"/saved-articles/{saved.id}", headers=headers).status_code == 404
+    assert _save_count(db, saved.id) == 0
+    # Önbellekteki kayıt durumu da güncellenmiş olmalı
+    assert SavedArticleRepository(db).get_saved_ids(user["id"]) == frozenset()
+
+def test_trending_stats_require_authentication(client, register):
+    assert client.get("/articles/trending/stats").status_code == 401
+    _, headers = register()
+    assert client.get("/articles/trending/stats", headers=headers).status_code == 200
@@ -0,0 +1,51 @@
+import time
+
+from app.db.repositories.saved_article_repository import SavedArticleRepository
+from app.services.saved_state_cache import SavedStateCache, saved_state_cache
+
+def test_load_that_raced_a_save_is_not_stored():
+    cache = SavedStateCache(max_users=10, ttl=60)
+    generation = cache.generation(1)
+    cache.add(1, 42)  # yükleme sürerken kayıt eklendi
+    cache.store(1, {7}, generation)
+    assert cache.get(1) is None
+
+    cache.store(1, {7, 42}, cache.generation(1))
+    assert cache.get(1) == frozenset({7, 42})
+
+def test_sets_are_replaced_not_mutated():
+    cache = SavedStateCache(max_users=10, ttl=60)
+    cache.store(1, {7}, cache.generation(1))
+    before = cache.get(1)
+    cache.add(1, 8)
+    cache.discard(1, 7)
+    assert before == frozenset({7})
+    assert cache.get(1) == frozenset({8})
+
+def test_entries_expire_and_are_bounded():
+    cache = SavedStateCache(max_users=2, ttl=60)
+    for user_id in (1, 2, 3):
+        cache.store(user_id, {user_id}, cache.generation(user_id))
+    assert cache.get(1) is None
+    assert cache.stats()["users"] == 2
+
+    expired = SavedStateCache(max_users=10, ttl=0)
+    expired.store(1, {1}, expired.generation(1))
+    time.sleep(0.01)
+    assert expired.get(1) is None
+
+def test_batch_status_keeps_request_order_and_reads_once(db, make_user, make_article, monkeypatch):
+    reader = make_user()
+    author = make_user()
+    articles = [make_article(author) for _ in range(4)]
+    repo = SavedArticleRepository(db)
+    for article in (articles[3], articles[1]):
+        repo.save_article(reader.id, article.id)
+    saved_state_cache.invalidate_user(reader.id)
+
+    ids = [article.id for article in articles] + [articles[3].id]
+    assert repo.get_saved_article_ids(reader.id, ids) == [articles[1].id, articles[3].id]
+
+    # İkinci çağrı önbellekten cevaplanır
+    monkeypatch.setattr(db, "query", None)
+    assert repo.get_saved_article_ids(reader.id, ids) == [articles[1].id, articles[3].id]
@@ -0,0 +1,56 @@
+import uuid
+
+from sqlalchemy import text
+
+from app.db.repositories.article_repository import delete_article, update_article
+from app.db.search import FTS_TABLE, search_articles
+from app.schemas.article import ArticleUpdate
+
+def word() -> str:
+    # Harflerden oluşan, başka testlerle çakışmayan bir terim
+    return "kw" + "".join(chr(ord("a") + int(c, 16) % 26) for c in uuid.uuid4().hex[:10])
+
+def found(db, q):
+    return [row["id"] for row in search_articles(db, q, limit=10)]
+
+def test_index_is_contentless(db, engine):
+    names = {row[0] for row in db.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+    assert FTS_TABLE in names
+    assert f"{FTS_TABLE}_content" not in names
+
+def test_new_article_is_searchable_with_snippet(db, make_user, make_article):
+    term = word()
+    article = make_article(make_user(), content=f"Giriş cümlesi. {term} burada geçiyor.")
+
+    rows = search_articles(db, term, limit=10)
+    assert [row["id"] for row in rows] == [article.id]
+    assert f"<mark>{term}</mark>" in rows[0]["snippet"]
+
+def test_title_and_content_updates_resync_the_index(db, make_user, make_article):
+    user = make_user()
+    old_title, new_title, old_body, new_body = word(), word(), word(), word()
+    article = make_article(user, title=old_title, content=old_body)
+
+    update_article(db, article.id, ArticleUpdate(title=new_title, content=None, category_id=None), user.id)
+    assert found(db, old_title) == []
+    assert found(db, new_title) == [article.id]
+    # Başlık değişince içerik terimleri indeksten düşmemeli
+    assert found(db, old_body) == [article.id]
+
+    update_article(db, article.id, ArticleUpdate(title=None, content=new_body, category_id=None), user.id)
+    assert found(db, old_body) == []
+    assert found(db, new_body) == [article.id]
+
+def test_deleted_article_leaves_the_index(db, make_user, make_article):
+    user = make_user()
+    term = word()
+    article = make_article(user, content=term)
+
+    assert delete_article(db, article.id, user.id)
+    assert found(db, term) == []
+
+def test_diacritics_and_prefix_match(db, make_user, make_article):
+    term = word()
+    article = make_article(make_user(), content=f"{term} köpekbalığı")
+
+    assert found(db, f"{term} kopek") == [article.id]
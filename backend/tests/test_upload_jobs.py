@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.db.models import UploadJob
+from app.db.repositories.article_repository import get_article
+from app.db.repositories.upload_job_repository import create_upload_job, fail_interrupted_jobs
+
+def _upload(client, headers, category, data: bytes):
+    return client.post(
+        "/articles/upload",
+        data={"title": "Yüklenen makale", "category_id": str(category.id)},
+        files={"file": ("makale.txt", data, "text/plain")},
+        headers=headers
+    )
+
+def test_text_upload_completes_in_the_background(client, register, category, db):
+    _, headers = register()
+    response = _upload(client, headers, category, "Dosyadan gelen gövde".encode())
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+
+    # TestClient arka plan görevlerini yanıt döndükten sonra ama istekten çıkmadan çalıştırır
+    job = client.get(f"/articles/upload/{response.json()['id']}", headers=headers).json()
+    assert job["status"] == "completed" and job["error"] is None
+    assert get_article(db, job["article_id"]).content == "Dosyadan gelen gövde"
+
+def test_unreadable_upload_marks_the_job_failed(client, register, category):
+    _, headers = register()
+    response = _upload(client, headers, category, b"\xff\xfe\xfa gecersiz")
+
+    job = client.get(f"/articles/upload/{response.json()['id']}", headers=headers).json()
+    assert job["status"] == "failed"
+    assert job["article_id"] is None and job["error"]
+
+def test_upload_status_is_private(client, register, category):
+    _, headers = register()
+    _, other_headers = register()
+    job_id = _upload(client, headers, category, b"gizli").json()["id"]
+    assert client.get(f"/articles/upload/{job_id}", headers=other_headers).status_code == 404
+
+def test_only_jobs_with_an_expired_lease_are_failed(db, make_user, run_async):
+    user = make_user()
+    stale_time = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    async def scenario(session):
+        stale = await create_upload_job(session, user.id, "eski.txt")
+        fresh = await create_upload_job(session, user.id, "yeni.txt")
+        done = await create_upload_job(session, user.id, "bitti.txt")
+        await session.execute(
+            update(UploadJob).where(UploadJob.id.in_([stale.id, done.id])).values(updated_at=stale_time)
+        )
+        await session.execute(update(UploadJob).where(UploadJob.id == fresh.id).values(status="processing"))
+        await session.execute(update(UploadJob).where(UploadJob.id == done.id).values(status="completed"))
+        await session.commit()
+        await fail_interrupted_jobs(session, lease_seconds=300)
+        return stale.id, fresh.id, done.id
+
+    stale_id, fresh_id, done_id = run_async(scenario)
+    statuses = {job.id: job.status for job in db.query(UploadJob).filter(UploadJob.id.in_([stale_id, fresh_id, done_id]))}
+    assert statuses == {stale_id: "failed", fresh_id: "processing", done_id: "completed"}
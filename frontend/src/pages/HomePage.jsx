@@ -19,10 +19,12 @@ import {
   List,
   ListItem,
   ListItemText,
-  Paper
+  Paper,
+  Tabs,
+  Tab
 } from '@mui/material';
 import { useNavigate } from 'react-router-dom';
-import { getArticlesFeed, saveArticle, unsaveArticle, checkIfArticleSaved, chatWithArticle } from '../services/api';
+import { getArticlesFeed, getTrendingArticles, getSavedStates, saveArticle, unsaveArticle, chatWithArticle } from '../services/api';
 import { formatDate } from '../utils/dateUtils';
 import AccessTimeIcon from '@mui/icons-material/AccessTime';
 import { Bookmark, BookmarkBorder, Send, Chat, Close } from '@mui/icons-material';
@@ -35,17 +37,31 @@ const HomePage = () => {
   const [messages, setMessages] = useState([]);
   const [newMessage, setNewMessage] = useState('');
   const [loading, setLoading] = useState(false);
+  const [tab, setTab] = useState('feed');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchArticles = async () => {
       try {
-        const data = await getArticlesFeed();
-        setArticles(data);
-        // Check saved state for each article
         const savedStatesObj = {};
-        for (const article of data) {
-          const isSaved = await checkIfArticleSaved(article.id);
-          savedStatesObj[article.id] = isSaved;
+        if (tab === 'popular') {
+          // Trending listesi herkes için aynı; kayıt durumları tek istekle alınır
+          const { items: data } = await getTrendingArticles();
+          const savedIds = await getSavedStates(data.map(article => article.id));
+          setArticles(data);
+          setNextCursor(null);
+          for (const article of data) {
+            savedStatesObj[article.id] = savedIds.has(article.id);
+          }
+        } else {
+          const { items: data, next_cursor } = await getArticlesFeed();
+          setArticles(data);
+          setNextCursor(next_cursor);
+          // Feed kayıt durumunu, yazarı ve kategoriyi zaten içeriyor
+          for (const article of data) {
+            savedStatesObj[article.id] = article.is_saved;
+          }
         }
         setSavedStates(savedStatesObj);
       } catch (error) {
@@ -54,7 +70,28 @@ const HomePage = () => {
     };
 
     fetchArticles();
-  }, []);
+  }, [tab]);
+
+  const handleLoadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const { items: data, next_cursor } = await getArticlesFeed(nextCursor);
+      setArticles(prev => [...prev, ...data]);
+      setNextCursor(next_cursor);
+      setSavedStates(prev => {
+        const next = { ...prev };
+        for (const article of data) {
+          next[article.id] = article.is_saved;
+        }
+        return next;
+      });
+    } catch (error) {
+      console.error('Error fetching more articles:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   const formatArticleDate = (dateString) => {
     return formatDate(dateString);
@@ -135,6 +172,11 @@ const HomePage = () => {
         </Typography>
       </Box>
 
+      <Tabs value={tab} onChange={(event, value) => setTab(value)} sx={{ mb: 4 }}>
+        <Tab label="Feed" value="feed" />
+        <Tab label="Popular" value="popular" />
+      </Tabs>
+
       <Grid container spacing={4}>
         {articles.map((article) => (
           <Grid item xs={12} md={6} key={article.id}>
@@ -197,7 +239,7 @@ const HomePage = () => {
                     WebkitBoxOrient: 'vertical',
                   }}
                 >
-                  <ReactMarkdown>{article.content.substring(0, 300) + '...'}</ReactMarkdown>
+                  <ReactMarkdown>{article.excerpt + '...'}</ReactMarkdown>
                 </Typography>
 
                 {article.category && (
@@ -261,6 +303,14 @@ const HomePage = () => {
         ))}
       </Grid>
 
+      {nextCursor && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', mt: 4 }}>
+          <Button variant="outlined" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? <CircularProgress size={24} /> : 'Load More'}
+          </Button>
+        </Box>
+      )}
+
       <Dialog
         open={!!selectedArticle}
         onClose={handleChatClose}
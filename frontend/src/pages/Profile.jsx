@@ -26,7 +26,7 @@ import EditIcon from '@mui/icons-material/Edit';
 import DeleteIcon from '@mui/icons-material/Delete';
 import AddIcon from '@mui/icons-material/Add';
 import { useNavigate } from 'react-router-dom';
-import api, { getMyArticles, deleteArticle } from '../services/api';
+import api, { getMyArticles, deleteArticle, uploadArticleFile } from '../services/api';
 
 const Profile = () => {
   const navigate = useNavigate();
@@ -36,6 +36,8 @@ const Profile = () => {
   const [snackbar, setSnackbar] = useState({ open: false, message: '', severity: 'success' });
   const [uploadDialogOpen, setUploadDialogOpen] = useState(false);
   const [categories, setCategories] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [newArticle, setNewArticle] = useState({
     title: '',
     category_id: '',
@@ -49,8 +51,9 @@ const Profile = () => {
 
   const fetchArticles = async () => {
     try {
-      const data = await getMyArticles();
+      const { items: data, next_cursor } = await getMyArticles();
       setArticles(data);
+      setNextCursor(next_cursor);
     } catch (error) {
       console.error('Articles yüklenirken hata:', error);
       setSnackbar({
@@ -61,6 +64,25 @@ const Profile = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const { items: data, next_cursor } = await getMyArticles(nextCursor);
+      setArticles(prev => [...prev, ...data]);
+      setNextCursor(next_cursor);
+    } catch (error) {
+      console.error('Articles yüklenirken hata:', error);
+      setSnackbar({
+        open: true,
+        message: 'Makaleler yüklenirken bir hata oluştu',
+        severity: 'error'
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const fetchCategories = async () => {
     try {
       const response = await api.get('/categories');
@@ -134,11 +156,7 @@ const Profile = () => {
     formData.append('file', newArticle.file);
 
     try {
-      await api.post('/articles/upload', formData, {
-        headers: {
-          'Content-Type': 'multipart/form-data',
-        },
-      });
+      await uploadArticleFile(formData);
       setUploadDialogOpen(false);
       fetchArticles();
       setNewArticle({ title: '', category_id: '', file: null });
@@ -206,7 +224,7 @@ const Profile = () => {
               </Box>
               
               <Typography variant="body1" color="text.secondary" sx={{ mt: 1 }}>
-                {article.content.substring(0, 300)}...
+                {article.excerpt}...
               </Typography>
 
               <Box sx={{ display: 'flex', gap: 1, mt: 1 }}>
@@ -274,6 +292,14 @@ const Profile = () => {
         ))}
       </Box>
 
+      {nextCursor && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', mt: 3 }}>
+          <Button variant="outlined" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Yükleniyor...' : 'Daha Fazla Yükle'}
+          </Button>
+        </Box>
+      )}
+
       {/* Delete Dialog */}
       <Dialog
         open={deleteDialogOpen}
@@ -21,6 +21,8 @@ import AccessTimeIcon from '@mui/icons-material/AccessTime';
 
 const SavedArticles = () => {
     const [articles, setArticles] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const navigate = useNavigate();
 
     useEffect(() => {
@@ -30,17 +32,32 @@ const SavedArticles = () => {
     const loadSavedArticles = async () => {
         try {
             const data = await getSavedArticles();
-            setArticles(data);
+            setArticles(data.items);
+            setNextCursor(data.next_cursor);
         } catch (error) {
             console.error('Error loading saved articles:', error);
         }
     };
 
+    const handleLoadMore = async () => {
+        if (!nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        try {
+            const data = await getSavedArticles(nextCursor);
+            setArticles(prev => [...prev, ...data.items]);
+            setNextCursor(data.next_cursor);
+        } catch (error) {
+            console.error('Error loading saved articles:', error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleUnsave = async (articleId) => {
         try {
             await unsaveArticle(articleId);
-            // Refresh the list after unsaving
-            loadSavedArticles();
+            // Listeyi baştan yüklemek sonraki sayfaları kaybettirir; sadece çıkarılan makale silinir
+            setArticles(prev => prev.filter(article => article.id !== articleId));
         } catch (error) {
             console.error('Error unsaving article:', error);
         }
@@ -145,7 +162,7 @@ const SavedArticles = () => {
                                         WebkitBoxOrient: 'vertical',
                                     }}
                                 >
-                                    <ReactMarkdown>{article.content.substring(0, 300) + '...'}</ReactMarkdown>
+                                    <ReactMarkdown>{article.excerpt + '...'}</ReactMarkdown>
                                 </Typography>
 
                                 {article.category && (
@@ -193,6 +210,14 @@ const SavedArticles = () => {
                 ))}
             </Grid>
 
+            {nextCursor && (
+                <Box sx={{ display: 'flex', justifyContent: 'center', mt: 4 }}>
+                    <Button variant="outlined" onClick={handleLoadMore} disabled={loadingMore}>
+                        {loadingMore ? 'Loading...' : 'Load More'}
+                    </Button>
+                </Box>
+            )}
+
             {articles.length === 0 && (
                 <Box sx={{ 
                     mt: 4, 
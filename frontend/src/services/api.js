@@ -72,8 +72,15 @@ export const updatePassword = async (passwordData) => {
 };
 
 // Article functions
-export const getArticlesFeed = async () => {
-    const response = await api.get('/articles/feed');
+// Feed ve my-articles sayfalı döner: { items, next_cursor }
+// Feed öğeleri yazar, kategori adı ve is_saved alanlarını da taşır
+export const getArticlesFeed = async (cursor = null, limit = 20) => {
+    const response = await api.get('/articles/feed', { params: { cursor, limit } });
+    return response.data;
+};
+
+export const getTrendingArticles = async (limit = 20) => {
+    const response = await api.get('/articles/trending', { params: { limit } });
     return response.data;
 };
 
@@ -97,11 +104,30 @@ export const deleteArticle = async (id) => {
     return response.data;
 };
 
-export const getMyArticles = async () => {
-    const response = await api.get('/articles/my-articles');
+export const getMyArticles = async (cursor = null, limit = 20) => {
+    const response = await api.get('/articles/my-articles', { params: { cursor, limit } });
     return response.data;
 };
 
+// Dosya yükleme arka planda işlenir; iş tamamlanana kadar durumu sorgula
+export const uploadArticleFile = async (formData, pollInterval = 1000) => {
+    const response = await api.post('/articles/upload', formData, {
+        headers: {
+            'Content-Type': 'multipart/form-data',
+        },
+    });
+    let job = response.data;
+    while (job.status === 'pending' || job.status === 'processing') {
+        await new Promise((resolve) => setTimeout(resolve, pollInterval));
+        const statusResponse = await api.get(`/articles/upload/${job.id}`);
+        job = statusResponse.data;
+    }
+    if (job.status === 'failed') {
+        throw new Error(job.error || 'Upload failed');
+    }
+    return job;
+};
+
 // Saved Articles endpoints
 export const saveArticle = async (articleId) => {
     const response = await api.post(`/saved-articles/${articleId}`);
@@ -113,11 +139,24 @@ export const unsaveArticle = async (articleId) => {
     return response.data;
 };
 
-export const getSavedArticles = async () => {
-    const response = await api.get('/saved-articles');
+// Kaydedilenler de sayfalı döner: { items, next_cursor }
+export const getSavedArticles = async (cursor = null, limit = 20) => {
+    const response = await api.get('/saved-articles', { params: { cursor, limit } });
     return response.data;
 };
 
+// Birden çok makalenin kayıt durumu tek istekte: kaydedilmiş id'lerin kümesi döner
+export const getSavedStates = async (articleIds) => {
+    if (articleIds.length === 0) {
+        return new Set();
+    }
+    const response = await api.get('/saved-articles/status', {
+        params: { ids: articleIds },
+        paramsSerializer: { indexes: null }
+    });
+    return new Set(response.data.saved_ids);
+};
+
 export const checkIfArticleSaved = async (articleId) => {
     const response = await api.get(`/saved-articles/${articleId}/is-saved`);
     return response.data.is_saved;